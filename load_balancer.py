@@ -1,10 +1,14 @@
+import math
 import pygame
-import random
 import time
+from bisect import bisect_right
+from operator import attrgetter
 from enum import Enum
-from collections import deque
+from collections import Counter, deque
 import numpy as np
 
+_by_load_score = attrgetter("load_score")
+
 
 class LoadBalancingAlgorithm(Enum):
     ROUND_ROBIN = "round_robin"
@@ -16,18 +20,52 @@ class LoadBalancingAlgorithm(Enum):
     POWER_OF_TWO = "power_of_two"
 
 
+_ALGORITHMS = tuple(LoadBalancingAlgorithm)
+_ALGORITHM_CODES = {algorithm: code for code, algorithm in enumerate(_ALGORITHMS)}
+
+
+class RequestRecord:
+    """Resource requirements of a request seen by the load balancer"""
+
+    __slots__ = ("timestamp", "cpu_req", "memory_req", "algorithm")
+
+    def __init__(self, timestamp, cpu_req, memory_req, algorithm):
+        self.timestamp = timestamp
+        self.cpu_req = cpu_req
+        self.memory_req = memory_req
+        self.algorithm = algorithm
+
+
+class RoutingDecision:
+    """Outcome of routing a single request"""
+
+    __slots__ = ("timestamp", "algorithm", "method", "server_id", "success")
+
+    def __init__(self, timestamp, algorithm, method, server_id, success):
+        self.timestamp = timestamp
+        self.algorithm = algorithm
+        self.method = method
+        self.server_id = server_id
+        self.success = success
+
+
 class LoadBalancer:
+    REQUEST_HISTORY_SIZE = 100
+    RANDOM_POOL_SIZE = 4096
+
     def __init__(self, x, y, algorithm=LoadBalancingAlgorithm.LEAST_CONNECTIONS):
         self.x = x
         self.y = y
         self.servers = []
         self.algorithm = algorithm
+        self._alg_value = algorithm.value
+        self._alg_code = _ALGORITHM_CODES[algorithm]
         self.color = (255, 100, 100)
         self.size = 200
 
         self.round_robin_index = 0
         self.weighted_round_robin_current = 0
-        self.weighted_servers_list = []
+        self._server_weights = {}
 
         self.total_requests_received = 0
         self.total_requests_routed = 0
@@ -35,9 +73,20 @@ class LoadBalancer:
         self.algorithm_switch_count = 0
         self.last_algorithm_switch = 0
 
-        self.request_history = deque(maxlen=100)
+        # Ring buffer of recent request requirements, one array per field
+        size = self.REQUEST_HISTORY_SIZE
+        self._req_ts = np.zeros(size, dtype=np.float64)
+        self._req_cpu = np.zeros(size, dtype=np.float64)
+        self._req_mem = np.zeros(size, dtype=np.float64)
+        self._req_alg = np.zeros(size, dtype=np.int8)
+        self._req_head = 0
+        self._req_count = 0
+
         self.routing_decisions = deque(maxlen=50)
 
+        # Disable to skip request history and routing decision telemetry
+        self.record_decisions = True
+
         self.health_check_interval = 1.0
         self.last_health_check = time.time()
 
@@ -45,19 +94,83 @@ class LoadBalancer:
         self.performance_window = deque(maxlen=20)
         self.last_performance_eval = time.time()
 
+        self._dispatch = {
+            LoadBalancingAlgorithm.ROUND_ROBIN: self._round_robin_assignment,
+            LoadBalancingAlgorithm.LEAST_CONNECTIONS: self._least_connections_assignment,
+            LoadBalancingAlgorithm.WEIGHTED_ROUND_ROBIN: self._weighted_round_robin_assignment,
+            LoadBalancingAlgorithm.LEAST_RESPONSE_TIME: self._least_response_time_assignment,
+            LoadBalancingAlgorithm.RESOURCE_BASED: self._resource_based_assignment,
+            LoadBalancingAlgorithm.RANDOM: self._random_assignment,
+            LoadBalancingAlgorithm.POWER_OF_TWO: self._power_of_two_assignment,
+        }
+        self._assign_impl = self._dispatch[self.algorithm]
+
+        self._rng = np.random.default_rng()
+        self._random_pool = self._rng.random(self.RANDOM_POOL_SIZE).tolist()
+        self._random_index = 0
+
+        self._font = None
+        self._alg_surface = None
+        self._alg_surface_value = None
+        self._req_surface = None
+        self._req_surface_count = None
+
     def set_servers(self, servers):
         """Set the list of servers and initialize weighted list"""
         self.servers = servers
         self._rebuild_weighted_list()
 
     def _rebuild_weighted_list(self):
-        """Rebuild weighted server list for weighted round robin"""
-        self.weighted_servers_list = []
-        for server in self.servers:
-            if hasattr(server, "weight"):
-                self.weighted_servers_list.extend([server] * server.weight)
-            else:
-                self.weighted_servers_list.append(server)
+        """Rebuild server weights for weighted round robin"""
+        self._server_weights = {
+            server: getattr(server, "weight", 1) for server in self.servers
+        }
+
+    @property
+    def request_history(self):
+        """Recent requests as RequestRecord objects, oldest first"""
+        count = self._req_count
+        order = np.arange(self._req_head - count, self._req_head) % len(self._req_ts)
+        return [
+            RequestRecord(ts, cpu, mem, _ALGORITHMS[code].value)
+            for ts, cpu, mem, code in zip(
+                self._req_ts[order].tolist(),
+                self._req_cpu[order].tolist(),
+                self._req_mem[order].tolist(),
+                self._req_alg[order].tolist(),
+            )
+        ]
+
+    def _record_request(self, timestamp, cpu_requirement, memory_requirement):
+        """Write a request into the history ring buffer"""
+        head = self._req_head
+        self._req_ts[head] = timestamp
+        self._req_cpu[head] = cpu_requirement
+        self._req_mem[head] = memory_requirement
+        self._req_alg[head] = self._alg_code
+        head += 1
+        self._req_head = head if head < self.REQUEST_HISTORY_SIZE else 0
+        if self._req_count < self.REQUEST_HISTORY_SIZE:
+            self._req_count += 1
+
+    def reset_history(self):
+        """Clear request history and routing decisions"""
+        self._req_head = 0
+        self._req_count = 0
+        self.routing_decisions.clear()
+
+    def _random(self):
+        """Next float in [0, 1) from the pre-generated pool"""
+        index = self._random_index
+        if index == self.RANDOM_POOL_SIZE:
+            self._random_pool = self._rng.random(self.RANDOM_POOL_SIZE).tolist()
+            index = 0
+        self._random_index = index + 1
+        return self._random_pool[index]
+
+    def _randrange(self, n):
+        """Random integer in [0, n) drawn from the float pool"""
+        return min(int(self._random() * n), n - 1)
 
     def get_healthy_servers(self):
         """Get list of healthy servers that can accept requests"""
@@ -65,180 +178,149 @@ class LoadBalancer:
 
     def assign_server(self, cpu_requirement=None, memory_requirement=None):
         """Assign server using the current algorithm with optional resource requirements"""
-        self.total_requests_received += 1
-
         if cpu_requirement is None:
-            cpu_requirement = random.uniform(0.2, 1.5)
+            cpu_requirement = 0.2 + 1.3 * self._random()
         if memory_requirement is None:
-            memory_requirement = random.uniform(0.1, 1.0)
+            memory_requirement = 0.1 + 0.9 * self._random()
 
-        request_info = {
-            "timestamp": time.time(),
-            "cpu_req": cpu_requirement,
-            "memory_req": memory_requirement,
-            "algorithm": self.algorithm.value,
-        }
-        self.request_history.append(request_info)
+        return self.assign_server_fast(cpu_requirement, memory_requirement)
 
-        server = None
-        routing_method = None
+    def assign_server_fast(self, cpu_requirement, memory_requirement):
+        """Assign server for a request whose resource requirements are known"""
+        self.total_requests_received += 1
 
-        if self.algorithm == LoadBalancingAlgorithm.ROUND_ROBIN:
-            server, routing_method = self._round_robin_assignment(
-                cpu_requirement, memory_requirement
-            )
-        elif self.algorithm == LoadBalancingAlgorithm.LEAST_CONNECTIONS:
-            server, routing_method = self._least_connections_assignment(
-                cpu_requirement, memory_requirement
-            )
-        elif self.algorithm == LoadBalancingAlgorithm.WEIGHTED_ROUND_ROBIN:
-            server, routing_method = self._weighted_round_robin_assignment(
-                cpu_requirement, memory_requirement
-            )
-        elif self.algorithm == LoadBalancingAlgorithm.LEAST_RESPONSE_TIME:
-            server, routing_method = self._least_response_time_assignment(
-                cpu_requirement, memory_requirement
-            )
-        elif self.algorithm == LoadBalancingAlgorithm.RESOURCE_BASED:
-            server, routing_method = self._resource_based_assignment(
-                cpu_requirement, memory_requirement
-            )
-        elif self.algorithm == LoadBalancingAlgorithm.RANDOM:
-            server, routing_method = self._random_assignment(
-                cpu_requirement, memory_requirement
-            )
-        elif self.algorithm == LoadBalancingAlgorithm.POWER_OF_TWO:
-            server, routing_method = self._power_of_two_assignment(
-                cpu_requirement, memory_requirement
-            )
+        if self.record_decisions:
+            now = time.time()
+            self._record_request(now, cpu_requirement, memory_requirement)
+        else:
+            now = None
 
-        decision = {
-            "timestamp": time.time(),
-            "algorithm": self.algorithm.value,
-            "method": routing_method,
-            "server_id": getattr(server, "name", "None") if server else "None",
-            "success": server is not None,
-        }
-        self.routing_decisions.append(decision)
+        # can_accept_request already rejects overloaded and failed servers
+        available_servers = []
+        for server in self.servers:
+            if server.can_accept_request(cpu_requirement, memory_requirement):
+                available_servers.append(server)
+
+        server, routing_method = self._assign_impl(available_servers)
+        return self._record_outcome(now, server, routing_method)
+
+    def _record_outcome(self, timestamp, server, routing_method):
+        """Record a routing decision and update the routed/dropped counters"""
+        if self.record_decisions:
+            if server is None:
+                decision = RoutingDecision(
+                    timestamp, self._alg_value, routing_method, "None", False
+                )
+            else:
+                decision = RoutingDecision(
+                    timestamp, self._alg_value, routing_method, server.name, True
+                )
+            self.routing_decisions.append(decision)
 
-        if server:
+        if server is not None:
             self.total_requests_routed += 1
             return server
         else:
             self.dropped_requests += 1
             return None
 
-    def _round_robin_assignment(self, cpu_req, memory_req):
+    def _round_robin_assignment(self, available_servers):
         """Round robin server selection"""
-        healthy_servers = self.get_healthy_servers()
-        if not healthy_servers:
-            return None, "no_healthy_servers"
-
-        attempts = 0
-        while attempts < len(healthy_servers):
-            server = healthy_servers[self.round_robin_index % len(healthy_servers)]
-            self.round_robin_index = (self.round_robin_index + 1) % len(healthy_servers)
-
-            if server.can_accept_request(cpu_req, memory_req):
-                return server, "round_robin_success"
-            attempts += 1
+        if not available_servers:
+            if not self.get_healthy_servers():
+                return None, "no_healthy_servers"
+            return None, "round_robin_all_full"
 
-        return None, "round_robin_all_full"
+        server = available_servers[self.round_robin_index % len(available_servers)]
+        self.round_robin_index = (self.round_robin_index + 1) % len(available_servers)
+        return server, "round_robin_success"
 
-    def _least_connections_assignment(self, cpu_req, memory_req):
+    def _least_connections_assignment(self, available_servers):
         """Least connections server selection"""
-        available_servers = [
-            s
-            for s in self.get_healthy_servers()
-            if s.can_accept_request(cpu_req, memory_req)
-        ]
-
         if not available_servers:
             return None, "no_available_servers"
 
-        best_server = min(available_servers, key=lambda s: s.active_connections)
+        best_server = None
+        best_connections = float("inf")
+        for server in available_servers:
+            connections = server.active_connections
+            if connections == 0:
+                return server, "least_connections_success"
+            if connections < best_connections:
+                best_server = server
+                best_connections = connections
         return best_server, "least_connections_success"
 
-    def _weighted_round_robin_assignment(self, cpu_req, memory_req):
+    def _weighted_round_robin_assignment(self, available_servers):
         """Weighted round robin server selection"""
-        if not self.weighted_servers_list:
+        weights = self._server_weights
+        if len(weights) != len(self.servers):
             self._rebuild_weighted_list()
+            weights = self._server_weights
 
-        available_weighted = [
-            s
-            for s in self.weighted_servers_list
-            if not s.is_overloaded() and s.can_accept_request(cpu_req, memory_req)
-        ]
+        # Cumulative weights over the available servers only, one pass each
+        cumulative = []
+        total_weight = 0
+        for server in available_servers:
+            total_weight += weights.get(server, 1)
+            cumulative.append(total_weight)
 
-        if not available_weighted:
+        if total_weight <= 0:
             return None, "no_weighted_available"
 
-        server = available_weighted[
-            self.weighted_round_robin_current % len(available_weighted)
-        ]
-        self.weighted_round_robin_current = (
-            self.weighted_round_robin_current + 1
-        ) % len(available_weighted)
+        slot = self.weighted_round_robin_current % total_weight
+        self.weighted_round_robin_current = slot + 1
+        server = available_servers[bisect_right(cumulative, slot)]
 
         return server, "weighted_round_robin_success"
 
-    def _least_response_time_assignment(self, cpu_req, memory_req):
+    def _least_response_time_assignment(self, available_servers):
         """Least response time server selection"""
-        available_servers = [
-            s
-            for s in self.get_healthy_servers()
-            if s.can_accept_request(cpu_req, memory_req)
-        ]
-
         if not available_servers:
             return None, "no_available_servers"
 
-        best_server = min(available_servers, key=lambda s: s.avg_response_time)
+        best_server = None
+        best_response_time = float("inf")
+        for server in available_servers:
+            response_time = server.avg_response_time
+            if response_time == 0:
+                return server, "least_response_time_success"
+            if response_time < best_response_time:
+                best_server = server
+                best_response_time = response_time
         return best_server, "least_response_time_success"
 
-    def _resource_based_assignment(self, cpu_req, memory_req):
+    def _resource_based_assignment(self, available_servers):
         """Resource-based server selection using load score"""
-        available_servers = [
-            s
-            for s in self.get_healthy_servers()
-            if s.can_accept_request(cpu_req, memory_req)
-        ]
-
         if not available_servers:
             return None, "no_available_servers"
 
-        best_server = min(available_servers, key=lambda s: s.load_score)
+        best_server = min(available_servers, key=_by_load_score)
         return best_server, "resource_based_success"
 
-    def _random_assignment(self, cpu_req, memory_req):
+    def _random_assignment(self, available_servers):
         """Random server selection"""
-        available_servers = [
-            s
-            for s in self.get_healthy_servers()
-            if s.can_accept_request(cpu_req, memory_req)
-        ]
-
         if not available_servers:
             return None, "no_available_servers"
 
-        server = random.choice(available_servers)
+        server = available_servers[self._randrange(len(available_servers))]
         return server, "random_success"
 
-    def _power_of_two_assignment(self, cpu_req, memory_req):
+    def _power_of_two_assignment(self, available_servers):
         """Power of two choices algorithm"""
-        healthy_servers = [
-            s
-            for s in self.get_healthy_servers()
-            if s.can_accept_request(cpu_req, memory_req)
-        ]
-
-        if not healthy_servers:
+        if not available_servers:
             return None, "no_available_servers"
 
-        if len(healthy_servers) == 1:
-            return healthy_servers[0], "power_of_two_single"
+        if len(available_servers) == 1:
+            return available_servers[0], "power_of_two_single"
 
-        server1, server2 = random.sample(healthy_servers, 2)
+        n = len(available_servers)
+        i = self._randrange(n)
+        j = self._randrange(n - 1)
+        if j >= i:
+            j += 1
+        server1 = available_servers[i]
+        server2 = available_servers[j]
 
         if server1.active_connections <= server2.active_connections:
             return server1, "power_of_two_choice1"
@@ -249,6 +331,9 @@ class LoadBalancer:
         """Switch to a different load balancing algorithm"""
         if new_algorithm != self.algorithm:
             self.algorithm = new_algorithm
+            self._alg_value = new_algorithm.value
+            self._alg_code = _ALGORITHM_CODES[new_algorithm]
+            self._assign_impl = self._dispatch[new_algorithm]
             self.algorithm_switch_count += 1
             self.last_algorithm_switch = time.time()
 
@@ -259,34 +344,40 @@ class LoadBalancer:
     def evaluate_performance(self):
         """Evaluate current algorithm performance"""
         current_time = time.time()
-
-        recent_requests = [
-            r for r in self.request_history if current_time - r["timestamp"] < 10.0
-        ]
-
-        if not recent_requests:
+        # Windows are bounded by the history sizes: the last 100 requests and
+        # the last 50 routing decisions within 10 seconds.
+        total_recent = np.count_nonzero(
+            current_time - self._req_ts[: self._req_count] < 10.0
+        )
+        if not total_recent:
             return None
 
-        total_recent = len(recent_requests)
-        recent_decisions = [
-            d for d in self.routing_decisions if current_time - d["timestamp"] < 10.0
-        ]
-        successful_recent = len([d for d in recent_decisions if d["success"]])
-        success_rate = successful_recent / total_recent if total_recent > 0 else 0
+        successful_recent = 0
+        for decision in self.routing_decisions:
+            if decision.success and current_time - decision.timestamp < 10.0:
+                successful_recent += 1
 
-        avg_load = np.mean(
-            [s.load_score for s in self.servers if s.load_score != float("inf")]
-        )
+        success_rate = successful_recent / total_recent
 
-        loads = [s.load_score for s in self.servers if s.load_score != float("inf")]
-        load_variance = np.var(loads) if loads else 0
+        loads = np.fromiter(
+            (s.load_score for s in self.servers),
+            dtype=np.float64,
+            count=len(self.servers),
+        )
+        loads = loads[np.isfinite(loads)]
+        if loads.size:
+            avg_load = loads.mean()
+            load_variance = loads.var()
+        else:
+            avg_load = 0
+            load_variance = 0
 
         performance = {
             "success_rate": success_rate,
             "avg_load": avg_load,
             "load_variance": load_variance,
             "total_requests": total_recent,
-            "algorithm": self.algorithm.value,
+            "algorithm": self._alg_value,
             "timestamp": current_time,
         }
 
@@ -295,30 +386,27 @@ class LoadBalancer:
 
     def get_algorithm_stats(self):
         """Get comprehensive statistics about algorithm performance"""
-        if not self.routing_decisions:
-            return {}
-
         current_time = time.time()
-        recent_decisions = [
-            d for d in self.routing_decisions if current_time - d["timestamp"] < 30.0
-        ]
-
-        if not recent_decisions:
+        # Covers the retained routing decisions (at most 50) from the last 30s
+        total_decisions = 0
+        successful = 0
+        method_counts = Counter()
+        for decision in self.routing_decisions:
+            if current_time - decision.timestamp < 30.0:
+                total_decisions += 1
+                successful += decision.success
+                method_counts[decision.method] += 1
+
+        if not total_decisions:
             return {}
 
-        method_counts = {}
-        for decision in recent_decisions:
-            method = decision["method"]
-            method_counts[method] = method_counts.get(method, 0) + 1
-
-        successful = len([d for d in recent_decisions if d["success"]])
-        success_rate = successful / len(recent_decisions) if recent_decisions else 0
+        success_rate = successful / total_decisions
 
         return {
-            "algorithm": self.algorithm.value,
+            "algorithm": self._alg_value,
             "success_rate": success_rate,
-            "total_decisions": len(recent_decisions),
-            "method_breakdown": method_counts,
+            "total_decisions": total_decisions,
+            "method_breakdown": dict(method_counts),
             "requests_received": self.total_requests_received,
             "requests_routed": self.total_requests_routed,
             "dropped_requests": self.dropped_requests,
@@ -328,7 +416,7 @@ class LoadBalancer:
 
         base_color = self.color
 
-        pulse = abs(np.sin(time.time() * 3)) * 0.3 + 0.7
+        pulse = abs(math.sin(time.time() * 3)) * 0.3 + 0.7
         color = tuple(int(c * pulse) for c in base_color)
 
         rect = pygame.Rect(
@@ -337,13 +425,21 @@ class LoadBalancer:
         pygame.draw.rect(screen, color, rect)
         pygame.draw.rect(screen, (255, 255, 255, 50), rect, 3)
 
-        font = pygame.font.Font(None, 16)
-        alg_text = font.render(self.algorithm.value.upper(), True, (255, 255, 255))
-        alg_rect = alg_text.get_rect(center=(self.x, self.y - 5))
-        screen.blit(alg_text, alg_rect)
+        if self._font is None:
+            self._font = pygame.font.Font(None, 16)
 
-        req_text = font.render(
-            f"Req: {self.total_requests_received}", True, (255, 255, 255)
-        )
-        req_rect = req_text.get_rect(center=(self.x, self.y + 8))
-        screen.blit(req_text, req_rect)
+        if self._alg_surface_value != self._alg_value:
+            self._alg_surface = self._font.render(
+                self._alg_value.upper(), True, (255, 255, 255)
+            )
+            self._alg_surface_value = self._alg_value
+        alg_rect = self._alg_surface.get_rect(center=(self.x, self.y - 5))
+        screen.blit(self._alg_surface, alg_rect)
+
+        if self._req_surface_count != self.total_requests_received:
+            self._req_surface = self._font.render(
+                f"Req: {self.total_requests_received}", True, (255, 255, 255)
+            )
+            self._req_surface_count = self.total_requests_received
+        req_rect = self._req_surface.get_rect(center=(self.x, self.y + 8))
+        screen.blit(self._req_surface, req_rect)
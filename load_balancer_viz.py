@@ -1,24 +1,145 @@
+import math
 import pygame
+import pygame.freetype
 import random
+import string
 import time
 import json
+import itertools
 import threading
 import numpy as np
 from collections import deque
-from user import User, UserType
+from user import SIMULATION_USER, USER_TYPES, User
 from load_balancer import LoadBalancer, LoadBalancingAlgorithm
-from upstream_server import UpstreamServer, ServerType, ServerStatus
+from upstream_server import ServerFleet, UpstreamServer, ServerType, ServerStatus
 from report import SimulationReportGenerator
 from traffic_pattern import TrafficPattern
 from performance_monitor import PerformanceMonitor
 
 
+_ATLAS_CHARS = string.digits + string.ascii_letters + string.punctuation + " "
+
+_STATUS_COLORS = {
+    "healthy": (0, 255, 0),
+    "degraded": (255, 255, 0),
+    "overloaded": (255, 150, 50),
+    "failed": (255, 50, 50),
+}
+
+_LINE_STATUS_COLORS = {
+    ServerStatus.FAILED: (100, 50, 50),
+    ServerStatus.OVERLOADED: (150, 100, 50),
+}
+
+# pygame.font shrinks its bundled default font by this factor; freetype does not.
+_DEFAULT_FONT_SCALE = 0.6875
+
+_INPUT_COLORS = {
+    True: ((60, 60, 80), (0, 200, 255), 2),
+    False: ((40, 40, 50), (100, 100, 100), 1),
+}
+
+
+def _mean(values):
+    """Mean of a short sequence without materializing an ndarray"""
+    count = len(values)
+    return sum(values) / count if count else 0.0
+
+
+def _variance(values):
+    """Population variance of a short sequence, 0.0 when empty"""
+    count = len(values)
+    if not count:
+        return 0.0
+    mean = sum(values) / count
+    return sum((value - mean) * (value - mean) for value in values) / count
+
+
+def _mean_and_peak(values):
+    """Mean and maximum of a short sequence in a single pass"""
+    total = 0.0
+    peak = 0
+    for value in values:
+        total += value
+        if value > peak:
+            peak = value
+    return (total / len(values), peak) if values else (0, 0)
+
+
+def _step_towards(positions, targets, speeds):
+    """Advance positions toward targets in place, returning the arrival mask"""
+    delta = targets - positions
+    distance = np.hypot(delta[:, 0], delta[:, 1])
+    arrived = distance < speeds
+    np.divide(speeds, distance, out=distance, where=~arrived)
+    delta *= distance[:, None]
+    positions += delta
+    positions[arrived] = targets[arrived]
+    return arrived
+
+
+class _RecentIdSet:
+    """Set of user ids that only retains the two most recent generations"""
+
+    def __init__(self, generation_size=4096):
+        self.generation_size = generation_size
+        self._current = set()
+        self._previous = set()
+        self._total = 0
+
+    def __contains__(self, user_id):
+        return user_id in self._current or user_id in self._previous
+
+    def __len__(self):
+        return self._total
+
+    def add(self, user_id):
+        self._current.add(user_id)
+        self._total += 1
+        if len(self._current) >= self.generation_size:
+            self._previous = self._current
+            self._current = set()
+
+    def clear(self):
+        self._current.clear()
+        self._previous.clear()
+        self._total = 0
+
+
 class LoadBalancerVisualization:
+    VECTORIZE_MIN_USERS = 64
+    COMPLETED_HISTORY_SIZE = 10_000
+    RESOURCE_HISTORY_SIZE = 100
+    EVENT_LOG_SIZE = 50
+    TEXT_CACHE_SIZE = 1024
+    PANEL_REFRESH_FRAMES = 15
+    CURSOR_BLINK_FRAMES = 30
+    IDLE_REDRAW_FRAMES = 4
+    RESOURCE_SERIES = (
+        "cpu_usage",
+        "memory_usage",
+        "network_throughput",
+        "request_latency",
+    )
+    SERVER_CONFIGS = (
+        ("SRV-01", ServerType.STANDARD, 1),
+        ("SRV-02", ServerType.HIGH_PERFORMANCE, 3),
+        ("SRV-03", ServerType.MEMORY_OPTIMIZED, 2),
+        ("SRV-04", ServerType.CPU_OPTIMIZED, 2),
+    )
+    SERVER_TYPE_NAMES = {
+        ServerType.STANDARD: "Standard",
+        ServerType.HIGH_PERFORMANCE: "High-Perf",
+        ServerType.MEMORY_OPTIMIZED: "Memory-Opt",
+        ServerType.CPU_OPTIMIZED: "CPU-Opt",
+    }
+
     def __init__(self, width, height):
         self.width = width
         self.height = height
         self.users = []
-        self.completed_users = []
+        self.completed_users = deque(maxlen=self.COMPLETED_HISTORY_SIZE)
+        self.completion_stats = self._new_completion_stats()
         self.last_spawn_time = 0
 
         self.current_traffic_pattern = TrafficPattern("steady", 2.0, 0.1, 2.0)
@@ -48,12 +169,12 @@ class LoadBalancerVisualization:
         self.algorithm_performance_history = {}
         self.algorithm_switch_times = []
 
-        self.system_resource_history = {
-            "cpu_usage": deque(maxlen=100),
-            "memory_usage": deque(maxlen=100),
-            "network_throughput": deque(maxlen=100),
-            "request_latency": deque(maxlen=100),
-        }
+        # Rows: cpu usage, memory usage, network throughput, request latency
+        self._resource_ring = np.zeros(
+            (len(self.RESOURCE_SERIES), self.RESOURCE_HISTORY_SIZE), dtype=np.float32
+        )
+        self._resource_head = 0
+        self._resource_count = 0
 
         self.traffic_analytics = {
             "peak_concurrent_users": 0,
@@ -112,12 +233,32 @@ class LoadBalancerVisualization:
 
         self.small_font = pygame.font.Font(None, 18)
         self.font = pygame.font.Font(None, 24)
+        self._freetype_fonts = {
+            id(self.small_font): self._freetype_match(self.small_font, 18),
+            id(self.font): self._freetype_match(self.font, 24),
+        }
         self.title_font = pygame.font.Font(None, 36)
         self.large_font = pygame.font.Font(None, 48)
-
-        self.event_log = deque(maxlen=50)
+        self._text_cache = {}
+        self._glyph_atlases = {}
+        self._server_line_cache = {}
+        self._frame = 0
+        self._blink_on = False
+        self.dirty = True
+        self._idle_updates = 0
+        self._static_labels = {}
+        self._static_labels_version = None
+
+        self.event_log = deque(maxlen=self.EVENT_LOG_SIZE)
         self.log_event("System initialized")
 
+        self.simulation_panel_width = 300
+        self.button_height = 30
+        self.input_height = 25
+
+        self._dropdown_layout_key = None
+        self._recompute_layout()
+
         self.setup_infrastructure()
 
         self.algorithm_cycle_enabled = False
@@ -126,10 +267,6 @@ class LoadBalancerVisualization:
         self.algorithm_index = 0
         self.available_algorithms = list(LoadBalancingAlgorithm)
 
-        self.simulation_panel_width = 300
-        self.button_height = 30
-        self.input_height = 25
-
         self.server_dropdowns = {}
         for i, server in enumerate(["SRV-01", "SRV-02", "SRV-03", "SRV-04"]):
             self.server_dropdowns[server] = {
@@ -137,67 +274,73 @@ class LoadBalancerVisualization:
                 "selected": list(ServerType)[i],
             }
 
+        self.dropdown_rects = {}
+        self._config_panel_surface = None
+        self._legend_surface = None
+
         self.editing_field = None
         self.input_text = ""
         self.rate_input_rect = None
         self.duration_input_rect = None
 
         self._counting_lock = threading.Lock()
+        self._next_validate_at = 0.0
+        self._current_hour = 0
+        self._hour_ends_at = 0.0
 
-        self._counted_simulation_users = set()
-        self._counted_overall_users = set()
+        self._user_ids = itertools.count(1)
+        self._counted_simulation_users = _RecentIdSet()
+        self._counted_overall_users = _RecentIdSet()
 
         self.report_generator = SimulationReportGenerator()
         self.auto_save_reports = True
         self.reports_saved = False
 
-    def setup_infrastructure(self):
+    def _recompute_layout(self):
+        """Compute window-dependent geometry once, instead of on every frame"""
         offset = 100
-        """Setup load balancer and servers with diverse configurations"""
+        self._lb_pos = (self.width // 4 - offset, self.height // 2)
+        self._server_x = 3 * self.width // 4 - offset
+        self._server_ys = tuple(
+            (i + 1) * self.height // 5 for i in range(len(self.SERVER_CONFIGS))
+        )
 
-        lb_x = self.width // 4 - offset
-        lb_y = self.height // 2
+        self._performance_panel = pygame.Rect(740, self.height - 150, 280, 140)
+        self._config_panel = pygame.Rect(220, self.height - 290, 500, 280)
+        self._simulation_panel = pygame.Rect(
+            self.width - self.simulation_panel_width - 20,
+            100,
+            self.simulation_panel_width,
+            self.height - 200,
+        )
+        self._panel_cache = pygame.Surface(self._simulation_panel.size)
+        self._panel_state = None
+        self._dropdown_layout_key = None
+
+    def setup_infrastructure(self):
+        """Setup load balancer and servers with diverse configurations"""
+        lb_x, lb_y = self._lb_pos
         self.load_balancer = LoadBalancer(
             lb_x, lb_y, LoadBalancingAlgorithm.RESOURCE_BASED
         )
 
-        server_configs = [
-            {
-                "x": 3 * self.width // 4 - offset,
-                "y": self.height // 5,
-                "name": "SRV-01",
-                "server_type": ServerType.STANDARD,
-                "weight": 1,
-            },
-            {
-                "x": 3 * self.width // 4 - offset,
-                "y": 2 * self.height // 5,
-                "name": "SRV-02",
-                "server_type": ServerType.HIGH_PERFORMANCE,
-                "weight": 3,
-            },
-            {
-                "x": 3 * self.width // 4 - offset,
-                "y": 3 * self.height // 5,
-                "name": "SRV-03",
-                "server_type": ServerType.MEMORY_OPTIMIZED,
-                "weight": 2,
-            },
-            {
-                "x": 3 * self.width // 4 - offset,
-                "y": 4 * self.height // 5,
-                "name": "SRV-04",
-                "server_type": ServerType.CPU_OPTIMIZED,
-                "weight": 2,
-            },
-        ]
-
         self.servers = []
-        for config in server_configs:
-            server = UpstreamServer(**config)
+        for (name, server_type, weight), y in zip(
+            self.SERVER_CONFIGS, self._server_ys
+        ):
+            server = UpstreamServer(
+                x=self._server_x,
+                y=y,
+                name=name,
+                server_type=server_type,
+                weight=weight,
+            )
             self.servers.append(server)
+        self.server_fleet = ServerFleet(self.servers)
 
         self.load_balancer.set_servers(self.servers)
+        self._healthy_server_count = len(self.servers)
+        self._refresh_server_type_values()
         self.log_event(
             f"Infrastructure setup: {len(self.servers)} servers, {self.load_balancer.algorithm.value} algorithm"
         )
@@ -209,17 +352,12 @@ class LoadBalancerVisualization:
         user = User(start_x, start_y, self.load_balancer, user_type)
         user.set_screen_height(self.height)
 
-        user.unique_id = f"{time.time()}_{random.randint(1000, 9999)}"
+        user.unique_id = next(self._user_ids)
 
         if self.simulation_running:
-            user.is_simulation_user = True
+            user.flags |= SIMULATION_USER
             user.simulation_id = self.simulation_start_time
-
-            with self._counting_lock:
-                self.simulation_total_users += 1
-        else:
-            user.is_simulation_user = False
-            user.simulation_id = None
+            self.simulation_total_users += 1
 
         self.users.append(user)
         self.total_spawned_users += 1
@@ -227,7 +365,7 @@ class LoadBalancerVisualization:
     def spawn_burst_traffic(self, count=5):
         """Spawn a burst of traffic for stress testing"""
         for _ in range(count):
-            user_type = random.choice(list(UserType))
+            user_type = random.choice(USER_TYPES)
             self.spawn_user(user_type)
         self.log_event(f"Traffic burst: {count} users spawned")
 
@@ -269,28 +407,30 @@ class LoadBalancerVisualization:
 
         self.users.clear()
         self.completed_users.clear()
+        self.completion_stats = self._new_completion_stats()
 
         for server in self.servers:
             server.active_connections = 0
             server.total_requests = 0
-            server.processing_requests.clear()
+            server.clear_requests()
             server.request_queue.clear()
             server.current_cpu_usage = 0.0
             server.current_memory_usage = 0.0
             server.status = ServerStatus.HEALTHY
             server.recovery_time = 0
-            server.response_times.clear()
+            server.clear_response_times()
             server.total_response_time = 0.0
             server.avg_response_time = 0.0
+            server.refresh_load()
             server.load_history.clear()
+        self._healthy_server_count = len(self.servers)
 
         self.load_balancer.round_robin_index = 0
         self.load_balancer.weighted_round_robin_current = 0
         self.load_balancer.total_requests_received = 0
         self.load_balancer.total_requests_routed = 0
         self.load_balancer.dropped_requests = 0
-        self.load_balancer.request_history.clear()
-        self.load_balancer.routing_decisions.clear()
+        self.load_balancer.reset_history()
         self.load_balancer._rebuild_weighted_list()
 
         self.performance_monitor = PerformanceMonitor()
@@ -310,7 +450,7 @@ class LoadBalancerVisualization:
 
     def save_simulation_report(self):
         """Save comprehensive simulation report"""
-        if not hasattr(self, "report_generator") or not self.report_generator:
+        if not self.report_generator:
             self.log_event("No report generator available")
             return None
 
@@ -321,7 +461,7 @@ class LoadBalancerVisualization:
 
             self.report_generator.collect_server_metrics(self.servers)
             self.report_generator.collect_user_analytics(
-                self.completed_users, self.users
+                self.completed_users, self.users, self.completion_stats
             )
             self.report_generator.collect_load_balancer_performance(self.load_balancer)
             self.report_generator.collect_system_statistics(self)
@@ -347,19 +487,21 @@ class LoadBalancerVisualization:
             self.save_simulation_report()
 
         self.reset_all_state()
+        self._counted_simulation_users.generation_size = max(
+            1024, int(self.simulation_spawn_rate * self.simulation_duration)
+        )
         self.report_generator = SimulationReportGenerator()
 
-        with self._counting_lock:
-            self.simulation_running = True
-            self.simulation_start_time = time.time()
-            self.simulation_elapsed = 0
+        self.simulation_running = True
+        self.simulation_start_time = time.time()
+        self.simulation_elapsed = 0
 
-        if hasattr(self, "report_generator"):
+        if self.report_generator:
             simulation_config = {
                 "screen_resolution": f"{self.width}x{self.height}",
                 "initial_algorithm": self.load_balancer.algorithm.value,
                 "server_count": len(self.servers),
-                "server_types": [s.server_type.value for s in self.servers],
+                "server_types": list(self.server_type_values),
                 "traffic_pattern": self.current_traffic_pattern.name,
                 "auto_algorithm_cycling": self.algorithm_cycle_enabled,
                 "simulation_duration": self.simulation_duration,
@@ -404,52 +546,49 @@ class LoadBalancerVisualization:
             if server.name == server_name:
                 server.server_type = new_type
                 server._set_server_specs()
+                server.refresh_load()
+                self._refresh_server_type_values()
                 self.log_event(f"Server {server_name} changed to {new_type.value}")
                 break
 
-    def _count_simulation_completion(self, user, is_success):
-        """Thread-safe simulation counting to prevent race conditions"""
-        with self._counting_lock:
-
-            if (
-                hasattr(user, "is_simulation_user")
-                and user.is_simulation_user
-                and hasattr(user, "simulation_id")
-                and user.simulation_id == self.simulation_start_time
-                and hasattr(user, "unique_id")
-                and user.unique_id not in self._counted_simulation_users
-            ):
+    def _refresh_server_type_values(self):
+        """Cache the server type names, which change only through the config panel"""
+        self.server_type_values = tuple(s.server_type.value for s in self.servers)
 
-                self._counted_simulation_users.add(user.unique_id)
+    def _count_simulation_completion(self, user, is_success):
+        """Count a simulation user's completion once, locking only the de-dup set"""
+        if (
+            not user.flags & SIMULATION_USER
+            or user.simulation_id != self.simulation_start_time
+        ):
+            return False
 
-                if is_success:
-                    self.simulation_success_users += 1
-                else:
-                    self.simulation_failed_users += 1
+        with self._counting_lock:
+            if user.unique_id in self._counted_simulation_users:
+                return False
+            self._counted_simulation_users.add(user.unique_id)
 
-                return True
-        return False
+        if is_success:
+            self.simulation_success_users += 1
+        else:
+            self.simulation_failed_users += 1
+        return True
 
     def _count_overall_completion(self, user, is_success):
-        """Thread-safe overall counting to prevent race conditions"""
+        """Count a user's completion once, locking only the de-dup set"""
         with self._counting_lock:
-            if (
-                hasattr(user, "unique_id")
-                and user.unique_id not in self._counted_overall_users
-            ):
-
-                self._counted_overall_users.add(user.unique_id)
+            if user.unique_id in self._counted_overall_users:
+                return False
+            self._counted_overall_users.add(user.unique_id)
 
-                if is_success:
-                    self.successful_users += 1
-                else:
-                    self.timeout_users += 1
-
-                return True
-        return False
+        if is_success:
+            self.successful_users += 1
+        else:
+            self.timeout_users += 1
+        return True
 
-    def update(self):
-        """Main update loop with enhanced features"""
+    def update(self, ticks=1):
+        """Main update loop; `ticks` is how many 60 Hz ticks this call covers"""
         current_time = time.time()
 
         if self.simulation_running:
@@ -470,22 +609,17 @@ class LoadBalancerVisualization:
 
         self.cycle_algorithm()
 
-        remaining_users = []
         completed_this_update = 0
 
-        completed_users = []
-
-        for user in self.users:
-            user_still_active = user.update()
-
-            if user_still_active:
-
-                remaining_users.append(user)
-            else:
-
-                completed_users.append(user)
-
-        for user in completed_users:
+        # Compact active users in place while handling completions inline
+        users = self.users
+        moved = self._advance_moving_users(users)
+        write = 0
+        for index, user in enumerate(users):
+            if moved[index] or user.update(current_time):
+                users[write] = user
+                write += 1
+                continue
 
             is_success = user.state == "done" and not user.failed
 
@@ -493,13 +627,16 @@ class LoadBalancerVisualization:
             self._count_overall_completion(user, is_success)
 
             self.performance_monitor.record_user_completion(user)
-            self.completed_users.append(user)
+            self._record_completed_user(user)
             completed_this_update += 1
+        del users[write:]
 
-        self.users = remaining_users
-
+        self.server_fleet.advance(current_time)
         for server in self.servers:
-            server.update()
+            was_healthy = server.status == ServerStatus.HEALTHY
+            server.update(ticks)
+            if (server.status == ServerStatus.HEALTHY) != was_healthy:
+                self._healthy_server_count += -1 if was_healthy else 1
 
         if current_time - self.last_performance_update >= 10.0:
             performance = self.load_balancer.evaluate_performance()
@@ -510,11 +647,10 @@ class LoadBalancerVisualization:
                 )
             self.last_performance_update = current_time
 
-        if self.simulation_spawn_rate > 50:
-            if current_time % 1.0 < 0.1:
-                self._validate_simulation_counts()
-        else:
+        if current_time >= self._next_validate_at:
             self._validate_simulation_counts()
+            if self.simulation_spawn_rate > 50:
+                self._next_validate_at = current_time + 0.1
 
         self.update_server_statistics()
 
@@ -524,21 +660,213 @@ class LoadBalancerVisualization:
 
         self.update_system_resource_tracking()
 
+        if self.is_idle():
+            self._idle_updates += 1
+            if self._idle_updates >= self.IDLE_REDRAW_FRAMES:
+                self._idle_updates = 0
+                self.dirty = True
+        else:
+            self.dirty = True
+
+    def is_idle(self):
+        """True when nothing moves on screen except the slow ambient pulses"""
+        if self.users or self.simulation_running or self.editing_field:
+            return False
+        return not any(server.active_connections for server in self.servers)
+
+    @staticmethod
+    def _new_completion_stats():
+        """Running totals over every completed user, including evicted ones"""
+        return {
+            "count": 0,
+            "successes": 0,
+            "failures": 0,
+            "timeouts": 0,
+            "total_response_time": 0.0,
+        }
+
+    def _record_completed_user(self, user):
+        """Fold a completed user into the running totals and the recent tail"""
+        stats = self.completion_stats
+        stats["count"] += 1
+        if user.failed:
+            stats["failures"] += 1
+            if user.timeout_exit:
+                stats["timeouts"] += 1
+        else:
+            stats["successes"] += 1
+        stats["total_response_time"] += user.get_response_time()
+        self.completed_users.append(user)
+
+    def _advance_moving_users(self, users):
+        """Step all travelling users in one vectorized pass, flagging who moved"""
+        moving = []
+        targets = []
+        for index, user in enumerate(users):
+            target = user.get_movement_target()
+            if target is not None:
+                moving.append(index)
+                targets.append(target)
+
+        moved = [False] * len(users)
+        if len(moving) < self.VECTORIZE_MIN_USERS:
+            return moved
+
+        count = len(moving)
+        positions = np.fromiter(
+            (c for i in moving for c in (users[i].x, users[i].y)),
+            dtype=np.float64,
+            count=2 * count,
+        ).reshape(count, 2)
+        target_positions = np.fromiter(
+            (c for tx, ty, _ in targets for c in (tx, ty)),
+            dtype=np.float64,
+            count=2 * count,
+        ).reshape(count, 2)
+        speeds = np.fromiter(
+            (users[i].speed for i in moving), dtype=np.float64, count=count
+        )
+
+        arrived = _step_towards(positions, target_positions, speeds)
+
+        for index, (x, y) in zip(moving, positions.tolist()):
+            user = users[index]
+            user.x = x
+            user.y = y
+            moved[index] = True
+
+        for slot in np.flatnonzero(arrived).tolist():
+            users[moving[slot]].state = targets[slot][2]
+        return moved
+
     def _validate_simulation_counts(self):
-        """Validate simulation counts to ensure consistency"""
-        with self._counting_lock:
-            total_counted = self.simulation_success_users + self.simulation_failed_users
+        """Validate simulation counts to ensure consistency (monitoring-only read)"""
+        # Advisory check: a stale snapshot at worst logs a spurious warning,
+        # so the counters are read without taking the counting lock.
+        total_users = self.simulation_total_users
+        success_users = self.simulation_success_users
+        failed_users = self.simulation_failed_users
+        total_counted = success_users + failed_users
+
+        max_discrepancy = max(2, int(self.simulation_spawn_rate * 0.01))
+
+        if abs(total_counted - total_users) > max_discrepancy:
+            self.log_event(
+                f"Count validation: Total={total_users}, "
+                f"Success={success_users}, "
+                f"Failed={failed_users}, "
+                f"Sum={total_counted}, "
+                f"Tracked={len(self._counted_simulation_users)}"
+            )
 
-            max_discrepancy = max(2, int(self.simulation_spawn_rate * 0.01))
+    def _text(self, font, text, color):
+        """Render text through an LRU cache keyed by font, text and color"""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            if len(cache) >= self.TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            surface = font.render(text, True, color)
+        cache[key] = surface
+        return surface
+
+    @staticmethod
+    def _freetype_match(font, size):
+        """Freetype twin of a default pygame.font, drawn relative to its baseline"""
+        twin = pygame.freetype.Font(None, size * _DEFAULT_FONT_SCALE)
+        twin.origin = True
+        return twin, font.get_ascent()
+
+    def _render_to(self, surface, font, position, text, color):
+        """Draw frequently changing text straight into surface, without a new surface"""
+        twin, ascent = self._freetype_fonts[id(font)]
+        x, y = position
+        twin.render_to(surface, (x, y + ascent), text, color)
+
+    def _text_format(self, font, color, template, *args):
+        """Render a formatted label, skipping both format and render on a cache hit"""
+        key = (id(font), template, args, color)
+        cache = self._text_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            if len(cache) >= self.TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            surface = font.render(template.format(*args), True, color)
+        cache[key] = surface
+        return surface
+
+    def _server_block(self, server_name, stats, width):
+        """Per-server header and metric lines, recomposed only when they change"""
+        key = (
+            stats["type"],
+            stats["status"],
+            stats["active_connections"],
+            round(stats["current_cpu"]),
+            round(stats["current_memory"]),
+            stats["total_requests"],
+            round(stats["avg_response_time"], 2),
+            round(stats["uptime_percentage"]),
+        )
+        cached = self._server_line_cache.get(server_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        status_color = _STATUS_COLORS.get(stats["status"], (255, 255, 255))
+        metrics_line1 = (
+            f"  Conn:{stats['active_connections']} "
+            f"CPU:{stats['current_cpu']:.0f}% Mem:{stats['current_memory']:.0f}%"
+        )
+        metrics_line2 = (
+            f"  Req:{stats['total_requests']} "
+            f"RT:{stats['avg_response_time']:.2f}s "
+            f"Up:{stats['uptime_percentage']:.0f}%"
+        )
 
-            if abs(total_counted - self.simulation_total_users) > max_discrepancy:
-                self.log_event(
-                    f"Count validation: Total={self.simulation_total_users}, "
-                    f"Success={self.simulation_success_users}, "
-                    f"Failed={self.simulation_failed_users}, "
-                    f"Sum={total_counted}, "
-                    f"Tracked={len(self._counted_simulation_users)}"
-                )
+        blit_list = [
+            (
+                self._text_format(
+                    self.small_font,
+                    self.text_color,
+                    "{} ({})",
+                    server_name,
+                    stats["type"][:4].upper(),
+                ),
+                (0, 0),
+            )
+        ]
+        self._atlas_blits(metrics_line1, status_color, (0, 12), blit_list)
+        self._atlas_blits(metrics_line2, (200, 200, 200), (0, 24), blit_list)
+
+        block = cached[1] if cached is not None else pygame.Surface((width, 39))
+        block.fill((25, 25, 35))
+        block.blits(blit_list, doreturn=False)
+        self._server_line_cache[server_name] = (key, block)
+        return block
+
+    def _glyph_atlas(self, color):
+        """Small-font glyph surfaces for printable ASCII, rendered once per color"""
+        atlas = self._glyph_atlases.get(color)
+        if atlas is None:
+            atlas = {
+                char: self.small_font.render(char, True, color)
+                for char in _ATLAS_CHARS
+            }
+            self._glyph_atlases[color] = atlas
+        return atlas
+
+    def _atlas_blits(self, text, color, position, blit_list):
+        """Queue an ASCII label as per-glyph blits composed from the atlas"""
+        atlas = self._glyph_atlas(color)
+        if not all(char in atlas for char in text):
+            blit_list.append((self._text(self.small_font, text, color), position))
+            return
+
+        x, y = position
+        for char in text:
+            glyph = atlas[char]
+            blit_list.append((glyph, (x, y)))
+            x += glyph.get_width()
 
     def get_system_stats(self):
         """Get comprehensive system statistics"""
@@ -556,10 +884,7 @@ class LoadBalancerVisualization:
             "traffic_pattern": self.current_traffic_pattern.name,
         }
 
-        healthy_servers = len(
-            [s for s in self.servers if s.status == ServerStatus.HEALTHY]
-        )
-        stats["healthy_servers"] = f"{healthy_servers}/{len(self.servers)}"
+        stats["healthy_servers"] = f"{self._healthy_server_count}/{len(self.servers)}"
 
         return stats
 
@@ -567,7 +892,7 @@ class LoadBalancerVisualization:
         """Draw enhanced header with system information"""
 
         title_text = f"Load Balancer System - {self.load_balancer.algorithm.value.replace('_', ' ').title()}"
-        title = self.title_font.render(title_text, True, self.accent_color)
+        title = self._text(self.title_font, title_text, self.accent_color)
         screen.blit(title, (20, 15))
 
         stats = self.get_system_stats()
@@ -578,17 +903,16 @@ class LoadBalancerVisualization:
             f"Servers: {stats['healthy_servers']}"
         )
 
-        stats_surface = self.font.render(stats_text, True, self.text_color)
+        stats_surface = self._text(self.font, stats_text, self.text_color)
         screen.blit(stats_surface, (20, 55))
 
         if self.simulation_running:
             pattern_text = f"SIMULATION ACTIVE | Rate: {self.simulation_spawn_rate:.1f}/s | Remaining: {max(0, self.simulation_duration - self.simulation_elapsed):.1f}s"
-            pattern_color = (255, 100, 100)
+            pattern_surface = self._text(self.font, pattern_text, (255, 100, 100))
         else:
             pattern_text = f"IDLE MODE - No automatic spawning | Manual controls: SPACE (single), B (burst)"
-            pattern_color = (150, 150, 150)
+            pattern_surface = self._text(self.font, pattern_text, (150, 150, 150))
 
-        pattern_surface = self.font.render(pattern_text, True, pattern_color)
         screen.blit(pattern_surface, (20, 80))
 
     def draw_legend(self, screen):
@@ -623,36 +947,46 @@ class LoadBalancerVisualization:
             ("Priority Abuse", (100, 0, 0), None),
         ]
 
+        if self._legend_surface is None:
+            self._legend_surface = self._build_legend_surface(legend_items)
+        screen.blit(self._legend_surface, (legend_x, legend_y))
+
+    def _build_legend_surface(self, legend_items):
+        """Pre-render the static legend into a single transparent surface"""
+        width = 15 + max(
+            self.small_font.size(text)[0] for text, _, _ in legend_items if text
+        )
+        surface = pygame.Surface((width, len(legend_items) * 15), pygame.SRCALPHA)
+
         for i, (text, color, text_color) in enumerate(legend_items):
             if not text:
                 continue
 
-            y_pos = legend_y + (i * 15)
+            y_pos = i * 15
 
             if color:
-                pygame.draw.circle(screen, color, (legend_x + 5, y_pos + 5), 4)
-                text_surface = self.small_font.render(
-                    text, True, text_color or self.text_color
+                pygame.draw.circle(surface, color, (5, y_pos + 5), 4)
+                text_surface = self._text(
+                    self.small_font, text, text_color or self.text_color
                 )
-                screen.blit(text_surface, (legend_x + 15, y_pos))
+                surface.blit(text_surface, (15, y_pos))
             else:
-                text_surface = self.small_font.render(
-                    text, True, text_color or self.text_color
+                text_surface = self._text(
+                    self.small_font, text, text_color or self.text_color
                 )
-                screen.blit(text_surface, (legend_x, y_pos))
+                surface.blit(text_surface, (0, y_pos))
+
+        return surface
 
     def draw_performance_panel(self, screen):
         """Draw performance monitoring panel"""
-        panel_x = 740
-        panel_y = self.height - 150
-        panel_width = 280
-        panel_height = 140
+        panel_rect = self._performance_panel
+        panel_x, panel_y = panel_rect.topleft
 
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
         pygame.draw.rect(screen, (30, 30, 40), panel_rect)
         pygame.draw.rect(screen, self.accent_color, panel_rect, 2)
 
-        title = self.font.render("Performance Monitor", True, self.accent_color)
+        title = self._text(self.font, "Performance Monitor", self.accent_color)
         screen.blit(title, (panel_x + 10, panel_y + 10))
 
         perf_summary = self.performance_monitor.get_performance_summary()
@@ -665,15 +999,15 @@ class LoadBalancerVisualization:
             ]
 
             for i, metric in enumerate(metrics_text):
-                metric_surface = self.small_font.render(metric, True, self.text_color)
+                metric_surface = self._text(self.small_font, metric, self.text_color)
                 screen.blit(metric_surface, (panel_x + 10, panel_y + 35 + (i * 16)))
 
         algo_stats = self.load_balancer.get_algorithm_stats()
         if algo_stats:
             algo_text = f"Algorithm Success: {algo_stats.get('success_rate', 0):.1%}"
-            algo_surface = self.small_font.render(
+            algo_surface = self._text(
+                self.small_font,
                 algo_text,
-                True,
                 (
                     (0, 255, 0)
                     if algo_stats.get("success_rate", 0) > 0.9
@@ -719,151 +1053,247 @@ class LoadBalancerVisualization:
                 color = (200, 200, 200)
 
             font = self.font if i == 0 else self.small_font
-            text = font.render(instruction, True, color)
+            text = self._text(font, instruction, color)
             screen.blit(text, (20, self.height - 150 + (i * 18)))
 
     def draw_server_configuration(self, screen):
 
-        panel_x = 220
-        panel_y = self.height - 290
-        panel_width = 500
-        panel_height = 280
+        panel_x, panel_y, panel_width, panel_height = self._config_panel
+        type_names = self.SERVER_TYPE_NAMES
 
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        pygame.draw.rect(screen, (25, 25, 35), panel_rect)
-        pygame.draw.rect(screen, self.accent_color, panel_rect, 2)
+        layout_key = len(self.servers)
+        if self._dropdown_layout_key != layout_key:
+            self._build_dropdown_layout(
+                panel_x, panel_y + 45, panel_width, list(ServerType)
+            )
+            self._config_panel_surface = self._build_config_panel_surface(
+                panel_x, panel_y, panel_width, panel_height
+            )
+            self._dropdown_layout_key = layout_key
 
-        y_offset = panel_y + 10
+        screen.blit(self._config_panel_surface, (panel_x, panel_y))
 
-        config_title = self.font.render("Server Configuration", True, self.accent_color)
-        screen.blit(config_title, (panel_x + 10, y_offset))
-        y_offset += 35
+        labels = []
+        open_dropdowns = []
+        for server in self.servers:
+            layout = self.dropdown_rects[server.name]
+            dropdown_rect = layout["main"]
 
-        server_types = list(ServerType)
-        type_names = {
-            ServerType.STANDARD: "Standard",
-            ServerType.HIGH_PERFORMANCE: "High-Perf",
-            ServerType.MEMORY_OPTIMIZED: "Memory-Opt",
-            ServerType.CPU_OPTIMIZED: "CPU-Opt",
-        }
+            current_type = type_names[server.server_type]
+            labels.append(
+                (
+                    self._text(self.small_font, current_type, self.text_color),
+                    (dropdown_rect.x + 5, dropdown_rect.y + 5),
+                )
+            )
+
+            is_open = self.server_dropdowns[server.name]["open"]
+            arrow = "▲" if is_open else "▼"
+            labels.append(
+                (
+                    self._text(self.small_font, arrow, self.text_color),
+                    (dropdown_rect.right - 20, dropdown_rect.y + 5),
+                )
+            )
+
+            if is_open:
+                open_dropdowns.append((server, layout))
+
+        screen.blits(labels, doreturn=False)
+
+        for server, layout in open_dropdowns:
+            option_labels = []
+            for option in layout["options"]:
+                option_rect = option["rect"]
+                server_type = option["type"]
+
+                if server_type == server.server_type:
+                    pygame.draw.rect(screen, (60, 60, 80), option_rect)
+                else:
+                    pygame.draw.rect(screen, (50, 50, 60), option_rect)
+
+                pygame.draw.rect(screen, (100, 100, 100), option_rect, 1)
+
+                option_labels.append(
+                    (
+                        self._text(
+                            self.small_font, type_names[server_type], self.text_color
+                        ),
+                        (option_rect.x + 5, option_rect.y + 5),
+                    )
+                )
+            screen.blits(option_labels, doreturn=False)
+
+    def _build_config_panel_surface(self, panel_x, panel_y, panel_width, panel_height):
+        """Pre-render the static parts of the server configuration panel"""
+        surface = pygame.Surface((panel_width, panel_height))
+        surface.fill((25, 25, 35))
+        pygame.draw.rect(surface, self.accent_color, surface.get_rect(), 2)
+
+        config_title = self._text(self.font, "Server Configuration", self.accent_color)
+        surface.blit(config_title, (10, 10))
 
-        if not hasattr(self, "dropdown_rects"):
-            self.dropdown_rects = {}
+        for server in self.servers:
+            layout = self.dropdown_rects[server.name]
+            label_x, label_y = layout["label_pos"]
+            surface.blit(
+                self._text(self.small_font, f"{server.name}:", self.text_color),
+                (label_x - panel_x, label_y - panel_y),
+            )
+
+            dropdown_rect = layout["main"].move(-panel_x, -panel_y)
+            pygame.draw.rect(surface, (40, 40, 50), dropdown_rect)
+            pygame.draw.rect(surface, (100, 100, 100), dropdown_rect, 1)
+
+        return surface
 
+    def _build_dropdown_layout(self, panel_x, y_offset, panel_width, server_types):
+        """Compute label positions and dropdown/option rects for each server"""
         col_width = (panel_width - 40) // 2
         servers_per_row = 2
 
+        self.dropdown_rects = {}
         for i, server in enumerate(self.servers):
-
             row = i // servers_per_row
             col = i % servers_per_row
 
             x_pos = panel_x + 10 + (col * col_width)
             y_pos = y_offset + (row * 110)
-
-            server_label = self.small_font.render(
-                f"{server.name}:", True, self.text_color
-            )
-            screen.blit(server_label, (x_pos, y_pos))
+            label_pos = (x_pos, y_pos)
             y_pos += 18
 
             dropdown_rect = pygame.Rect(x_pos, y_pos, col_width - 20, self.input_height)
-            pygame.draw.rect(screen, (40, 40, 50), dropdown_rect)
-            pygame.draw.rect(screen, (100, 100, 100), dropdown_rect, 1)
 
-            current_type = type_names[server.server_type]
-            dropdown_text = self.small_font.render(current_type, True, self.text_color)
-            screen.blit(dropdown_text, (dropdown_rect.x + 5, dropdown_rect.y + 5))
-
-            arrow = "▼" if not self.server_dropdowns[server.name]["open"] else "▲"
-            arrow_text = self.small_font.render(arrow, True, self.text_color)
-            screen.blit(arrow_text, (dropdown_rect.right - 20, dropdown_rect.y + 5))
-
-            self.dropdown_rects[server.name] = {"main": dropdown_rect, "options": []}
-
-            if self.server_dropdowns[server.name]["open"]:
-                option_y = y_pos + self.input_height
-                for j, server_type in enumerate(server_types):
-                    option_rect = pygame.Rect(
-                        dropdown_rect.x,
-                        option_y,
-                        dropdown_rect.width,
-                        self.input_height,
-                    )
-
-                    if server_type == server.server_type:
-                        pygame.draw.rect(screen, (60, 60, 80), option_rect)
-                    else:
-                        pygame.draw.rect(screen, (50, 50, 60), option_rect)
-
-                    pygame.draw.rect(screen, (100, 100, 100), option_rect, 1)
-
-                    option_text = self.small_font.render(
-                        type_names[server_type], True, self.text_color
-                    )
-                    screen.blit(option_text, (option_rect.x + 5, option_rect.y + 5))
+            options = []
+            option_y = y_pos + self.input_height
+            for server_type in server_types:
+                option_rect = pygame.Rect(
+                    dropdown_rect.x, option_y, dropdown_rect.width, self.input_height
+                )
+                options.append({"rect": option_rect, "type": server_type})
+                option_y += self.input_height
 
-                    self.dropdown_rects[server.name]["options"].append(
-                        {"rect": option_rect, "type": server_type}
-                    )
+            self.dropdown_rects[server.name] = {
+                "label_pos": label_pos,
+                "main": dropdown_rect,
+                "options": options,
+            }
 
-                    option_y += self.input_height
+    def _ensure_static_labels(self):
+        """Pre-render the simulation panel's constant labels once per palette"""
+        version = (self.accent_color, self.text_color)
+        if self._static_labels_version != version:
+            accent = self.accent_color
+            text = self.text_color
+            self._static_labels = {
+                "sim_ctrl": self.font.render(
+                    "Simulation Control & Metrics", True, accent
+                ),
+                "sim_stats": self.small_font.render("Simulation Stats:", True, accent),
+                "server_perf": self.small_font.render(
+                    "Server Performance:", True, accent
+                ),
+                "algo_perf": self.small_font.render(
+                    "Algorithm Performance:", True, accent
+                ),
+                "traffic": self.small_font.render("Traffic Analytics:", True, accent),
+                "perf_summary": self.small_font.render(
+                    "Performance Summary:", True, accent
+                ),
+                "rate_label": self.small_font.render("Users per second:", True, text),
+                "duration_label": self.small_font.render(
+                    "Duration (seconds):", True, text
+                ),
+            }
+            self._static_labels_version = version
+        return self._static_labels
 
     def draw_simulation_panel(self, screen):
         """Draw simulation control panel on the right side with comprehensive metrics"""
-        panel_x = self.width - self.simulation_panel_width - 20
-        panel_y = 100
-        panel_height = self.height - 200
-
-        panel_rect = pygame.Rect(
-            panel_x, panel_y, self.simulation_panel_width, panel_height
+        state = (
+            self._frame // self.PANEL_REFRESH_FRAMES,
+            self.simulation_running,
+            self.simulation_success_users,
+            self.simulation_failed_users,
+            round(self.simulation_elapsed, 1),
+            self.simulation_spawn_rate,
+            self.simulation_duration,
+            len(self.users),
+            self.load_balancer.algorithm,
+            self.editing_field,
+            self.input_text,
+            self.editing_field is not None and self._blink_on,
+            tuple(
+                (
+                    server.status,
+                    server.active_connections,
+                    server.total_requests,
+                    int(server.cpu_utilization),
+                    int(server.memory_utilization),
+                )
+                for server in self.servers
+            ),
         )
-        pygame.draw.rect(screen, (25, 25, 35), panel_rect)
-        pygame.draw.rect(screen, self.accent_color, panel_rect, 2)
+        if state != self._panel_state:
+            self._render_simulation_panel(self._panel_cache)
+            self._panel_state = state
 
-        title = self.font.render(
-            "Simulation Control & Metrics", True, self.accent_color
-        )
-        screen.blit(title, (panel_x + 10, panel_y + 10))
+        screen.blit(self._panel_cache, self._simulation_panel.topleft)
+
+    def _render_simulation_panel(self, surface):
+        """Compose the simulation panel into its off-screen cache surface"""
+        labels = self._ensure_static_labels()
+        panel_rect = surface.get_rect()
+        panel_x, panel_y = panel_rect.topleft
+        label_x = panel_x + 10
+        small_font = self.small_font
+        text_color = self.text_color
+
+        pygame.draw.rect(surface, (25, 25, 35), panel_rect)
+        pygame.draw.rect(surface, self.accent_color, panel_rect, 2)
+
+        blit_list = [(labels["sim_ctrl"], (label_x, panel_y + 10))]
+        queue = blit_list.append
 
         y_offset = panel_y + 50
 
         if self.simulation_running:
             remaining = max(0, self.simulation_duration - self.simulation_elapsed)
-            status_text = f"Running: {remaining:.1f}s remaining"
-            status_color = (0, 255, 0)
+            self._render_to(
+                surface,
+                self.font,
+                (label_x, y_offset),
+                f"Running: {remaining:.1f}s remaining",
+                (0, 255, 0),
+            )
         else:
-            status_text = "Stopped"
-            status_color = (255, 100, 100)
-
-        status_surface = self.font.render(status_text, True, status_color)
-        screen.blit(status_surface, (panel_x + 10, y_offset))
+            status_surface = self._text(self.font, "Stopped", (255, 100, 100))
+            queue((status_surface, (label_x, y_offset)))
         y_offset += 35
 
-        counters_title = self.small_font.render(
-            "Simulation Stats:", True, self.accent_color
-        )
-        screen.blit(counters_title, (panel_x + 10, y_offset))
+        counters_title = labels["sim_stats"]
+        queue((counters_title, (label_x, y_offset)))
         y_offset += 20
 
-        total_text = self.small_font.render(
-            f"Total Users: {self.simulation_success_users + self.simulation_failed_users}",
-            True,
-            self.text_color,
+        total_text = self._text_format(
+            small_font,
+            text_color,
+            "Total Users: {}",
+            self.simulation_success_users + self.simulation_failed_users,
         )
-        screen.blit(total_text, (panel_x + 10, y_offset))
+        queue((total_text, (label_x, y_offset)))
         y_offset += 15
 
-        success_text = self.small_font.render(
-            f"Success: {self.simulation_success_users}", True, (0, 255, 0)
+        success_text = self._text_format(
+            small_font, (0, 255, 0), "Success: {}", self.simulation_success_users
         )
-        screen.blit(success_text, (panel_x + 10, y_offset))
+        queue((success_text, (label_x, y_offset)))
         y_offset += 15
 
-        failed_text = self.small_font.render(
-            f"Failed: {self.simulation_failed_users}", True, (255, 100, 100)
+        failed_text = self._text_format(
+            small_font, (255, 100, 100), "Failed: {}", self.simulation_failed_users
         )
-        screen.blit(failed_text, (panel_x + 10, y_offset))
+        queue((failed_text, (label_x, y_offset)))
         y_offset += 15
 
         if (self.simulation_failed_users + self.simulation_success_users) > 0:
@@ -876,59 +1306,36 @@ class LoadBalancerVisualization:
                 if sim_success_rate > 80
                 else (255, 255, 0) if sim_success_rate > 60 else (255, 100, 100)
             )
-            rate_text = self.small_font.render(
-                f"Success Rate: {sim_success_rate:.1f}%", True, rate_color
+            self._render_to(
+                surface,
+                small_font,
+                (label_x, y_offset),
+                f"Success Rate: {sim_success_rate:.1f}%",
+                rate_color,
             )
-            screen.blit(rate_text, (panel_x + 10, y_offset))
         y_offset += 25
 
-        server_metrics_title = self.small_font.render(
-            "Server Performance:", True, self.accent_color
-        )
-        screen.blit(server_metrics_title, (panel_x + 10, y_offset))
+        server_metrics_title = labels["server_perf"]
+        queue((server_metrics_title, (label_x, y_offset)))
         y_offset += 20
 
         server_stats = self.get_comprehensive_server_stats()
 
         for server_name, stats in server_stats.items():
-
-            server_header = self.small_font.render(
-                f"{server_name} ({stats['type'][:4].upper()})", True, self.text_color
-            )
-            screen.blit(server_header, (panel_x + 10, y_offset))
-            y_offset += 12
-
-            status_colors = {
-                "healthy": (0, 255, 0),
-                "degraded": (255, 255, 0),
-                "overloaded": (255, 150, 50),
-                "failed": (255, 50, 50),
-            }
-            status_color = status_colors.get(stats["status"], (255, 255, 255))
-
-            metrics_line1 = f"  Conn:{stats['active_connections']} CPU:{stats['current_cpu']:.0f}% Mem:{stats['current_memory']:.0f}%"
-            metrics_line2 = f"  Req:{stats['total_requests']} RT:{stats['avg_response_time']:.2f}s Up:{stats['uptime_percentage']:.0f}%"
-
-            metrics1_text = self.small_font.render(metrics_line1, True, status_color)
-            screen.blit(metrics1_text, (panel_x + 10, y_offset))
-            y_offset += 12
-
-            metrics2_text = self.small_font.render(metrics_line2, True, (200, 200, 200))
-            screen.blit(metrics2_text, (panel_x + 10, y_offset))
-            y_offset += 15
+            block = self._server_block(server_name, stats, panel_rect.width - 20)
+            queue((block, (label_x, y_offset)))
+            y_offset += block.get_height()
 
         y_offset += 10
-        algo_title = self.small_font.render(
-            "Algorithm Performance:", True, self.accent_color
-        )
-        screen.blit(algo_title, (panel_x + 10, y_offset))
+        algo_title = labels["algo_perf"]
+        queue((algo_title, (label_x, y_offset)))
         y_offset += 15
 
         algo_stats = self.load_balancer.get_algorithm_stats()
         if algo_stats:
             current_algo = f"Current: {algo_stats.get('algorithm', 'Unknown').replace('_', ' ').title()}"
-            algo_text = self.small_font.render(current_algo, True, self.text_color)
-            screen.blit(algo_text, (panel_x + 10, y_offset))
+            algo_text = self._text(small_font, current_algo, text_color)
+            queue((algo_text, (label_x, y_offset)))
             y_offset += 12
 
             success_rate = algo_stats.get("success_rate", 0) * 100
@@ -938,55 +1345,54 @@ class LoadBalancerVisualization:
                 else (255, 255, 0) if success_rate > 70 else (255, 100, 100)
             )
 
-            algo_metrics = f"Success: {success_rate:.1f}% Routed: {algo_stats.get('requests_routed', 0)}"
-            algo_metrics_text = self.small_font.render(
-                algo_metrics, True, success_color
+            self._render_to(
+                surface,
+                small_font,
+                (label_x, y_offset),
+                f"Success: {success_rate:.1f}% "
+                f"Routed: {algo_stats.get('requests_routed', 0)}",
+                success_color,
             )
-            screen.blit(algo_metrics_text, (panel_x + 10, y_offset))
             y_offset += 12
 
             dropped = algo_stats.get("dropped_requests", 0)
             if dropped > 0:
-                dropped_text = self.small_font.render(
-                    f"Dropped: {dropped}", True, (255, 100, 100)
+                dropped_text = self._text_format(
+                    small_font, (255, 100, 100), "Dropped: {}", dropped
                 )
-                screen.blit(dropped_text, (panel_x + 10, y_offset))
+                queue((dropped_text, (label_x, y_offset)))
                 y_offset += 12
 
         y_offset += 10
-        traffic_title = self.small_font.render(
-            "Traffic Analytics:", True, self.accent_color
-        )
-        screen.blit(traffic_title, (panel_x + 10, y_offset))
+        traffic_title = labels["traffic"]
+        queue((traffic_title, (label_x, y_offset)))
         y_offset += 15
 
         peak_users = self.traffic_analytics["peak_concurrent_users"]
         current_users = len(self.users)
         burst_freq = self.traffic_analytics["burst_frequency"]
 
-        peak_text = self.small_font.render(
-            f"Peak Concurrent: {peak_users}", True, self.text_color
+        peak_text = self._text_format(
+            small_font, text_color, "Peak Concurrent: {}", peak_users
         )
-        screen.blit(peak_text, (panel_x + 10, y_offset))
+        queue((peak_text, (label_x, y_offset)))
         y_offset += 12
 
-        current_text = self.small_font.render(
-            f"Current Active: {current_users}", True, self.text_color
+        current_text = self._text_format(
+            small_font, text_color, "Current Active: {}", current_users
         )
-        screen.blit(current_text, (panel_x + 10, y_offset))
+        queue((current_text, (label_x, y_offset)))
         y_offset += 12
 
-        burst_text = self.small_font.render(
-            f"Burst Events: {burst_freq}", True, self.text_color
+        burst_text = self._text_format(
+            small_font, text_color, "Burst Events: {}", burst_freq
         )
-        screen.blit(burst_text, (panel_x + 10, y_offset))
+        queue((burst_text, (label_x, y_offset)))
         y_offset += 15
 
         y_offset += 10
-        perf_title = self.small_font.render(
-            "Performance Summary:", True, self.accent_color
-        )
-        screen.blit(perf_title, (panel_x + 10, y_offset))
+        perf_title = labels["perf_summary"]
+        queue((perf_title, (label_x, y_offset)))
         y_offset += 15
 
         perf_summary = self.performance_monitor.get_performance_summary()
@@ -1001,108 +1407,95 @@ class LoadBalancerVisualization:
                 else (255, 255, 0) if avg_response < 5 else (255, 100, 100)
             )
 
-            avg_text = self.small_font.render(
-                f"Avg Response: {avg_response:.2f}s", True, response_color
+            self._render_to(
+                surface,
+                small_font,
+                (label_x, y_offset),
+                f"Avg Response: {avg_response:.2f}s",
+                response_color,
             )
-            screen.blit(avg_text, (panel_x + 10, y_offset))
             y_offset += 12
 
-            p95_text = self.small_font.render(
-                f"P95 Response: {p95_response:.2f}s", True, self.text_color
+            self._render_to(
+                surface,
+                small_font,
+                (label_x, y_offset),
+                f"P95 Response: {p95_response:.2f}s",
+                text_color,
             )
-            screen.blit(p95_text, (panel_x + 10, y_offset))
             y_offset += 12
 
-            total_text = self.small_font.render(
-                f"Total Processed: {total_requests}", True, self.text_color
+            total_text = self._text_format(
+                small_font, text_color, "Total Processed: {}", total_requests
             )
-            screen.blit(total_text, (panel_x + 10, y_offset))
+            queue((total_text, (label_x, y_offset)))
             y_offset += 20
 
-        rate_label = self.small_font.render("Users per second:", True, self.text_color)
-        screen.blit(rate_label, (panel_x + 10, y_offset))
+        rate_label = labels["rate_label"]
+        queue((rate_label, (label_x, y_offset)))
         y_offset += 20
 
-        rate_rect = pygame.Rect(panel_x + 10, y_offset, 100, self.input_height)
-        self.rate_input_rect = rate_rect
+        surface.blits(blit_list, doreturn=False)
 
-        if self.editing_field == "rate":
-            pygame.draw.rect(screen, (60, 60, 80), rate_rect)
-            pygame.draw.rect(screen, (0, 200, 255), rate_rect, 2)
-            display_text = self.input_text
-        else:
-            pygame.draw.rect(screen, (40, 40, 50), rate_rect)
-            pygame.draw.rect(screen, (100, 100, 100), rate_rect, 1)
-            display_text = f"{self.simulation_spawn_rate:.1f}"
-
-        rate_text = self.small_font.render(display_text, True, self.text_color)
-        screen.blit(rate_text, (rate_rect.x + 5, rate_rect.y + 5))
-
-        if self.editing_field == "rate":
-            cursor_x = rate_rect.x + 5 + rate_text.get_width()
-            if int(time.time() * 2) % 2:
-                pygame.draw.line(
-                    screen,
-                    self.text_color,
-                    (cursor_x, rate_rect.y + 3),
-                    (cursor_x, rate_rect.y + rate_rect.height - 3),
-                    1,
-                )
+        rate_rect = pygame.Rect(label_x, y_offset, 100, self.input_height)
+        self.rate_input_rect = rate_rect.move(self._simulation_panel.topleft)
+
+        editing = self.editing_field == "rate"
+        self._draw_input(
+            surface,
+            rate_rect,
+            editing,
+            self.input_text if editing else f"{self.simulation_spawn_rate:.1f}",
+        )
 
         y_offset += 35
 
-        duration_label = self.small_font.render(
-            "Duration (seconds):", True, self.text_color
-        )
-        screen.blit(duration_label, (panel_x + 10, y_offset))
+        duration_label = labels["duration_label"]
+        surface.blit(duration_label, (label_x, y_offset))
         y_offset += 20
 
-        duration_rect = pygame.Rect(panel_x + 10, y_offset, 100, self.input_height)
-        self.duration_input_rect = duration_rect
+        duration_rect = pygame.Rect(label_x, y_offset, 100, self.input_height)
+        self.duration_input_rect = duration_rect.move(self._simulation_panel.topleft)
 
-        if self.editing_field == "duration":
-            pygame.draw.rect(screen, (60, 60, 80), duration_rect)
-            pygame.draw.rect(screen, (0, 200, 255), duration_rect, 2)
-            display_text = self.input_text
-        else:
-            pygame.draw.rect(screen, (40, 40, 50), duration_rect)
-            pygame.draw.rect(screen, (100, 100, 100), duration_rect, 1)
-            display_text = f"{self.simulation_duration}"
-
-        duration_text = self.small_font.render(display_text, True, self.text_color)
-        screen.blit(duration_text, (duration_rect.x + 5, duration_rect.y + 5))
-
-        if self.editing_field == "duration":
-            cursor_x = duration_rect.x + 5 + duration_text.get_width()
-            if int(time.time() * 2) % 2:
-                pygame.draw.line(
-                    screen,
-                    self.text_color,
-                    (cursor_x, duration_rect.y + 3),
-                    (cursor_x, duration_rect.y + duration_rect.height - 3),
-                    1,
-                )
+        editing = self.editing_field == "duration"
+        self._draw_input(
+            surface,
+            duration_rect,
+            editing,
+            self.input_text if editing else f"{self.simulation_duration}",
+        )
+
+    def _draw_input(self, surface, rect, editing, display_text):
+        """Draw an input box with its text and, while editing, a blinking cursor"""
+        background, border, border_width = _INPUT_COLORS[editing]
+        pygame.draw.rect(surface, background, rect)
+        pygame.draw.rect(surface, border, rect, border_width)
 
-        y_offset += 40
+        text = self._text(self.small_font, display_text, self.text_color)
+        surface.blit(text, (rect.x + 5, rect.y + 5))
+
+        if editing and self._blink_on:
+            cursor_x = rect.x + 5 + text.get_width()
+            pygame.draw.line(
+                surface,
+                self.text_color,
+                (cursor_x, rect.y + 3),
+                (cursor_x, rect.y + rect.height - 3),
+                1,
+            )
 
     def handle_mouse_click(self, pos):
         """Handle mouse clicks for both simulation panel and server configuration"""
+        self.dirty = True
 
-        panel_x = self.width - self.simulation_panel_width - 20
-        panel_y = 100
-
-        config_panel_x = 220
-        config_panel_y = self.height - 290
-        config_panel_width = 500
-        config_panel_height = 680
+        config_panel = self._config_panel
+        simulation_panel = self._simulation_panel
 
-        in_config_panel = (
-            config_panel_x <= pos[0] <= config_panel_x + config_panel_width
-        )
+        in_config_panel = config_panel.left <= pos[0] <= config_panel.right
 
         in_simulation_panel = (
-            panel_x <= pos[0] <= self.width - 20
-            and panel_y <= pos[1] <= panel_y + self.height - 200
+            simulation_panel.left <= pos[0] <= simulation_panel.right
+            and simulation_panel.top <= pos[1] <= simulation_panel.bottom
         )
 
         if not (in_simulation_panel or in_config_panel):
@@ -1111,8 +1504,7 @@ class LoadBalancerVisualization:
 
         if in_simulation_panel:
             if (
-                hasattr(self, "rate_input_rect")
-                and self.rate_input_rect
+                self.rate_input_rect is not None
                 and self.rate_input_rect.collidepoint(pos)
             ):
                 self.editing_field = "rate"
@@ -1120,38 +1512,40 @@ class LoadBalancerVisualization:
                 return
 
             if (
-                hasattr(self, "duration_input_rect")
-                and self.duration_input_rect
+                self.duration_input_rect is not None
                 and self.duration_input_rect.collidepoint(pos)
             ):
                 self.editing_field = "duration"
                 self.input_text = f"{self.simulation_duration}"
                 return
 
-        if hasattr(self, "dropdown_rects"):
+        if self.dropdown_rects:
+            dropdowns = self.server_dropdowns
             for server_name, rects in self.dropdown_rects.items():
 
                 if rects["main"].collidepoint(pos):
 
-                    self.server_dropdowns[server_name]["open"] = (
-                        not self.server_dropdowns[server_name]["open"]
-                    )
+                    dropdowns[server_name]["open"] = not dropdowns[server_name]["open"]
 
-                    for other_name in self.server_dropdowns:
+                    for other_name in dropdowns:
                         if other_name != server_name:
-                            self.server_dropdowns[other_name]["open"] = False
+                            dropdowns[other_name]["open"] = False
                     return
 
+                if not dropdowns[server_name]["open"]:
+                    continue
+
                 for option in rects["options"]:
                     if option["rect"].collidepoint(pos):
 
                         server_type = option["type"]
                         self.update_server_type(server_name, server_type)
-                        self.server_dropdowns[server_name]["open"] = False
+                        dropdowns[server_name]["open"] = False
                         return
 
     def handle_text_input(self, text):
         """Handle text input for editable fields"""
+        self.dirty = True
         if self.editing_field and len(self.input_text) < 10:
 
             if text.isdigit() or (text == "." and "." not in self.input_text):
@@ -1187,6 +1581,7 @@ class LoadBalancerVisualization:
 
     def handle_keypress(self, key):
         """Handle keyboard input for system control"""
+        self.dirty = True
 
         if self.editing_field:
             self.handle_key_input(key)
@@ -1250,6 +1645,15 @@ class LoadBalancerVisualization:
 
     def draw(self, screen):
         """Main drawing method with all enhancements"""
+        self._frame += 1
+        self._blink_on = bool((self._frame // self.CURSOR_BLINK_FRAMES) & 1)
+
+        if not pygame.display.get_active():
+            # Minimized or hidden: nothing is visible, so compose nothing and
+            # force the cached panel to rebuild once the window is shown again.
+            self._panel_state = None
+            return
+
         screen.fill(self.bg_color)
 
         self.draw_header(screen)
@@ -1258,30 +1662,33 @@ class LoadBalancerVisualization:
 
         self.draw_server_configuration(screen)
 
+        lb_position = (self.load_balancer.x, self.load_balancer.y)
         for server in self.servers:
-            line_color = (100, 100, 100)
-            if server.status == ServerStatus.FAILED:
-                line_color = (100, 50, 50)
-            elif server.status == ServerStatus.OVERLOADED:
-                line_color = (150, 100, 50)
-            elif server.active_connections > 0:
-                intensity = min(255, 100 + (server.active_connections * 30))
-                line_color = (intensity, 100, 100)
-
-            line_width = 2 + min(3, server.active_connections)
+            connections = server.active_connections
+            line_color = _LINE_STATUS_COLORS.get(server.status)
+            if line_color is None:
+                line_color = (
+                    (min(255, 100 + connections * 30), 100, 100)
+                    if connections > 0
+                    else (100, 100, 100)
+                )
+
             pygame.draw.line(
                 screen,
                 line_color,
-                (self.load_balancer.x, self.load_balancer.y),
+                lb_position,
                 (server.x, server.y),
-                line_width,
+                2 + min(3, connections),
             )
 
         for server in self.servers:
             server.draw(screen, self.small_font)
 
+        # Queue every user's labels and blit them in one call above all bodies.
+        text_blits = []
         for user in self.users:
-            user.draw(screen)
+            user.draw(screen, text_blits)
+        screen.blits(text_blits, doreturn=False)
 
         self.load_balancer.draw(screen)
 
@@ -1289,12 +1696,13 @@ class LoadBalancerVisualization:
             cycle_text = (
                 f"Auto-cycling algorithms every {self.algorithm_cycle_interval}s"
             )
-            cycle_surface = self.small_font.render(cycle_text, True, (255, 255, 0))
+            cycle_surface = self._text(self.small_font, cycle_text, (255, 255, 0))
             screen.blit(cycle_surface, (self.width - 350, 50))
 
         self.draw_performance_panel(screen)
 
-        self.draw_simulation_panel(screen)
+        if self._simulation_panel.colliderect(screen.get_rect()):
+            self.draw_simulation_panel(screen)
 
     def update_server_statistics(self):
         """Update comprehensive server-based statistics"""
@@ -1311,6 +1719,8 @@ class LoadBalancerVisualization:
                     "total_response_time": 0.0,
                     "uptime_start": current_time,
                     "downtime_periods": [],
+                    "closed_downtime": 0.0,
+                    "downtime_open_start": None,
                     "peak_connections": 0,
                     "cpu_utilization_history": deque(maxlen=100),
                     "memory_utilization_history": deque(maxlen=100),
@@ -1324,6 +1734,7 @@ class LoadBalancerVisualization:
                     stats["downtime_periods"].append(
                         {"start": current_time, "end": None, "reason": "failure"}
                     )
+                    stats["downtime_open_start"] = current_time
                 elif stats["last_status"] == ServerStatus.FAILED:
 
                     if (
@@ -1331,6 +1742,10 @@ class LoadBalancerVisualization:
                         and stats["downtime_periods"][-1]["end"] is None
                     ):
                         stats["downtime_periods"][-1]["end"] = current_time
+                        stats["closed_downtime"] += (
+                            current_time - stats["downtime_open_start"]
+                        )
+                        stats["downtime_open_start"] = None
 
                 stats["last_status"] = server.status
 
@@ -1344,10 +1759,7 @@ class LoadBalancerVisualization:
             type_stats = self.server_type_analytics[server_type]
 
             uptime_duration = current_time - stats["uptime_start"]
-            downtime_total = sum(
-                (period["end"] or current_time) - period["start"]
-                for period in stats["downtime_periods"]
-            )
+            downtime_total = self._total_downtime(stats, current_time)
             uptime_percentage = (
                 ((uptime_duration - downtime_total) / uptime_duration) * 100
                 if uptime_duration > 0
@@ -1361,13 +1773,24 @@ class LoadBalancerVisualization:
                     "response_times": deque(maxlen=100),
                     "connection_counts": deque(maxlen=100),
                     "error_rates": deque(maxlen=50),
+                    "last_response_count": 0,
                 }
 
             perf_history = self.server_performance_history[server_name]
             perf_history["load_scores"].append(
                 server.load_score if server.load_score != float("inf") else 1.0
             )
-            perf_history["response_times"].extend(list(server.response_times)[-10:])
+            new_responses = min(
+                server.response_count - perf_history["last_response_count"],
+                len(server.response_times),
+            )
+            if new_responses > 0:
+                recent = list(
+                    itertools.islice(reversed(server.response_times), new_responses)
+                )
+                recent.reverse()
+                perf_history["response_times"].extend(recent)
+            perf_history["last_response_count"] = server.response_count
             perf_history["connection_counts"].append(server.active_connections)
 
             error_rate = 1.0 if server.status == ServerStatus.FAILED else 0.0
@@ -1383,9 +1806,16 @@ class LoadBalancerVisualization:
     def update_traffic_analytics(self):
         """Update traffic pattern analytics"""
         current_time = time.time()
-        current_hour = int(time.localtime(current_time).tm_hour)
+        if current_time >= self._hour_ends_at:
+            local = time.localtime(current_time)
+            self._current_hour = local.tm_hour
+            self._hour_ends_at = (
+                math.floor(current_time) - local.tm_min * 60 - local.tm_sec + 3600
+            )
 
-        self.traffic_analytics["hourly_distribution"][current_hour] += len(self.users)
+        self.traffic_analytics["hourly_distribution"][self._current_hour] += len(
+            self.users
+        )
 
         current_concurrent = len(self.users)
         if current_concurrent > self.traffic_analytics["peak_concurrent_users"]:
@@ -1422,8 +1852,10 @@ class LoadBalancerVisualization:
                 "total_requests": 0,
                 "successful_requests": 0,
                 "avg_response_time": 0.0,
-                "server_utilization": [],
-                "load_distribution_variance": [],
+                "server_utilization_sum": 0.0,
+                "server_utilization_n": 0,
+                "load_variance_sum": 0.0,
+                "load_variance_n": 0,
                 "start_time": current_time,
             }
 
@@ -1432,24 +1864,37 @@ class LoadBalancerVisualization:
         algo_stats["total_requests"] = self.load_balancer.total_requests_received
         algo_stats["successful_requests"] = self.load_balancer.total_requests_routed
 
-        server_loads = [
-            s.load_score for s in self.servers if s.load_score != float("inf")
-        ]
-        if server_loads:
-            load_variance = np.var(server_loads)
-            algo_stats["load_distribution_variance"].append(load_variance)
-
-        avg_utilization = np.mean([s.cpu_utilization for s in self.servers])
-        algo_stats["server_utilization"].append(avg_utilization)
+        load_count = 0
+        load_mean = load_m2 = 0.0
+        total_utilization = 0.0
+        for server in self.servers:
+            load_score = server.load_score
+            if load_score != float("inf"):
+                load_count += 1
+                delta = load_score - load_mean
+                load_mean += delta / load_count
+                load_m2 += delta * (load_score - load_mean)
+            total_utilization += server.cpu_utilization
+
+        if load_count:
+            algo_stats["load_variance_sum"] += load_m2 / load_count
+            algo_stats["load_variance_n"] += 1
+
+        avg_utilization = total_utilization / len(self.servers) if self.servers else 0.0
+        algo_stats["server_utilization_sum"] += avg_utilization
+        algo_stats["server_utilization_n"] += 1
 
     def update_system_resource_tracking(self):
         """Update system-wide resource utilization tracking"""
         current_time = time.time()
 
-        total_cpu_usage = sum(s.current_cpu_usage for s in self.servers)
-        total_memory_usage = sum(s.current_memory_usage for s in self.servers)
-        total_cpu_capacity = sum(s.cpu_cores for s in self.servers)
-        total_memory_capacity = sum(s.memory_gb for s in self.servers)
+        total_cpu_usage = total_memory_usage = 0.0
+        total_cpu_capacity = total_memory_capacity = 0
+        for server in self.servers:
+            total_cpu_usage += server.current_cpu_usage
+            total_memory_usage += server.current_memory_usage
+            total_cpu_capacity += server.cpu_cores
+            total_memory_capacity += server.memory_gb
 
         system_cpu_percentage = (
             (total_cpu_usage / total_cpu_capacity) * 100
@@ -1462,28 +1907,45 @@ class LoadBalancerVisualization:
             else 0
         )
 
-        self.system_resource_history["cpu_usage"].append(system_cpu_percentage)
-        self.system_resource_history["memory_usage"].append(system_memory_percentage)
-
-        if len(self.system_resource_history["network_throughput"]) > 0:
-            recent_requests = len(
-                [
-                    u
-                    for u in self.users
-                    if hasattr(u, "spawn_time") and current_time - u.spawn_time < 1.0
-                ]
-            )
-            self.system_resource_history["network_throughput"].append(recent_requests)
-        else:
-            self.system_resource_history["network_throughput"].append(0)
+        recent_requests = 0
+        if self._resource_count > 0:
+            # self.users stays in spawn order, so only the newest tail can match.
+            spawned_after = current_time - 1.0
+            for user in reversed(self.users):
+                if user.spawn_time <= spawned_after:
+                    break
+                recent_requests += 1
+
+        recent_latency = self.performance_monitor.recent_response_mean(10)
+
+        self._push_resource(
+            system_cpu_percentage,
+            system_memory_percentage,
+            recent_requests,
+            recent_latency,
+        )
 
-        if self.performance_monitor.metrics["response_times"]:
-            recent_latency = np.mean(
-                list(self.performance_monitor.metrics["response_times"])[-10:]
-            )
-            self.system_resource_history["request_latency"].append(recent_latency)
+    def _push_resource(self, cpu_usage, memory_usage, throughput, latency):
+        """Write one sample of each system resource series into the ring buffer"""
+        head = self._resource_head
+        ring = self._resource_ring
+        ring[0, head] = cpu_usage
+        ring[1, head] = memory_usage
+        ring[2, head] = throughput
+        ring[3, head] = latency
+        self._resource_head = (head + 1) % self.RESOURCE_HISTORY_SIZE
+        if self._resource_count < self.RESOURCE_HISTORY_SIZE:
+            self._resource_count += 1
+
+    @property
+    def system_resource_history(self):
+        """Resource series in chronological order, keyed by series name"""
+        ring = self._resource_ring
+        if self._resource_count < self.RESOURCE_HISTORY_SIZE:
+            ordered = ring[:, : self._resource_count]
         else:
-            self.system_resource_history["request_latency"].append(0)
+            ordered = np.roll(ring, -self._resource_head, axis=1)
+        return dict(zip(self.RESOURCE_SERIES, ordered))
 
     def get_comprehensive_server_stats(self):
         """Get detailed server statistics for display"""
@@ -1494,8 +1956,12 @@ class LoadBalancerVisualization:
             server_stats = self.server_stats.get(server_name, {})
             perf_history = self.server_performance_history.get(server_name, {})
 
-            cpu_history = server_stats.get("cpu_utilization_history", [])
-            memory_history = server_stats.get("memory_utilization_history", [])
+            avg_cpu, peak_cpu = _mean_and_peak(
+                server_stats.get("cpu_utilization_history", ())
+            )
+            avg_memory, peak_memory = _mean_and_peak(
+                server_stats.get("memory_utilization_history", ())
+            )
 
             stats[server_name] = {
                 "status": server.status.value,
@@ -1509,28 +1975,28 @@ class LoadBalancerVisualization:
                 ),
                 "avg_response_time": server.avg_response_time,
                 "peak_connections": server_stats.get("peak_connections", 0),
-                "avg_cpu_utilization": np.mean(cpu_history) if cpu_history else 0,
-                "peak_cpu_utilization": max(cpu_history) if cpu_history else 0,
-                "avg_memory_utilization": (
-                    np.mean(memory_history) if memory_history else 0
-                ),
-                "peak_memory_utilization": max(memory_history) if memory_history else 0,
+                "avg_cpu_utilization": avg_cpu,
+                "peak_cpu_utilization": peak_cpu,
+                "avg_memory_utilization": avg_memory,
+                "peak_memory_utilization": peak_memory,
                 "uptime_percentage": self._calculate_uptime_percentage(server_name),
                 "failure_count": len(server_stats.get("downtime_periods", [])),
-                "load_variance": (
-                    np.var(perf_history.get("load_scores", [0]))
-                    if perf_history.get("load_scores")
-                    else 0
-                ),
-                "connection_stability": (
-                    np.std(perf_history.get("connection_counts", [0]))
-                    if perf_history.get("connection_counts")
-                    else 0
+                "load_variance": _variance(perf_history.get("load_scores", ())),
+                "connection_stability": math.sqrt(
+                    _variance(perf_history.get("connection_counts", ()))
                 ),
             }
 
         return stats
 
+    @staticmethod
+    def _total_downtime(stats, current_time):
+        """Closed downtime plus the currently open period, without rescanning"""
+        open_start = stats["downtime_open_start"]
+        if open_start is None:
+            return stats["closed_downtime"]
+        return stats["closed_downtime"] + (current_time - open_start)
+
     def _calculate_uptime_percentage(self, server_name):
         """Calculate uptime percentage for a server"""
         if server_name not in self.server_stats:
@@ -1539,16 +2005,12 @@ class LoadBalancerVisualization:
         current_time = time.time()
         stats = self.server_stats[server_name]
         uptime_start = stats.get("uptime_start", current_time)
-        downtime_periods = stats.get("downtime_periods", [])
 
         total_duration = current_time - uptime_start
         if total_duration <= 0:
             return 100.0
 
-        total_downtime = sum(
-            (period["end"] or current_time) - period["start"]
-            for period in downtime_periods
-        )
+        total_downtime = self._total_downtime(stats, current_time)
 
         uptime_percentage = ((total_duration - total_downtime) / total_duration) * 100
         return max(0, min(100, uptime_percentage))
@@ -1563,14 +2025,14 @@ class LoadBalancerVisualization:
                     stats["successful_requests"] / stats["total_requests"]
                 ) * 100
                 avg_server_utilization = (
-                    np.mean(stats["server_utilization"])
-                    if stats["server_utilization"]
-                    else 0
+                    stats["server_utilization_sum"] / stats["server_utilization_n"]
+                    if stats["server_utilization_n"]
+                    else 0.0
                 )
                 avg_load_variance = (
-                    np.mean(stats["load_distribution_variance"])
-                    if stats["load_distribution_variance"]
-                    else 0
+                    stats["load_variance_sum"] / stats["load_variance_n"]
+                    if stats["load_variance_n"]
+                    else 0.0
                 )
 
                 comparison[algorithm] = {
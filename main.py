@@ -1,6 +1,37 @@
 import pygame
 import sys
+import time
 from load_balancer_viz import LoadBalancerVisualization
+from upstream_server import snapshot_servers
+
+_report_cache = {}
+
+_BANNER = """\
+🚀 Advanced Load Balancer System Started
+============================================================
+Features:
+• 7 Load Balancing Algorithms (Round Robin, Least Connections, etc.)
+• 4 Server Types (Standard, High-Performance, Memory/CPU Optimized)
+• 4 User Types (Light, Standard, Heavy, Burst)
+• 4 Traffic Patterns (Steady, Wave, Spike, Random)
+• Real-time Performance Monitoring
+• Server Failure Simulation
+• Resource-based Request Routing
+• Comprehensive Metrics Tracking
+• Detailed Report Generation
+============================================================
+
+Controls:
+SPACE      - Spawn single user
+B          - Spawn burst traffic (8 users)
+A          - Toggle auto algorithm cycling
+1-7        - Switch algorithms (Round Robin, Least Conn, etc.)
+Q/W/E/R    - Traffic patterns (Steady/Wave/Spike/Random)
+F          - Toggle fullscreen
+P          - Print performance report
+S          - Start/Stop simulation
+ESC        - Quit and save reports
+============================================================"""
 
 
 def main():
@@ -9,6 +40,7 @@ def main():
     display_info = pygame.display.Info()
     WIDTH, HEIGHT = display_info.current_w, display_info.current_h
     FPS = 60
+    BACKGROUND_FPS = 5
 
     screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.NOFRAME)
     pygame.display.set_caption("Load Balancer System")
@@ -20,74 +52,84 @@ def main():
         "screen_resolution": f"{WIDTH}x{HEIGHT}",
         "initial_algorithm": viz.load_balancer.algorithm.value,
         "server_count": len(viz.servers),
-        "server_types": [s.server_type.value for s in viz.servers],
+        "server_types": list(viz.server_type_values),
         "traffic_pattern": viz.current_traffic_pattern.name,
         "auto_algorithm_cycling": viz.algorithm_cycle_enabled,
     }
     viz.report_generator.initialize_simulation(simulation_config)
 
-    print("🚀 Advanced Load Balancer System Started")
-    print("=" * 60)
-    print("Features:")
-    print("• 7 Load Balancing Algorithms (Round Robin, Least Connections, etc.)")
-    print("• 4 Server Types (Standard, High-Performance, Memory/CPU Optimized)")
-    print("• 4 User Types (Light, Standard, Heavy, Burst)")
-    print("• 4 Traffic Patterns (Steady, Wave, Spike, Random)")
-    print("• Real-time Performance Monitoring")
-    print("• Server Failure Simulation")
-    print("• Resource-based Request Routing")
-    print("• Comprehensive Metrics Tracking")
-    print("• Detailed Report Generation")
-    print("=" * 60)
-    print("\nControls:")
-    print("SPACE      - Spawn single user")
-    print("B          - Spawn burst traffic (8 users)")
-    print("A          - Toggle auto algorithm cycling")
-    print("1-7        - Switch algorithms (Round Robin, Least Conn, etc.)")
-    print("Q/W/E/R    - Traffic patterns (Steady/Wave/Spike/Random)")
-    print("F          - Toggle fullscreen")
-    print("P          - Print performance report")
-    print("S          - Start/Stop simulation")
-    print("ESC        - Quit and save reports")
-    print("=" * 60)
+    print(_BANNER)
 
     fullscreen = False
     running = True
+    focused = True
+
+    def on_quit(event):
+        nonlocal running
+        running = False
+
+    def on_focus_change(event):
+        nonlocal focused
+        focused = event.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED)
+        viz.dirty = True
+
+    def toggle_fullscreen(event):
+        nonlocal fullscreen, screen
+        fullscreen = not fullscreen
+        flags = pygame.FULLSCREEN if fullscreen else pygame.NOFRAME
+        screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+        viz.dirty = True
+
+    key_dispatch = {
+        pygame.K_ESCAPE: on_quit,
+        pygame.K_f: toggle_fullscreen,
+        pygame.K_p: lambda event: print_performance_report(viz),
+    }
+
+    def on_keydown(event):
+        handler = key_dispatch.get(event.key)
+        if handler:
+            handler(event)
+        else:
+            viz.handle_keypress(event.key)
+
+    def on_mouse_down(event):
+        if event.button == 1:
+            viz.handle_mouse_click(event.pos)
+
+    dispatch = {
+        pygame.QUIT: on_quit,
+        pygame.KEYDOWN: on_keydown,
+        pygame.TEXTINPUT: lambda event: viz.handle_text_input(event.text),
+        pygame.MOUSEBUTTONDOWN: on_mouse_down,
+        pygame.WINDOWFOCUSGAINED: on_focus_change,
+        pygame.WINDOWFOCUSLOST: on_focus_change,
+        pygame.WINDOWRESTORED: on_focus_change,
+        pygame.WINDOWMINIMIZED: on_focus_change,
+    }
 
     try:
+        ticks = 1
         while running:
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                    elif event.key == pygame.K_f:
-                        fullscreen = not fullscreen
-                        if fullscreen:
-                            screen = pygame.display.set_mode(
-                                (WIDTH, HEIGHT), pygame.FULLSCREEN
-                            )
-                        else:
-                            screen = pygame.display.set_mode(
-                                (WIDTH, HEIGHT), pygame.NOFRAME
-                            )
-                    elif event.key == pygame.K_p:
-                        print_performance_report(viz)
-                    else:
-                        viz.handle_keypress(event.key)
-                elif event.type == pygame.TEXTINPUT:
-                    viz.handle_text_input(event.text)
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:
-                        viz.handle_mouse_click(event.pos)
-
-            viz.update()
-
-            viz.draw(screen)
-
-            pygame.display.flip()
-            clock.tick(FPS)
+                handler = dispatch.get(event.type)
+                if handler:
+                    handler(event)
+
+            viz.update(ticks)
+
+            # Idle frames only differ by the ambient pulses, so present them at
+            # a reduced rate; update() keeps running every tick for timing.
+            if viz.dirty:
+                viz.draw(screen)
+                pygame.display.flip()
+                viz.dirty = False
+            # Users and request processing advance per tick, so only an idle
+            # background window slows down; the next update then covers the
+            # skipped ticks of the server failure and recovery clocks.
+            frame_rate = FPS if focused or not viz.is_idle() else BACKGROUND_FPS
+            ticks = FPS // frame_rate
+            clock.tick(frame_rate)
 
     except KeyboardInterrupt:
         print("\nShutdown requested by user...")
@@ -102,7 +144,9 @@ def main():
             viz.report_generator.finalize_simulation()
 
             viz.report_generator.collect_server_metrics(viz.servers)
-            viz.report_generator.collect_user_analytics(viz.completed_users, viz.users)
+            viz.report_generator.collect_user_analytics(
+                viz.completed_users, viz.users, viz.completion_stats
+            )
             viz.report_generator.collect_load_balancer_performance(viz.load_balancer)
             viz.report_generator.collect_system_statistics(viz)
 
@@ -128,77 +172,98 @@ def main():
 
 def print_performance_report(viz):
     """Print detailed performance report to console"""
-    print("\n" + "=" * 80)
-    print("LIVE PERFORMANCE REPORT")
-    print("=" * 80)
+    key = (
+        int(time.monotonic()),
+        viz.load_balancer.algorithm,
+        viz.total_spawned_users,
+    )
+    report = _report_cache.get(key)
+    if report is None:
+        report = _format_performance_report(viz)
+        _report_cache.clear()
+        _report_cache[key] = report
+    sys.stdout.write(report + "\n")
+    sys.stdout.flush()
+
+
+def _format_performance_report(viz):
+    """Build the live performance report text"""
+    lines = []
+    emit = lines.append
+    emit("\n" + "=" * 80)
+    emit("LIVE PERFORMANCE REPORT")
+    emit("=" * 80)
 
     stats = viz.get_system_stats()
-    print(f"System Uptime: {stats['uptime']:.2f} seconds")
-    print(f"Current Algorithm: {stats['algorithm']}")
-    print(f"Traffic Pattern: {stats['traffic_pattern']}")
-    print(f"Active Users: {stats['active_users']}")
-    print(f"Total Spawned: {stats['total_spawned']}")
-    print(f"Success Rate: {stats['success_rate']:.1f}%")
-    print(f"Healthy Servers: {stats['healthy_servers']}")
-
-    print("\nSERVER STATUS:")
-    print("-" * 40)
-    for server in viz.servers:
-        info = server.get_server_info()
-        print(f"{info['name']} ({info['type']}):")
-        print(f"  Status: {info['status']}")
-        print(f"  Connections: {info['connections']}")
-        print(f"  CPU: {info['cpu_usage']} | Memory: {info['memory_usage']}")
-        print(f"  Load Score: {info['load_score']}")
-        print(f"  Avg Response: {info['avg_response_time']}")
-        print(f"  Total Requests: {info['total_requests']}")
-
-    print("\nLOAD BALANCER PERFORMANCE:")
-    print("-" * 40)
+    emit(f"System Uptime: {stats['uptime']:.2f} seconds")
+    emit(f"Current Algorithm: {stats['algorithm']}")
+    emit(f"Traffic Pattern: {stats['traffic_pattern']}")
+    emit(f"Active Users: {stats['active_users']}")
+    emit(f"Total Spawned: {stats['total_spawned']}")
+    emit(f"Success Rate: {stats['success_rate']:.1f}%")
+    emit(f"Healthy Servers: {stats['healthy_servers']}")
+
+    emit("\nSERVER STATUS:")
+    emit("-" * 40)
+    for name, server_type, status, cpu, memory, connections, load, rt, requests in zip(
+        *snapshot_servers(viz.servers)
+    ):
+        emit(f"{name} ({server_type}):")
+        emit(f"  Status: {status}")
+        emit(f"  Connections: {connections}")
+        emit(f"  CPU: {cpu:.1f}% | Memory: {memory:.1f}%")
+        emit(f"  Load Score: {load:.3f}")
+        emit(f"  Avg Response: {rt:.2f}s")
+        emit(f"  Total Requests: {requests}")
+
+    emit("\nLOAD BALANCER PERFORMANCE:")
+    emit("-" * 40)
     lb_stats = viz.load_balancer.get_algorithm_stats()
     if lb_stats:
-        print(f"Algorithm: {lb_stats['algorithm']}")
-        print(f"Success Rate: {lb_stats['success_rate']:.1%}")
-        print(f"Total Decisions: {lb_stats['total_decisions']}")
-        print(f"Requests Received: {lb_stats['requests_received']}")
-        print(f"Requests Routed: {lb_stats['requests_routed']}")
-        print(f"Dropped Requests: {lb_stats['dropped_requests']}")
-
-    print("\nPERFORMANCE METRICS:")
-    print("-" * 40)
+        emit(f"Algorithm: {lb_stats['algorithm']}")
+        emit(f"Success Rate: {lb_stats['success_rate']:.1%}")
+        emit(f"Total Decisions: {lb_stats['total_decisions']}")
+        emit(f"Requests Received: {lb_stats['requests_received']}")
+        emit(f"Requests Routed: {lb_stats['requests_routed']}")
+        emit(f"Dropped Requests: {lb_stats['dropped_requests']}")
+
+    emit("\nPERFORMANCE METRICS:")
+    emit("-" * 40)
     perf_summary = viz.performance_monitor.get_performance_summary()
     if perf_summary:
-        print(f"Average Response Time: {perf_summary.get('avg_response_time', 0):.2f}s")
-        print(f"P95 Response Time: {perf_summary.get('p95_response_time', 0):.2f}s")
-        print(f"P99 Response Time: {perf_summary.get('p99_response_time', 0):.2f}s")
-        print(f"Total Processed Requests: {perf_summary.get('total_requests', 0)}")
+        emit(f"Average Response Time: {perf_summary.get('avg_response_time', 0):.2f}s")
+        emit(f"P95 Response Time: {perf_summary.get('p95_response_time', 0):.2f}s")
+        emit(f"P99 Response Time: {perf_summary.get('p99_response_time', 0):.2f}s")
+        emit(f"Total Processed Requests: {perf_summary.get('total_requests', 0)}")
 
         if "user_type_breakdown" in perf_summary:
-            print("\nUSER TYPE BREAKDOWN:")
+            emit("\nUSER TYPE BREAKDOWN:")
             for user_type, type_stats in perf_summary["user_type_breakdown"].items():
-                print(f"  {user_type.title()}:")
-                print(f"    Count: {type_stats['count']}")
-                print(f"    Success Rate: {type_stats['success_rate']:.1%}")
-                print(f"    Avg Response: {type_stats['avg_response_time']:.2f}s")
+                emit(f"  {user_type.title()}:")
+                emit(f"    Count: {type_stats['count']}")
+                emit(f"    Success Rate: {type_stats['success_rate']:.1%}")
+                emit(f"    Avg Response: {type_stats['avg_response_time']:.2f}s")
 
     if viz.simulation_running:
-        print("\nSIMULATION STATUS:")
-        print("-" * 40)
-        print(f"Status: RUNNING")
-        print(f"Elapsed: {viz.simulation_elapsed:.1f}s / {viz.simulation_duration}s")
-        print(f"Spawn Rate: {viz.simulation_spawn_rate:.1f} users/second")
-        print(f"Total Users: {viz.simulation_total_users}")
-        print(f"Success: {viz.simulation_success_users}")
-        print(f"Failed: {viz.simulation_failed_users}")
+        emit("\nSIMULATION STATUS:")
+        emit("-" * 40)
+        emit(f"Status: RUNNING")
+        emit(f"Elapsed: {viz.simulation_elapsed:.1f}s / {viz.simulation_duration}s")
+        emit(f"Spawn Rate: {viz.simulation_spawn_rate:.1f} users/second")
+        emit(f"Total Users: {viz.simulation_total_users}")
+        emit(f"Success: {viz.simulation_success_users}")
+        emit(f"Failed: {viz.simulation_failed_users}")
         if viz.simulation_total_users > 0:
             sim_success_rate = (
                 viz.simulation_success_users / viz.simulation_total_users
             ) * 100
-            print(f"Simulation Success Rate: {sim_success_rate:.1f}%")
+            emit(f"Simulation Success Rate: {sim_success_rate:.1f}%")
     else:
-        print("\nSIMULATION STATUS: STOPPED")
+        emit("\nSIMULATION STATUS: STOPPED")
+
+    emit("=" * 80)
 
-    print("=" * 80)
+    return "\n".join(lines)
 
 
 if __name__ == "__main__":
@@ -1,62 +1,180 @@
 import time
 import numpy as np
 from collections import deque
+from user import USER_TYPE_IDS
+
+
+class _P2Quantile:
+    """Streaming quantile estimate using the P-squared algorithm (five markers)"""
+
+    def __init__(self, quantile):
+        self.quantile = quantile
+        self._heights = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value):
+        """Fold one observation into the marker heights"""
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        positions = self._positions
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        desired = self._desired
+        for i in range(5):
+            desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            offset = desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = heights[i] + step * (
+                        heights[i + step] - heights[i]
+                    ) / (positions[i + step] - positions[i])
+                heights[i] = candidate
+                positions[i] += step
+
+    def _parabolic(self, i, step):
+        heights = self._heights
+        positions = self._positions
+        span = positions[i + 1] - positions[i - 1]
+        upper = (positions[i] - positions[i - 1] + step) * (
+            heights[i + 1] - heights[i]
+        ) / (positions[i + 1] - positions[i])
+        lower = (positions[i + 1] - positions[i] - step) * (
+            heights[i] - heights[i - 1]
+        ) / (positions[i] - positions[i - 1])
+        return heights[i] + step / span * (upper + lower)
+
+    @property
+    def value(self):
+        """Current quantile estimate, exact until five observations are seen"""
+        if len(self._heights) < 5:
+            return float(np.percentile(self._heights, self.quantile * 100))
+        return self._heights[2]
 
 
 class PerformanceMonitor:
     """Monitors and tracks system performance metrics"""
 
+    RESPONSE_HISTORY_SIZE = 10000
+
     def __init__(self):
         self.metrics = {
-            "response_times": deque(maxlen=10000),
             "success_rates": deque(maxlen=100),
             "server_utilizations": deque(maxlen=100),
             "algorithm_performance": {},
-            "user_type_stats": {},
         }
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+
+        self._response_ring = np.empty(self.RESPONSE_HISTORY_SIZE, dtype=np.float32)
+        self._response_head = 0
+        self._response_count = 0
+        self._response_sum = 0.0
+        # Unlike the ring above, the quantile estimators never drop samples:
+        # they summarize every completion since startup.
+        self._p95 = _P2Quantile(0.95)
+        self._p99 = _P2Quantile(0.99)
+        self._completion_seq = 0
+        self._summary_key = None
+        self._summary_cache = {}
+
+        type_count = len(USER_TYPE_IDS)
+        self._type_counts = [0] * type_count
+        self._type_successes = [0] * type_count
+        self._type_response_sums = [0.0] * type_count
 
     def record_user_completion(self, user):
         """Record metrics when a user completes (success or failure)"""
         response_time = user.get_response_time()
-        self.metrics["response_times"].append(response_time)
-
-        user_type = user.user_type.value
-        if user_type not in self.metrics["user_type_stats"]:
-            self.metrics["user_type_stats"][user_type] = {
-                "count": 0,
-                "successes": 0,
-                "total_response_time": 0,
-            }
-
-        stats = self.metrics["user_type_stats"][user_type]
-        stats["count"] += 1
-        stats["total_response_time"] += response_time
+        self._completion_seq += 1
+        ring = self._response_ring
+        head = self._response_head
+        if self._response_count == ring.size:
+            self._response_sum -= float(ring[head])
+        else:
+            self._response_count += 1
+        ring[head] = response_time
+        self._response_sum += float(ring[head])
+        self._response_head = (head + 1) % ring.size
+        self._p95.add(response_time)
+        self._p99.add(response_time)
+
+        index = user.user_type_id
+        self._type_counts[index] += 1
+        self._type_response_sums[index] += response_time
         if not user.failed:
-            stats["successes"] += 1
+            self._type_successes[index] += 1
+
+    def response_times(self):
+        """Retained response times, oldest first"""
+        ring = self._response_ring
+        if self._response_count < ring.size:
+            return ring[: self._response_count].copy()
+        head = self._response_head
+        return np.concatenate((ring[head:], ring[:head]))
+
+    def recent_response_mean(self, count):
+        """Mean of the newest `count` response times, 0 when none are recorded"""
+        ring = self._response_ring
+        head = self._response_head
+        recent = ring[max(0, head - count) : head]
+        if len(recent) < count and self._response_count == ring.size:
+            recent = np.concatenate((ring[head - count :], recent))
+        return float(recent.mean()) if len(recent) else 0
 
     def get_performance_summary(self):
-        """Get comprehensive performance summary"""
-        if not self.metrics["response_times"]:
+        """Performance summary; p95/p99 span all completions, the rest the ring"""
+        response_count = self._response_count
+        if not response_count:
             return {}
 
-        response_times = list(self.metrics["response_times"])
+        if self._summary_key == self._completion_seq:
+            # Nothing completed since the last call; only the uptime has moved.
+            summary = dict(self._summary_cache)
+            summary["uptime"] = time.monotonic() - self.start_time
+            return summary
 
+        # avg_response_time and total_requests cover the retained ring of
+        # RESPONSE_HISTORY_SIZE samples; the percentiles cover all completions.
         summary = {
-            "avg_response_time": np.mean(response_times),
-            "p95_response_time": np.percentile(response_times, 95),
-            "p99_response_time": np.percentile(response_times, 99),
-            "total_requests": len(response_times),
-            "uptime": time.time() - self.start_time,
+            "avg_response_time": self._response_sum / response_count,
+            "p95_response_time": self._p95.value,
+            "p99_response_time": self._p99.value,
+            "total_requests": response_count,
+            "uptime": time.monotonic() - self.start_time,
         }
 
         summary["user_type_breakdown"] = {}
-        for user_type, stats in self.metrics["user_type_stats"].items():
-            if stats["count"] > 0:
-                summary["user_type_breakdown"][user_type] = {
-                    "count": stats["count"],
-                    "success_rate": stats["successes"] / stats["count"],
-                    "avg_response_time": stats["total_response_time"] / stats["count"],
+        for user_type, index in USER_TYPE_IDS.items():
+            count = self._type_counts[index]
+            if count > 0:
+                summary["user_type_breakdown"][user_type.value] = {
+                    "count": count,
+                    "success_rate": self._type_successes[index] / count,
+                    "avg_response_time": self._type_response_sums[index] / count,
                 }
 
-        return summary
+        self._summary_key = self._completion_seq
+        self._summary_cache = summary
+        return dict(summary)
@@ -3,12 +3,116 @@ import csv
 import time
 import os
 from datetime import datetime
-from collections import defaultdict
+from functools import lru_cache
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from user import UserType, AttackType
-from upstream_server import ServerType, ServerStatus
+from user import USER_TYPE_IDS, UserType, AttackType
+from upstream_server import ServerType, ServerStatus, snapshot_servers
 from load_balancer import LoadBalancingAlgorithm
 
+_NAUGHTY_ID = USER_TYPE_IDS[UserType.NAUGHTY]
+
+# Report files are written whole; one large buffer turns them into a few syscalls.
+_REPORT_BUFFER_SIZE = 1 << 20
+
+_SERVER_ROW_HTML = """
+                    <tr>
+                        <td>{}</td>
+                        <td>{}</td>
+                        <td class="status-{}">{}</td>
+                        <td>{}</td>
+                        <td>{:.1f}%</td>
+                        <td>{:.1f}%</td>
+                        <td>{:.2f}s</td>
+                        <td>{:.1f}/100</td>
+                    </tr>"""
+
+_LB_HTML = """
+        <div class="section">
+            <h2>Load Balancer Performance</h2>
+            <div class="metric-grid">
+                <div class="metric-card">
+                    <div class="metric-value">{total_received}</div>
+                    <div class="metric-label">Total Requests Received</div>
+                </div>
+                <div class="metric-card">
+                    <div class="metric-value">{total_routed}</div>
+                    <div class="metric-label">Successfully Routed</div>
+                </div>
+                <div class="metric-card">
+                    <div class="metric-value">{dropped_requests}</div>
+                    <div class="metric-label">Dropped Requests</div>
+                </div>
+                <div class="metric-card">
+                    <div class="metric-value">{routing_success_rate:.1%}</div>
+                    <div class="metric-label">Routing Success Rate</div>
+                </div>
+            </div>
+        </div>"""
+
+_SUMMARY_TEXT = """
+LOAD BALANCER SIMULATION SUMMARY REPORT
+========================================
+
+Simulation Information:
+- Simulation ID: {simulation_id}
+- Start Time: {start_time}
+- End Time: {end_time}
+- Duration: {duration_seconds:.2f} seconds
+
+System Performance:
+- Total Users Processed: {total_spawned}
+- Overall Success Rate: {success_rate:.1f}%
+- Load Balancing Algorithm: {algorithm}
+- Traffic Pattern: {traffic_pattern}
+
+Server Summary:
+{server_summary}
+
+Load Balancer Performance:
+{lb_summary}
+
+Security Analysis:
+{security_summary}
+
+Report generated: {generated_at}
+"""
+
+
+def _json_default(value):
+    """Encode NumPy values natively and anything else by its string form"""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    return str(value)
+
+
+def _mean(values):
+    """Plain-Python average for the small per-group lists, 0.0 when empty"""
+    return sum(values) / len(values) if values else 0.0
+
+
+def _percentile(values, q):
+    """Linearly interpolated percentile from a two-point partial selection"""
+    values = np.asarray(values, dtype=float)
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    selected = np.partition(values, (lower, upper))
+    return selected[lower] + (selected[upper] - selected[lower]) * (position - lower)
+
+
+@lru_cache(maxsize=256)
+def _pretty(name):
+    """Display form of a snake_case enum value, e.g. ddos_flood -> Ddos Flood"""
+    return name.replace("_", " ").title()
+
+
+@lru_cache(maxsize=64)
+def _titled(name):
+    """Title-cased enum value, memoized across rows and reports"""
+    return name.title()
+
 
 class SimulationReportGenerator:
     """Comprehensive report generator for load balancer simulation data"""
@@ -25,6 +129,7 @@ class SimulationReportGenerator:
         }
         self.start_time = None
         self.end_time = None
+        self._efficiency_cache = None
 
     def initialize_simulation(self, simulation_config):
         """Initialize simulation tracking with configuration"""
@@ -60,19 +165,33 @@ class SimulationReportGenerator:
             self.end_time - self.start_time
         )
 
-    def collect_server_metrics(self, servers):
-        """Collect comprehensive server performance metrics"""
+    def _elapsed_seconds(self):
+        """Simulation duration so far, up to finalize_simulation once it has run"""
+        now = self.end_time or time.time()
+        return now - (self.start_time or now)
+
+    def collect_server_metrics(self, servers, include_history=True):
+        """Collect comprehensive server performance metrics, history optional"""
         server_data = {}
+        # Server state is fixed while collecting, so each rating is computed once.
+        self._efficiency_cache = {}
+        elapsed = max(1e-9, self._elapsed_seconds())
 
-        for server in servers:
-            server_info = server.get_server_info()
+        names, types, statuses, cpu, memory, connections, loads, rts, requests = (
+            snapshot_servers(servers)
+        )
+        for i, server in enumerate(servers):
+            load_score = loads[i]
+            load_history = np.fromiter(
+                server.load_history, dtype=np.float64, count=len(server.load_history)
+            )
 
-            server_data[server.name] = {
+            server_data[names[i]] = {
                 "basic_info": {
-                    "name": server.name,
-                    "type": server.server_type.value,
-                    "status": server.status.value,
-                    "weight": getattr(server, "weight", 1),
+                    "name": names[i],
+                    "type": types[i],
+                    "status": statuses[i],
+                    "weight": server.weight,
                 },
                 "resource_specs": {
                     "cpu_cores": server.cpu_cores,
@@ -80,47 +199,53 @@ class SimulationReportGenerator:
                     "base_processing_speed": server.base_processing_speed,
                 },
                 "performance_metrics": {
-                    "total_requests_processed": server.total_requests,
-                    "current_connections": server.active_connections,
-                    "cpu_utilization_percent": server.cpu_utilization,
-                    "memory_utilization_percent": server.memory_utilization,
-                    "load_score": (
-                        server.load_score if server.load_score != float("inf") else -1
-                    ),
-                    "average_response_time": server.avg_response_time,
-                    "last_failure_time": getattr(server, "last_failure_time", 0),
-                },
-                "historical_data": {
-                    "response_times": (
-                        list(server.response_times)
-                        if hasattr(server, "response_times")
-                        else []
-                    ),
-                    "load_history": (
-                        list(server.load_history)
-                        if hasattr(server, "load_history")
-                        else []
-                    ),
+                    "total_requests_processed": requests[i],
+                    "current_connections": connections[i],
+                    "cpu_utilization_percent": float(cpu[i]),
+                    "memory_utilization_percent": float(memory[i]),
+                    "load_score": load_score if load_score != float("inf") else -1,
+                    "average_response_time": rts[i],
+                    "last_failure_time": server.last_failure_time,
                 },
-                "utilization_analysis": self._analyze_server_utilization(server),
-                "efficiency_metrics": self._calculate_server_efficiency(server),
+                "historical_data": (
+                    {
+                        # Kept as arrays; the JSON writer lists them on output.
+                        "response_times": np.fromiter(
+                            server.response_times,
+                            dtype=np.float64,
+                            count=len(server.response_times),
+                        ),
+                        "load_history": load_history,
+                    }
+                    if include_history
+                    else {"length": len(load_history)}
+                ),
+                "utilization_analysis": self._analyze_server_utilization(
+                    server, load_history
+                ),
+                "efficiency_metrics": self._calculate_server_efficiency(
+                    server, elapsed
+                ),
             }
 
+        self._efficiency_cache = None
         self.simulation_data["server_metrics"] = server_data
 
-    def _analyze_server_utilization(self, server):
+    def _analyze_server_utilization(self, server, load_history):
         """Analyze server utilization patterns"""
-        if not hasattr(server, "load_history") or not server.load_history:
+        if not len(load_history):
             return {"status": "no_data"}
 
-        load_history = list(server.load_history)
+        average_load = load_history.mean()
+        deviations = load_history - average_load
+        load_variance = deviations @ deviations / load_history.size
 
         return {
-            "average_load": np.mean(load_history),
-            "max_load": np.max(load_history),
-            "min_load": np.min(load_history),
-            "load_variance": np.var(load_history),
-            "load_stability": 1.0 / (1.0 + np.var(load_history)),
+            "average_load": average_load,
+            "max_load": load_history.max(),
+            "min_load": load_history.min(),
+            "load_variance": load_variance,
+            "load_stability": 1.0 / (1.0 + load_variance),
             "peak_utilization_periods": self._identify_peak_periods(load_history),
             "efficiency_rating": self._calculate_efficiency_rating(server),
         }
@@ -130,33 +255,40 @@ class SimulationReportGenerator:
         if len(load_history) < 10:
             return []
 
-        threshold = np.percentile(load_history, 80)
-        peaks = []
-        in_peak = False
-        peak_start = 0
-
-        for i, load in enumerate(load_history):
-            if load >= threshold and not in_peak:
-                in_peak = True
-                peak_start = i
-            elif load < threshold and in_peak:
-                in_peak = False
-                peaks.append(
-                    {
-                        "start_index": peak_start,
-                        "end_index": i,
-                        "duration": i - peak_start,
-                        "average_load": np.mean(load_history[peak_start:i]),
-                    }
-                )
-
-        return peaks
+        load_history = np.asarray(load_history, dtype=np.float64)
+        in_peak = load_history >= _percentile(load_history, 80)
+        edges = np.diff(in_peak.astype(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        # A peak still running at the end of the history has not closed yet.
+        closed = ends < len(load_history)
+        starts = starts[closed]
+        ends = ends[closed]
+        running_total = np.concatenate(([0.0], np.cumsum(load_history)))
+        averages = (running_total[ends] - running_total[starts]) / (ends - starts)
+
+        return [
+            {
+                "start_index": start,
+                "end_index": end,
+                "duration": end - start,
+                "average_load": average,
+            }
+            for start, end, average in zip(
+                starts.tolist(), ends.tolist(), averages.tolist()
+            )
+        ]
 
     def _calculate_efficiency_rating(self, server):
         """Calculate server efficiency rating (0-100)"""
         if server.total_requests == 0:
             return 0
 
+        cache = self._efficiency_cache
+        if cache is not None and id(server) in cache:
+            return cache[id(server)]
+
         utilization_score = min(
             100, (server.cpu_utilization + server.memory_utilization) / 2
         )
@@ -168,16 +300,18 @@ class SimulationReportGenerator:
             + response_time_score * 0.4
             + reliability_score * 0.2
         )
-        return min(100, max(0, efficiency))
+        efficiency = min(100, max(0, efficiency))
+        if cache is not None:
+            cache[id(server)] = efficiency
+        return efficiency
 
-    def _calculate_server_efficiency(self, server):
+    def _calculate_server_efficiency(self, server, elapsed):
         """Calculate detailed server efficiency metrics"""
         if server.total_requests == 0:
             return {"status": "no_requests"}
 
         return {
-            "requests_per_second": server.total_requests
-            / (time.time() - (self.start_time or time.time())),
+            "requests_per_second": server.total_requests / elapsed,
             "resource_efficiency": {
                 "cpu_efficiency": server.total_requests
                 / max(1, server.cpu_utilization),
@@ -189,186 +323,208 @@ class SimulationReportGenerator:
             "overall_efficiency_score": self._calculate_efficiency_rating(server),
         }
 
-    def collect_user_analytics(self, completed_users, active_users):
+    def collect_user_analytics(
+        self, completed_users, active_users, completion_stats=None
+    ):
         """Collect comprehensive user behavior and performance analytics"""
+        completed_users = list(completed_users)
+        active_users = list(active_users)
         all_users = completed_users + active_users
 
+        if completion_stats:
+            completed_count = completion_stats["count"]
+            successful_count = completion_stats["successes"]
+        else:
+            completed_count = len(completed_users)
+            successful_count = len([u for u in completed_users if not u.failed])
+
         user_stats = {
-            "total_users": len(all_users),
-            "completed_users": len(completed_users),
+            "total_users": completed_count + len(active_users),
+            "completed_users": completed_count,
             "active_users": len(active_users),
-            "success_rate": len([u for u in completed_users if not u.failed])
-            / max(1, len(completed_users)),
+            "success_rate": successful_count / max(1, completed_count),
         }
+        columns = self._user_columns(all_users)
+        response_times = columns["response_time"]
+        retry_counts = columns["retry_count"]
+        type_ids = columns["user_type_id"]
+        failed = columns["failed"]
+        completed = np.arange(len(all_users)) < len(completed_users)
+
+        type_count = len(USER_TYPE_IDS)
+        counts = np.bincount(type_ids, minlength=type_count)
+        successes = np.bincount(
+            type_ids, weights=completed & ~failed, minlength=type_count
+        )
+        failures = np.bincount(
+            type_ids, weights=completed & failed, minlength=type_count
+        )
+        timeouts = np.bincount(
+            type_ids,
+            weights=completed & failed & columns["timeout_exit"],
+            minlength=type_count,
+        )
+        response_totals = np.bincount(
+            type_ids, weights=response_times, minlength=type_count
+        )
+        retry_totals = np.bincount(type_ids, weights=retry_counts, minlength=type_count)
+        cpu_totals = np.bincount(type_ids, weights=columns["cpu"], minlength=type_count)
+        memory_totals = np.bincount(
+            type_ids, weights=columns["memory"], minlength=type_count
+        )
 
-        type_analysis = defaultdict(
-            lambda: {
-                "count": 0,
-                "successes": 0,
-                "failures": 0,
-                "timeouts": 0,
-                "response_times": [],
-                "retry_counts": [],
-                "resource_usage": [],
+        type_analysis = {}
+        for user_type, index in USER_TYPE_IDS.items():
+            count = int(counts[index])
+            if not count:
+                continue
+            in_type = type_ids == index
+            type_analysis[user_type.value] = {
+                "count": count,
+                "successes": int(successes[index]),
+                "failures": int(failures[index]),
+                "timeouts": int(timeouts[index]),
+                "response_times": response_times[in_type].tolist(),
+                "retry_counts": retry_counts[in_type].tolist(),
+                "resource_usage": [
+                    {"cpu": cpu, "memory": memory, "processing_time": processing}
+                    for cpu, memory, processing in zip(
+                        columns["cpu"][in_type].tolist(),
+                        columns["memory"][in_type].tolist(),
+                        columns["processing_time"][in_type].tolist(),
+                    )
+                ],
+                "success_rate": successes[index] / count,
+                "failure_rate": failures[index] / count,
+                "timeout_rate": timeouts[index] / count,
+                "avg_response_time": response_totals[index] / count,
+                "avg_retry_count": retry_totals[index] / count,
+                "avg_cpu_usage": cpu_totals[index] / count,
+                "avg_memory_usage": memory_totals[index] / count,
             }
-        )
 
-        attack_analysis = defaultdict(
-            lambda: {
+        attack_analysis = {
+            attack_type.value: {
                 "count": 0,
                 "success_rate": 0,
                 "average_intensity": 0,
                 "spawn_counts": [],
                 "durations": [],
             }
-        )
-
-        for user in all_users:
-            user_type = user.user_type
-            type_stats = type_analysis[user_type.value]
-
-            type_stats["count"] += 1
-            type_stats["response_times"].append(user.get_response_time())
-            type_stats["retry_counts"].append(user.retry_count)
-            type_stats["resource_usage"].append(
-                {
-                    "cpu": user.cpu_requirement,
-                    "memory": user.memory_requirement,
-                    "processing_time": user.processing_time,
-                }
-            )
-
-            if user in completed_users:
-                if user.failed:
-                    type_stats["failures"] += 1
-                    if user.timeout_exit:
-                        type_stats["timeouts"] += 1
-                else:
-                    type_stats["successes"] += 1
-
-            if user_type == UserType.NAUGHTY and hasattr(user, "attack_type"):
-                attack_type = user.attack_type.value
-                attack_stats = attack_analysis[attack_type]
-                attack_stats["count"] += 1
-                attack_stats["average_intensity"] += getattr(
-                    user, "attack_intensity", 0
-                )
-                if hasattr(user, "spawn_count"):
-                    attack_stats["spawn_counts"].append(user.spawn_count)
-                if hasattr(user, "attack_duration"):
-                    attack_stats["durations"].append(user.attack_duration)
-
-        for user_type, stats in type_analysis.items():
-            if stats["count"] > 0:
-                stats["success_rate"] = stats["successes"] / stats["count"]
-                stats["failure_rate"] = stats["failures"] / stats["count"]
-                stats["timeout_rate"] = stats["timeouts"] / stats["count"]
-                stats["avg_response_time"] = (
-                    np.mean(stats["response_times"]) if stats["response_times"] else 0
-                )
-                stats["avg_retry_count"] = (
-                    np.mean(stats["retry_counts"]) if stats["retry_counts"] else 0
-                )
-                stats["avg_cpu_usage"] = (
-                    np.mean([r["cpu"] for r in stats["resource_usage"]])
-                    if stats["resource_usage"]
-                    else 0
-                )
-                stats["avg_memory_usage"] = (
-                    np.mean([r["memory"] for r in stats["resource_usage"]])
-                    if stats["resource_usage"]
-                    else 0
-                )
+            for attack_type in AttackType
+        }
 
-        for attack_type, stats in attack_analysis.items():
-            if stats["count"] > 0:
-                stats["average_intensity"] /= stats["count"]
-                stats["avg_spawn_count"] = (
-                    np.mean(stats["spawn_counts"]) if stats["spawn_counts"] else 0
-                )
-                stats["avg_duration"] = (
-                    np.mean(stats["durations"]) if stats["durations"] else 0
-                )
+        for index in np.flatnonzero(type_ids == _NAUGHTY_ID).tolist():
+            user = all_users[index]
+            attack_stats = attack_analysis[user.attack_type.value]
+            attack_stats["count"] += 1
+            attack_stats["average_intensity"] += user.attack_intensity
+            attack_stats["spawn_counts"].append(user.spawn_count)
+            attack_stats["durations"].append(user.attack_duration)
+
+        # Only attack types that actually occurred are reported.
+        attack_analysis = {
+            attack_type: stats
+            for attack_type, stats in attack_analysis.items()
+            if stats["count"]
+        }
+        for stats in attack_analysis.values():
+            stats["average_intensity"] /= stats["count"]
+            stats["avg_spawn_count"] = _mean(stats["spawn_counts"])
+            stats["avg_duration"] = _mean(stats["durations"])
 
         self.simulation_data["user_analytics"] = {
             "summary": user_stats,
             "by_type": dict(type_analysis),
-            "priority_analysis": self._analyze_priority_distribution(all_users),
+            "priority_analysis": self._analyze_priority_distribution(columns),
             "performance_correlation": self._analyze_user_performance_correlation(
-                all_users
+                columns
             ),
         }
 
         self.simulation_data["security_analysis"] = {
-            "attack_summary": dict(attack_analysis),
-            "security_metrics": self._calculate_security_metrics(all_users),
+            "attack_summary": attack_analysis,
+            "security_metrics": self._calculate_security_metrics(columns),
             "threat_assessment": self._assess_threat_levels(attack_analysis),
         }
 
-    def _analyze_priority_distribution(self, users):
+    def _user_columns(self, users):
+        """Read the per-user fields the analyses share into parallel arrays"""
+        count = len(users)
+        return {
+            "response_time": np.fromiter(
+                (u.get_response_time() for u in users), float, count
+            ),
+            "cpu": np.fromiter((u.cpu_requirement for u in users), float, count),
+            "memory": np.fromiter((u.memory_requirement for u in users), float, count),
+            "priority": np.fromiter((u.priority.value for u in users), np.intp, count),
+            "user_type_id": np.fromiter(
+                (u.user_type_id for u in users), np.intp, count
+            ),
+            "failed": np.fromiter((u.failed for u in users), bool, count),
+            "stealth": np.fromiter((u.stealth_mode for u in users), bool, count),
+            "retry_count": np.fromiter((u.retry_count for u in users), np.intp, count),
+            "processing_time": np.fromiter(
+                (u.processing_time for u in users), float, count
+            ),
+            "timeout_exit": np.fromiter((u.timeout_exit for u in users), bool, count),
+            "attack_intensity": np.fromiter(
+                (u.attack_intensity for u in users), float, count
+            ),
+        }
+
+    def _analyze_priority_distribution(self, columns):
         """Analyze request priority distribution and performance"""
-        priority_stats = defaultdict(
-            lambda: {
-                "count": 0,
+        priorities = columns["priority"]
+        response_times = columns["response_time"]
+        counts = np.bincount(priorities)
+        totals = np.bincount(priorities, weights=response_times)
+
+        priority_stats = {}
+        for priority in np.flatnonzero(counts).tolist():
+            priority_stats[priority] = {
+                "count": int(counts[priority]),
                 "success_rate": 0,
-                "avg_response_time": 0,
-                "response_times": [],
+                "avg_response_time": totals[priority] / counts[priority],
+                "response_times": response_times[priorities == priority].tolist(),
             }
-        )
-
-        for user in users:
-            priority = user.priority.value
-            priority_stats[priority]["count"] += 1
-            priority_stats[priority]["response_times"].append(user.get_response_time())
-
-        for priority, stats in priority_stats.items():
-            if stats["count"] > 0:
-                stats["avg_response_time"] = np.mean(stats["response_times"])
 
-        return dict(priority_stats)
+        return priority_stats
 
-    def _analyze_user_performance_correlation(self, users):
+    def _analyze_user_performance_correlation(self, columns):
         """Analyze correlation between user characteristics and performance"""
-        if not users:
+        response_times = columns["response_time"]
+        if not len(response_times):
             return {}
 
-        cpu_reqs = [u.cpu_requirement for u in users]
-        memory_reqs = [u.memory_requirement for u in users]
-        response_times = [u.get_response_time() for u in users]
-
         correlations = {}
         try:
-            correlations["cpu_response_correlation"] = np.corrcoef(
-                cpu_reqs, response_times
-            )[0, 1]
-            correlations["memory_response_correlation"] = np.corrcoef(
-                memory_reqs, response_times
-            )[0, 1]
-        except:
+            matrix = np.corrcoef(
+                np.vstack((columns["cpu"], columns["memory"], response_times))
+            )
+            correlations["cpu_response_correlation"] = float(matrix[0, 2])
+            correlations["memory_response_correlation"] = float(matrix[1, 2])
+        except (ValueError, FloatingPointError):
             correlations["cpu_response_correlation"] = 0
             correlations["memory_response_correlation"] = 0
 
         return correlations
 
-    def _calculate_security_metrics(self, users):
+    def _calculate_security_metrics(self, columns):
         """Calculate security-related metrics"""
-        total_users = len(users)
-        naughty_users = [u for u in users if u.user_type == UserType.NAUGHTY]
+        total_users = len(columns["user_type_id"])
+        naughty = columns["user_type_id"] == _NAUGHTY_ID
+        naughty_count = np.count_nonzero(naughty)
+        stealth_count = np.count_nonzero(naughty & columns["stealth"])
+        succeeded_count = np.count_nonzero(naughty & ~columns["failed"])
 
         return {
-            "attack_percentage": len(naughty_users) / max(1, total_users) * 100,
-            "stealth_attack_percentage": len(
-                [u for u in naughty_users if getattr(u, "stealth_mode", False)]
-            )
-            / max(1, len(naughty_users))
-            * 100,
+            "attack_percentage": naughty_count / max(1, total_users) * 100,
+            "stealth_attack_percentage": stealth_count / max(1, naughty_count) * 100,
             "average_attack_intensity": (
-                np.mean([getattr(u, "attack_intensity", 0) for u in naughty_users])
-                if naughty_users
-                else 0
+                columns["attack_intensity"][naughty].mean() if naughty_count else 0
             ),
-            "attack_success_rate": len([u for u in naughty_users if not u.failed])
-            / max(1, len(naughty_users)),
+            "attack_success_rate": succeeded_count / max(1, naughty_count),
         }
 
     def _assess_threat_levels(self, attack_analysis):
@@ -421,36 +577,33 @@ class SimulationReportGenerator:
 
     def _analyze_routing_decisions(self, load_balancer):
         """Analyze load balancer routing decision patterns"""
-        if (
-            not hasattr(load_balancer, "routing_decisions")
-            or not load_balancer.routing_decisions
-        ):
+        decisions = load_balancer.routing_decisions
+        if not decisions:
             return {"status": "no_decisions"}
 
-        decisions = list(load_balancer.routing_decisions)
-
-        method_counts = defaultdict(int)
-        success_by_method = defaultdict(list)
+        method_counts = Counter()
+        method_successes = Counter()
+        total_successes = 0
 
         for decision in decisions:
-            method = decision.get("method", "unknown")
+            method = decision.method or "unknown"
             method_counts[method] += 1
-            success_by_method[method].append(decision.get("success", False))
+            if decision.success:
+                method_successes[method] += 1
+                total_successes += 1
 
         method_analysis = {}
-        for method, successes in success_by_method.items():
+        for method, count in method_counts.items():
             method_analysis[method] = {
-                "count": method_counts[method],
-                "success_rate": np.mean(successes) if successes else 0,
+                "count": count,
+                "success_rate": method_successes[method] / count,
             }
 
         return {
             "total_decisions": len(decisions),
             "method_breakdown": dict(method_counts),
             "method_success_rates": method_analysis,
-            "overall_decision_success_rate": np.mean(
-                [d.get("success", False) for d in decisions]
-            ),
+            "overall_decision_success_rate": total_successes / len(decisions),
         }
 
     def _calculate_lb_efficiency(self, load_balancer):
@@ -458,7 +611,7 @@ class SimulationReportGenerator:
         if load_balancer.total_requests_received == 0:
             return {"status": "no_requests"}
 
-        duration = (self.end_time or time.time()) - (self.start_time or time.time())
+        duration = self._elapsed_seconds()
 
         return {
             "requests_per_second": load_balancer.total_requests_received
@@ -488,9 +641,7 @@ class SimulationReportGenerator:
             },
             "infrastructure_summary": {
                 "total_servers": len(visualization_obj.servers),
-                "server_types": [
-                    s.server_type.value for s in visualization_obj.servers
-                ],
+                "server_types": list(visualization_obj.server_type_values),
                 "total_capacity": self._calculate_total_capacity(
                     visualization_obj.servers
                 ),
@@ -507,37 +658,34 @@ class SimulationReportGenerator:
         return {
             "total_cpu_cores": sum(s.cpu_cores for s in servers),
             "total_memory_gb": sum(s.memory_gb for s in servers),
-            "theoretical_max_requests": sum(
-                getattr(s, "weight", 1) * 50 for s in servers
-            ),
+            "theoretical_max_requests": sum(s.weight * 50 for s in servers),
         }
 
     def _analyze_performance_trends(self, performance_monitor):
         """Analyze performance trends over time"""
-        if (
-            not hasattr(performance_monitor, "metrics")
-            or not performance_monitor.metrics["response_times"]
-        ):
+        response_times = performance_monitor.response_times().astype(float)
+        if not len(response_times):
             return {"status": "insufficient_data"}
 
-        response_times = list(performance_monitor.metrics["response_times"])
-
         if len(response_times) > 10:
 
-            mid_point = len(response_times) // 2
-            first_half = response_times[:mid_point]
-            second_half = response_times[mid_point:]
+            count = len(response_times)
+            mid_point = count // 2
+            first_total = response_times[:mid_point].sum()
+            second_total = response_times[mid_point:].sum()
+            first_half_avg = first_total / mid_point
+            second_half_avg = second_total / (count - mid_point)
+            deviations = response_times - (first_total + second_total) / count
+            variance = deviations @ deviations / count
 
             trend = {
                 "response_time_trend": (
-                    "improving"
-                    if np.mean(second_half) < np.mean(first_half)
-                    else "degrading"
+                    "improving" if second_half_avg < first_half_avg else "degrading"
                 ),
-                "first_half_avg": np.mean(first_half),
-                "second_half_avg": np.mean(second_half),
-                "overall_variance": np.var(response_times),
-                "performance_stability": 1.0 / (1.0 + np.var(response_times)),
+                "first_half_avg": first_half_avg,
+                "second_half_avg": second_half_avg,
+                "overall_variance": variance,
+                "performance_stability": 1.0 / (1.0 + variance),
             }
         else:
             trend = {"status": "insufficient_data_for_trend"}
@@ -552,28 +700,31 @@ class SimulationReportGenerator:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base_filename = f"load_balancer_report_{timestamp}"
 
-        json_path = self._generate_json_report(output_dir, base_filename)
-
-        csv_paths = self._generate_csv_reports(output_dir, base_filename)
-
-        html_path = self._generate_html_report(output_dir, base_filename)
-
-        txt_path = self._generate_summary_report(output_dir, base_filename)
-
-        return {
-            "json_report": json_path,
-            "csv_reports": csv_paths,
-            "html_report": html_path,
-            "summary_report": txt_path,
-            "report_timestamp": timestamp,
+        # The writers only read simulation_data, so their file I/O can overlap.
+        writers = {
+            "json_report": self._generate_json_report,
+            "csv_reports": self._generate_csv_reports,
+            "html_report": self._generate_html_report,
+            "summary_report": self._generate_summary_report,
         }
+        with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+            futures = {
+                name: executor.submit(writer, output_dir, base_filename)
+                for name, writer in writers.items()
+            }
+            report_files = {name: future.result() for name, future in futures.items()}
+
+        report_files["report_timestamp"] = timestamp
+        return report_files
 
     def _generate_json_report(self, output_dir, base_filename):
         """Generate detailed JSON report"""
         json_path = os.path.join(output_dir, f"{base_filename}.json")
 
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(self.simulation_data, f, indent=2, default=str)
+        with open(
+            json_path, "w", encoding="utf-8", buffering=_REPORT_BUFFER_SIZE
+        ) as f:
+            f.write(json.dumps(self.simulation_data, indent=2, default=_json_default))
 
         return json_path
 
@@ -595,73 +746,82 @@ class SimulationReportGenerator:
 
     def _write_server_csv(self, file_path):
         """Write server metrics to CSV"""
-        with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-            fieldnames = [
-                "server_name",
-                "server_type",
-                "status",
-                "total_requests",
-                "cpu_utilization_percent",
-                "memory_utilization_percent",
-                "avg_response_time",
-                "efficiency_score",
-                "load_score",
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
+        with open(
+            file_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_REPORT_BUFFER_SIZE,
+        ) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(
+                (
+                    "server_name",
+                    "server_type",
+                    "status",
+                    "total_requests",
+                    "cpu_utilization_percent",
+                    "memory_utilization_percent",
+                    "avg_response_time",
+                    "efficiency_score",
+                    "load_score",
+                )
+            )
+            rows = []
             for server_name, data in self.simulation_data["server_metrics"].items():
-                row = {
-                    "server_name": server_name,
-                    "server_type": data["basic_info"]["type"],
-                    "status": data["basic_info"]["status"],
-                    "total_requests": data["performance_metrics"][
-                        "total_requests_processed"
-                    ],
-                    "cpu_utilization_percent": data["performance_metrics"][
-                        "cpu_utilization_percent"
-                    ],
-                    "memory_utilization_percent": data["performance_metrics"][
-                        "memory_utilization_percent"
-                    ],
-                    "avg_response_time": data["performance_metrics"][
-                        "average_response_time"
-                    ],
-                    "efficiency_score": data.get("efficiency_metrics", {}).get(
-                        "overall_efficiency_score", 0
-                    ),
-                    "load_score": data["performance_metrics"]["load_score"],
-                }
-                writer.writerow(row)
+                metrics = data["performance_metrics"]
+                rows.append(
+                    (
+                        server_name,
+                        data["basic_info"]["type"],
+                        data["basic_info"]["status"],
+                        metrics["total_requests_processed"],
+                        metrics["cpu_utilization_percent"],
+                        metrics["memory_utilization_percent"],
+                        metrics["average_response_time"],
+                        data.get("efficiency_metrics", {}).get(
+                            "overall_efficiency_score", 0
+                        ),
+                        metrics["load_score"],
+                    )
+                )
+            writer.writerows(rows)
 
     def _write_user_csv(self, file_path):
         """Write user analytics to CSV"""
-        with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-            fieldnames = [
-                "user_type",
-                "count",
-                "success_rate",
-                "failure_rate",
-                "avg_response_time",
-                "avg_cpu_usage",
-                "avg_memory_usage",
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for user_type, data in self.simulation_data["user_analytics"][
-                "by_type"
-            ].items():
-                row = {
-                    "user_type": user_type,
-                    "count": data["count"],
-                    "success_rate": data.get("success_rate", 0),
-                    "failure_rate": data.get("failure_rate", 0),
-                    "avg_response_time": data.get("avg_response_time", 0),
-                    "avg_cpu_usage": data.get("avg_cpu_usage", 0),
-                    "avg_memory_usage": data.get("avg_memory_usage", 0),
-                }
-                writer.writerow(row)
+        with open(
+            file_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_REPORT_BUFFER_SIZE,
+        ) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(
+                (
+                    "user_type",
+                    "count",
+                    "success_rate",
+                    "failure_rate",
+                    "avg_response_time",
+                    "avg_cpu_usage",
+                    "avg_memory_usage",
+                )
+            )
+            writer.writerows(
+                (
+                    user_type,
+                    data["count"],
+                    data.get("success_rate", 0),
+                    data.get("failure_rate", 0),
+                    data.get("avg_response_time", 0),
+                    data.get("avg_cpu_usage", 0),
+                    data.get("avg_memory_usage", 0),
+                )
+                for user_type, data in self.simulation_data["user_analytics"][
+                    "by_type"
+                ].items()
+            )
 
     def _generate_html_report(self, output_dir, base_filename):
         """Generate comprehensive HTML report"""
@@ -669,7 +829,9 @@ class SimulationReportGenerator:
 
         html_content = self._create_html_content()
 
-        with open(html_path, "w", encoding="utf-8") as f:
+        with open(
+            html_path, "w", encoding="utf-8", buffering=_REPORT_BUFFER_SIZE
+        ) as f:
             f.write(html_content)
 
         return html_path
@@ -758,7 +920,7 @@ class SimulationReportGenerator:
         """Generate server metrics section for HTML report"""
         server_metrics = self.simulation_data.get("server_metrics", {})
 
-        html = """
+        parts = ["""
         <div class="section">
             <h2>Server Performance Metrics</h2>
             <table>
@@ -774,40 +936,43 @@ class SimulationReportGenerator:
                         <th>Efficiency</th>
                     </tr>
                 </thead>
-                <tbody>"""
+                <tbody>"""]
 
+        row_html = _SERVER_ROW_HTML
         for server_name, data in server_metrics.items():
             basic_info = data.get("basic_info", {})
             perf_metrics = data.get("performance_metrics", {})
             efficiency = data.get("efficiency_metrics", {})
 
-            status_class = f"status-{basic_info.get('status', '').lower()}"
-
-            html += f"""
-                    <tr>
-                        <td>{server_name}</td>
-                        <td>{basic_info.get('type', 'N/A')}</td>
-                        <td class="{status_class}">{basic_info.get('status', 'N/A')}</td>
-                        <td>{perf_metrics.get('total_requests_processed', 0)}</td>
-                        <td>{perf_metrics.get('cpu_utilization_percent', 0):.1f}%</td>
-                        <td>{perf_metrics.get('memory_utilization_percent', 0):.1f}%</td>
-                        <td>{perf_metrics.get('average_response_time', 0):.2f}s</td>
-                        <td>{efficiency.get('overall_efficiency_score', 0):.1f}/100</td>
-                    </tr>"""
+            status = basic_info.get("status")
+
+            parts.append(
+                row_html.format(
+                    server_name,
+                    basic_info.get("type", "N/A"),
+                    (status or "").lower(),
+                    "N/A" if status is None else status,
+                    perf_metrics.get("total_requests_processed", 0),
+                    perf_metrics.get("cpu_utilization_percent", 0),
+                    perf_metrics.get("memory_utilization_percent", 0),
+                    perf_metrics.get("average_response_time", 0),
+                    efficiency.get("overall_efficiency_score", 0),
+                )
+            )
 
-        html += """
+        parts.append("""
                 </tbody>
             </table>
-        </div>"""
+        </div>""")
 
-        return html
+        return "".join(parts)
 
     def _generate_user_analytics_html(self):
         """Generate user analytics section for HTML report"""
         user_analytics = self.simulation_data.get("user_analytics", {})
         by_type = user_analytics.get("by_type", {})
 
-        html = """
+        parts = ["""
         <div class="section">
             <h2>User Analytics</h2>
             <table>
@@ -821,60 +986,44 @@ class SimulationReportGenerator:
                         <th>Avg Memory Usage</th>
                     </tr>
                 </thead>
-                <tbody>"""
+                <tbody>"""]
 
         for user_type, data in by_type.items():
-            html += f"""
+            parts.append(f"""
                     <tr>
-                        <td>{user_type.title()}</td>
+                        <td>{_titled(user_type)}</td>
                         <td>{data.get('count', 0)}</td>
                         <td>{data.get('success_rate', 0):.1%}</td>
                         <td>{data.get('avg_response_time', 0):.2f}s</td>
                         <td>{data.get('avg_cpu_usage', 0):.2f}</td>
                         <td>{data.get('avg_memory_usage', 0):.2f}</td>
-                    </tr>"""
+                    </tr>""")
 
-        html += """
+        parts.append("""
                 </tbody>
             </table>
-        </div>"""
+        </div>""")
 
-        return html
+        return "".join(parts)
 
     def _generate_load_balancer_html(self):
         """Generate load balancer performance section for HTML report"""
         lb_perf = self.simulation_data.get("load_balancer_performance", {})
         request_handling = lb_perf.get("request_handling", {})
 
-        return f"""
-        <div class="section">
-            <h2>Load Balancer Performance</h2>
-            <div class="metric-grid">
-                <div class="metric-card">
-                    <div class="metric-value">{request_handling.get('total_received', 0)}</div>
-                    <div class="metric-label">Total Requests Received</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{request_handling.get('total_routed', 0)}</div>
-                    <div class="metric-label">Successfully Routed</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{request_handling.get('dropped_requests', 0)}</div>
-                    <div class="metric-label">Dropped Requests</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{request_handling.get('routing_success_rate', 0):.1%}</div>
-                    <div class="metric-label">Routing Success Rate</div>
-                </div>
-            </div>
-        </div>"""
+        return _LB_HTML.format(
+            total_received=request_handling.get("total_received", 0),
+            total_routed=request_handling.get("total_routed", 0),
+            dropped_requests=request_handling.get("dropped_requests", 0),
+            routing_success_rate=request_handling.get("routing_success_rate", 0),
+        )
 
     def _generate_security_analysis_html(self):
         """Generate security analysis section for HTML report"""
         security = self.simulation_data.get("security_analysis", {})
         threat_assessment = security.get("threat_assessment", {})
 
-        html = """
+        parts = ["""
         <div class="section">
             <h2>Security Analysis</h2>
             <h3>Threat Assessment</h3>
@@ -885,22 +1034,22 @@ class SimulationReportGenerator:
                         <th>Threat Level</th>
                     </tr>
                 </thead>
-                <tbody>"""
+                <tbody>"""]
 
         for attack_type, threat_level in threat_assessment.items():
             threat_class = f"threat-{threat_level.lower()}"
-            html += f"""
+            parts.append(f"""
                     <tr>
-                        <td>{attack_type.replace('_', ' ').title()}</td>
+                        <td>{_pretty(attack_type)}</td>
                         <td class="{threat_class}">{threat_level}</td>
-                    </tr>"""
+                    </tr>""")
 
-        html += """
+        parts.append("""
                 </tbody>
             </table>
-        </div>"""
+        </div>""")
 
-        return html
+        return "".join(parts)
 
     def _generate_summary_report(self, output_dir, base_filename):
         """Generate text summary report"""
@@ -911,35 +1060,24 @@ class SimulationReportGenerator:
             "overall_stats", {}
         )
 
-        summary = f"""
-LOAD BALANCER SIMULATION SUMMARY REPORT
-========================================
-
-Simulation Information:
-- Simulation ID: {metadata.get('simulation_id', 'N/A')}
-- Start Time: {metadata.get('start_time', 'N/A')}
-- End Time: {metadata.get('end_time', 'N/A')}
-- Duration: {metadata.get('duration_seconds', 0):.2f} seconds
-
-System Performance:
-- Total Users Processed: {system_stats.get('total_spawned', 0)}
-- Overall Success Rate: {system_stats.get('success_rate', 0):.1f}%
-- Load Balancing Algorithm: {system_stats.get('algorithm', 'N/A')}
-- Traffic Pattern: {system_stats.get('traffic_pattern', 'N/A')}
-
-Server Summary:
-{self._generate_server_summary_text()}
-
-Load Balancer Performance:
-{self._generate_lb_summary_text()}
-
-Security Analysis:
-{self._generate_security_summary_text()}
-
-Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
+        summary = _SUMMARY_TEXT.format(
+            simulation_id=metadata.get("simulation_id", "N/A"),
+            start_time=metadata.get("start_time", "N/A"),
+            end_time=metadata.get("end_time", "N/A"),
+            duration_seconds=metadata.get("duration_seconds", 0),
+            total_spawned=system_stats.get("total_spawned", 0),
+            success_rate=system_stats.get("success_rate", 0),
+            algorithm=system_stats.get("algorithm", "N/A"),
+            traffic_pattern=system_stats.get("traffic_pattern", "N/A"),
+            server_summary=self._generate_server_summary_text(),
+            lb_summary=self._generate_lb_summary_text(),
+            security_summary=self._generate_security_summary_text(),
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
 
-        with open(txt_path, "w", encoding="utf-8") as f:
+        with open(
+            txt_path, "w", encoding="utf-8", buffering=_REPORT_BUFFER_SIZE
+        ) as f:
             f.write(summary)
 
         return txt_path
@@ -948,17 +1086,19 @@ Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         """Generate server summary for text report"""
         server_metrics = self.simulation_data.get("server_metrics", {})
 
-        summary = ""
+        lines = []
         for server_name, data in server_metrics.items():
             basic_info = data.get("basic_info", {})
             perf_metrics = data.get("performance_metrics", {})
 
-            summary += f"- {server_name} ({basic_info.get('type', 'N/A')}): "
-            summary += f"Status={basic_info.get('status', 'N/A')}, "
-            summary += f"Requests={perf_metrics.get('total_requests_processed', 0)}, "
-            summary += f"CPU={perf_metrics.get('cpu_utilization_percent', 0):.1f}%\n"
+            lines.append(
+                f"- {server_name} ({basic_info.get('type', 'N/A')}): "
+                f"Status={basic_info.get('status', 'N/A')}, "
+                f"Requests={perf_metrics.get('total_requests_processed', 0)}, "
+                f"CPU={perf_metrics.get('cpu_utilization_percent', 0):.1f}%\n"
+            )
 
-        return summary
+        return "".join(lines)
 
     def _generate_lb_summary_text(self):
         """Generate load balancer summary for text report"""
@@ -978,8 +1118,8 @@ Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         if not threat_assessment:
             return "- No security threats detected"
 
-        summary = ""
+        lines = []
         for attack_type, threat_level in threat_assessment.items():
-            summary += f"- {attack_type.replace('_', ' ').title()}: {threat_level}\n"
+            lines.append(f"- {_pretty(attack_type)}: {threat_level}\n")
 
-        return summary
+        return "".join(lines)
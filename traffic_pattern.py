@@ -1,6 +1,34 @@
+import math
 import time
-import numpy as np
 import random
+import numpy as np
+
+
+def _steady_rate(pattern, cycle_time):
+    return pattern.base_rate
+
+
+def _wave_rate(pattern, cycle_time):
+    wave_factor = (math.sin(cycle_time / pattern.duration * 2 * math.pi) + 1) / 2
+    return pattern.base_rate * (0.5 + wave_factor)
+
+
+def _spike_rate(pattern, cycle_time):
+    if cycle_time > pattern.duration * 0.8:
+        return pattern.base_rate * 3
+    return pattern.base_rate * 0.3
+
+
+def _random_rate(pattern, cycle_time):
+    return pattern.base_rate * random.uniform(0.2, 2.0)
+
+
+_RATE_FUNCTIONS = {
+    "steady": _steady_rate,
+    "wave": _wave_rate,
+    "spike": _spike_rate,
+    "random": _random_rate,
+}
 
 
 class TrafficPattern:
@@ -15,20 +43,8 @@ class TrafficPattern:
         self.burst_multiplier = burst_multiplier
         self.duration = duration
         self.start_time = time.time()
+        self._rate_fn = _RATE_FUNCTIONS.get(name, _steady_rate)
 
     def get_spawn_rate(self):
         elapsed = time.time() - self.start_time
-        cycle_time = elapsed % self.duration
-
-        if self.name == "steady":
-            return self.base_rate
-        elif self.name == "wave":
-            wave_factor = (np.sin(cycle_time / self.duration * 2 * np.pi) + 1) / 2
-            return self.base_rate * (0.5 + wave_factor)
-        elif self.name == "spike":
-            if cycle_time > self.duration * 0.8:
-                return self.base_rate * 3
-            return self.base_rate * 0.3
-        elif self.name == "random":
-            return self.base_rate * random.uniform(0.2, 2.0)
-        return self.base_rate
+        return self._rate_fn(self, elapsed % self.duration)
@@ -1,3 +1,4 @@
+import math
 import pygame
 import random
 import time
@@ -20,6 +21,51 @@ class ServerType(Enum):
     CPU_OPTIMIZED = "cpu_optimized"
 
 
+_ACCEPTING_STATUSES = frozenset((ServerStatus.HEALTHY, ServerStatus.DEGRADED))
+_OVERLOADED_STATUSES = frozenset((ServerStatus.OVERLOADED, ServerStatus.FAILED))
+
+_STATUS_COLORS = {
+    ServerStatus.HEALTHY: (100, 255, 100),
+    ServerStatus.DEGRADED: (255, 255, 100),
+    ServerStatus.OVERLOADED: (255, 150, 50),
+    ServerStatus.FAILED: (255, 50, 50),
+}
+
+_INITIAL_REQUEST_CAPACITY = 16
+
+# Failure odds and recovery are specified per 60 Hz simulation tick.
+_TICK_RATE = 60
+
+_BAR_WIDTH = 60
+_BAR_HEIGHT = 4
+_BAR_TRACK_COLOR = (100, 100, 100)
+_BAR_HOT_COLOR = (255, 100, 100)
+_BAR_OK_COLOR = (100, 255, 100)
+
+# Rendered label surfaces shared by all servers, evicted least recently used.
+_TEXT_CACHE = {}
+_TEXT_CACHE_SIZE = 512
+
+_TYPE_BORDER_COLORS = {
+    ServerType.STANDARD: (255, 255, 255),
+    ServerType.HIGH_PERFORMANCE: (255, 215, 0),
+    ServerType.MEMORY_OPTIMIZED: (0, 191, 255),
+    ServerType.CPU_OPTIMIZED: (255, 20, 147),
+}
+
+
+def _render_cached(font, text, color):
+    """Render text through the shared label cache keyed by font, text and color"""
+    key = (id(font), text, color)
+    surface = _TEXT_CACHE.pop(key, None)
+    if surface is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_SIZE:
+            del _TEXT_CACHE[next(iter(_TEXT_CACHE))]
+        surface = font.render(text, True, color)
+    _TEXT_CACHE[key] = surface
+    return surface
+
+
 class UpstreamServer:
     def __init__(self, x, y, name, server_type=ServerType.STANDARD, weight=1):
         self.x = x
@@ -32,7 +78,6 @@ class UpstreamServer:
 
         self.active_connections = 0
         self.total_requests = 0
-        self.processing_requests = []
         self.request_queue = deque()
 
         self.current_cpu_usage = 0.0
@@ -40,21 +85,44 @@ class UpstreamServer:
 
         self.status = ServerStatus.HEALTHY
         self.failure_probability = 0.0001
+        self._ticks_to_failure = self._sample_ticks_to_failure()
         self.recovery_time = 0
         self.last_failure_time = 0
 
         self.response_times = deque(maxlen=100)
+        self._response_sum = 0.0
+        self.response_count = 0
         self.total_response_time = 0.0
         self.avg_response_time = 0.0
         self.last_performance_update = time.time()
 
         self.color = (100, 255, 100)
         self.size = 60
+        self._radius = self.size // 2
+
+        # Utilization bars are redrawn every frame; only the fill widths change.
+        bar_left = x - _BAR_WIDTH // 2
+        self._cpu_bar_rect = pygame.Rect(bar_left, y + 85, _BAR_WIDTH, _BAR_HEIGHT)
+        self._cpu_fill_rect = pygame.Rect(bar_left, y + 85, 0, _BAR_HEIGHT)
+        self._mem_bar_rect = pygame.Rect(bar_left, y + 92, _BAR_WIDTH, _BAR_HEIGHT)
+        self._mem_fill_rect = pygame.Rect(bar_left, y + 92, 0, _BAR_HEIGHT)
         self.pulse_intensity = 0
 
         self.load_history = deque(maxlen=50)
         self.utilization_threshold = 0.8
 
+        self.refresh_load()
+
+        # In-flight requests live in a fleet; a lone server is a fleet of one
+        # until a shared ServerFleet adopts it through join_fleet().
+        self.fleet = ServerFleet((self,))
+        self.fleet_index = 0
+
+    def join_fleet(self, fleet, index):
+        """Keep this server's in-flight requests in `fleet` at row `index`"""
+        self.fleet = fleet
+        self.fleet_index = index
+
     def _set_server_specs(self):
         """Set server specifications based on server type"""
         specs = {
@@ -84,22 +152,23 @@ class UpstreamServer:
         self.cpu_cores = spec["cpu_cores"]
         self.memory_gb = spec["memory_gb"]
         self.base_processing_speed = spec["base_processing_speed"]
+        self._cpu_scale = 100.0 / self.cpu_cores
+        self._mem_scale = 100.0 / self.memory_gb
+
+        self._border_color = _TYPE_BORDER_COLORS[self.server_type]
+        self._name_label = f"{self.name} ({self.server_type.value[:4].upper()})"
+        self._name_surface = None
+
+    def refresh_load(self):
+        """Recompute the cached utilization percentages and load score"""
+        self.cpu_utilization = min(100.0, self.current_cpu_usage * self._cpu_scale)
+        self.memory_utilization = min(
+            100.0, self.current_memory_usage * self._mem_scale
+        )
 
-    @property
-    def cpu_utilization(self):
-        """Calculate CPU utilization percentage"""
-        return min(100.0, (self.current_cpu_usage / self.cpu_cores) * 100)
-
-    @property
-    def memory_utilization(self):
-        """Calculate memory utilization percentage"""
-        return min(100.0, (self.current_memory_usage / self.memory_gb) * 100)
-
-    @property
-    def load_score(self):
-        """Calculate comprehensive load score for resource-based load balancing"""
         if self.status != ServerStatus.HEALTHY:
-            return float("inf")
+            self.load_score = float("inf")
+            return
 
         cpu_weight = 0.5
         memory_weight = 0.4
@@ -112,7 +181,7 @@ class UpstreamServer:
             min(1.0, self.avg_response_time / 10.0) if self.avg_response_time > 0 else 0
         )
 
-        return (
+        self.load_score = (
             cpu_weight * cpu_score
             + memory_weight * memory_score
             + response_weight * response_score
@@ -120,14 +189,12 @@ class UpstreamServer:
 
     def can_accept_request(self, cpu_requirement=0.5, memory_requirement=0.1):
         """Check if server can accept new request with resource requirements"""
-        if self.status not in [ServerStatus.HEALTHY, ServerStatus.DEGRADED]:
+        if self.status not in _ACCEPTING_STATUSES:
             return False
 
-        cpu_available = self.cpu_cores - self.current_cpu_usage
-        memory_available = self.memory_gb - self.current_memory_usage
-
         return (
-            cpu_available >= cpu_requirement and memory_available >= memory_requirement
+            self.cpu_cores - self.current_cpu_usage >= cpu_requirement
+            and self.memory_gb - self.current_memory_usage >= memory_requirement
         )
 
     def add_connection(
@@ -141,63 +208,69 @@ class UpstreamServer:
         self.total_requests += 1
         self.current_cpu_usage += cpu_requirement
         self.current_memory_usage += memory_requirement
-
-        request_data = {
-            "start_time": time.time(),
-            "cpu_requirement": cpu_requirement,
-            "memory_requirement": memory_requirement,
-            "processing_time": processing_time * self.base_processing_speed,
-            "remaining_time": processing_time * self.base_processing_speed,
-        }
-        self.processing_requests.append(request_data)
+        self.refresh_load()
+
+        self.fleet.add_request(
+            self.fleet_index,
+            processing_time * self.base_processing_speed,
+            cpu_requirement,
+            memory_requirement,
+            time.time(),
+        )
 
         return True
 
+    def _complete_requests(self, response_times, freed_cpu, freed_memory):
+        """Record requests the fleet finished and give back their resources"""
+        self._record_response_times(response_times.tolist())
+        self.response_count += len(response_times)
+        self.total_response_time += float(response_times.sum())
+
+        self.current_cpu_usage = max(0.0, self.current_cpu_usage - freed_cpu)
+        self.current_memory_usage = max(0.0, self.current_memory_usage - freed_memory)
+
+    def _record_response_times(self, response_times):
+        """Append completed response times and refresh the rolling average"""
+        history = self.response_times
+        for response_time in response_times:
+            if len(history) == history.maxlen:
+                self._response_sum -= history[0]
+            history.append(response_time)
+            self._response_sum += response_time
+        self.avg_response_time = self._response_sum / len(history)
+
+    def clear_response_times(self):
+        """Forget the rolling response-time window"""
+        self.response_times.clear()
+        self._response_sum = 0.0
+
+    def clear_requests(self):
+        """Drop all in-flight requests without recording their completion"""
+        self.fleet.clear_server(self.fleet_index)
+
     def remove_connection(self):
         """Remove connection and free resources - only used for manual cleanup"""
 
         pass
 
-    def update(self):
-        """Update server state, process requests, and handle failures"""
+    def update(self, ticks=1):
+        """Update status and failures; requests complete only in ServerFleet.advance"""
+        # The server does not drain its own queue: whoever owns self.fleet must
+        # call advance() every tick before update(), or requests never finish.
+        # `ticks` > 1 only comes from the throttled idle loop, where one call
+        # stands for several 60 Hz ticks of the failure and recovery clocks.
         current_time = time.time()
 
-        completed_requests = []
-        for i, request in enumerate(self.processing_requests):
-            request["remaining_time"] -= 1 / 60
-
-            if request["remaining_time"] <= 0:
-
-                response_time = current_time - request["start_time"]
-                self.response_times.append(response_time)
-                self.total_response_time += response_time
-
-                self.current_cpu_usage = max(
-                    0, self.current_cpu_usage - request["cpu_requirement"]
-                )
-                self.current_memory_usage = max(
-                    0, self.current_memory_usage - request["memory_requirement"]
-                )
-
-                completed_requests.append(i)
-
-        for i in sorted(completed_requests, reverse=True):
-            del self.processing_requests[i]
-
-        self.active_connections = len(self.processing_requests)
-
-        self.current_cpu_usage = max(0, self.current_cpu_usage)
-        self.current_memory_usage = max(0, self.current_memory_usage)
-
-        if self.response_times:
-            self.avg_response_time = np.mean(self.response_times)
+        self.refresh_load()
 
         self._update_status()
 
-        self._simulate_failures_and_recovery(current_time)
+        self._simulate_failures_and_recovery(current_time, ticks)
+        self.refresh_load()
 
-        current_load = self.load_score if self.load_score != float("inf") else 1.0
-        self.load_history.append(current_load)
+        # Failed or stressed servers (infinite score) count as fully loaded.
+        load_score = self.load_score
+        self.load_history.append(1.0 if load_score == math.inf else load_score)
 
         self.pulse_intensity = (self.pulse_intensity + 0.1) % (2 * 3.14159)
 
@@ -211,29 +284,42 @@ class UpstreamServer:
 
         if cpu_util > 95 or memory_util > 95:
             self.status = ServerStatus.OVERLOADED
-            self.failure_probability = 0.001
+            self._set_failure_probability(0.001)
         elif cpu_util > 80 or memory_util > 80:
             self.status = ServerStatus.DEGRADED
-            self.failure_probability = 0.0005
+            self._set_failure_probability(0.0005)
         else:
             self.status = ServerStatus.HEALTHY
-            self.failure_probability = 0.0001
+            self._set_failure_probability(0.0001)
+
+    def _sample_ticks_to_failure(self):
+        """Draw the number of ticks until the next failure (geometric in p)"""
+        survival = 1.0 - random.random()
+        return int(math.log(survival) / math.log(1.0 - self.failure_probability)) + 1
+
+    def _set_failure_probability(self, probability):
+        """Change the per-tick failure odds, redrawing the countdown if they moved"""
+        if probability != self.failure_probability:
+            self.failure_probability = probability
+            self._ticks_to_failure = self._sample_ticks_to_failure()
 
-    def _simulate_failures_and_recovery(self, current_time):
-        """Simulate random server failures and recovery"""
+    def _simulate_failures_and_recovery(self, current_time, ticks=1):
+        """Simulate random server failures and recovery over `ticks` ticks"""
         if self.status == ServerStatus.FAILED:
 
             if self.recovery_time > 0:
-                self.recovery_time -= 1 / 60
+                self.recovery_time -= ticks / _TICK_RATE
             else:
                 self.status = ServerStatus.HEALTHY
                 self.current_cpu_usage = 0
                 self.current_memory_usage = 0
                 self.active_connections = 0
-                self.processing_requests.clear()
+                self.clear_requests()
         else:
 
-            if random.random() < self.failure_probability:
+            self._ticks_to_failure -= ticks
+            if self._ticks_to_failure <= 0:
+                self._ticks_to_failure = self._sample_ticks_to_failure()
                 self.status = ServerStatus.FAILED
                 self.recovery_time = random.uniform(5, 15)
                 self.last_failure_time = current_time
@@ -241,10 +327,10 @@ class UpstreamServer:
                 self.current_cpu_usage = 0
                 self.current_memory_usage = 0
                 self.active_connections = 0
-                self.processing_requests.clear()
+                self.clear_requests()
 
     def is_overloaded(self):
-        return self.status in [ServerStatus.OVERLOADED, ServerStatus.FAILED]
+        return self.status in _OVERLOADED_STATUSES
 
     def get_server_info(self):
         """Get comprehensive server information"""
@@ -262,17 +348,10 @@ class UpstreamServer:
 
     def draw(self, screen, font):
 
-        base_colors = {
-            ServerStatus.HEALTHY: (100, 255, 100),
-            ServerStatus.DEGRADED: (255, 255, 100),
-            ServerStatus.OVERLOADED: (255, 150, 50),
-            ServerStatus.FAILED: (255, 50, 50),
-        }
-
-        base_color = base_colors[self.status]
+        base_color = _STATUS_COLORS[self.status]
 
         if self.status == ServerStatus.FAILED:
-            pulse = abs(np.sin(self.pulse_intensity)) * 100
+            pulse = abs(math.sin(self.pulse_intensity)) * 100
             color = (min(255, base_color[0] + pulse), base_color[1], base_color[2])
         else:
 
@@ -282,23 +361,14 @@ class UpstreamServer:
             intensity_factor = 0.5 + (load_intensity * 0.5)
             color = tuple(int(c * intensity_factor) for c in base_color)
 
-        pygame.draw.circle(screen, color, (self.x, self.y), self.size // 2)
-
-        border_colors = {
-            ServerType.STANDARD: (255, 255, 255),
-            ServerType.HIGH_PERFORMANCE: (255, 215, 0),
-            ServerType.MEMORY_OPTIMIZED: (0, 191, 255),
-            ServerType.CPU_OPTIMIZED: (255, 20, 147),
-        }
-        border_color = border_colors[self.server_type]
-        pygame.draw.circle(screen, border_color, (self.x, self.y), self.size // 2, 3)
+        radius = self._radius
+        pygame.draw.circle(screen, color, (self.x, self.y), radius)
+        pygame.draw.circle(screen, self._border_color, (self.x, self.y), radius, 3)
 
-        name_text = font.render(
-            f"{self.name} ({self.server_type.value[:4].upper()})", True, (255, 255, 255)
-        )
-        name_rect = name_text.get_rect(
-            left=self.x + self.size // 2 + 10, centery=self.y - 15
-        )
+        if self._name_surface is None:
+            self._name_surface = font.render(self._name_label, True, (255, 255, 255))
+        name_text = self._name_surface
+        name_rect = name_text.get_rect(left=self.x + radius + 10, centery=self.y - 15)
         screen.blit(name_text, name_rect)
 
         metrics = [
@@ -313,9 +383,9 @@ class UpstreamServer:
         ]
 
         for i, metric in enumerate(metrics):
-            metric_text = font.render(metric, True, (255, 255, 255))
+            metric_text = _render_cached(font, metric, (255, 255, 255))
             metric_rect = metric_text.get_rect(
-                left=self.x + self.size // 2 + 10, centery=self.y + (i * 12) - 5
+                left=self.x + radius + 10, centery=self.y + (i * 12) - 5
             )
             screen.blit(metric_text, metric_rect)
 
@@ -327,31 +397,123 @@ class UpstreamServer:
 
         for i, info in enumerate(additional_info):
             color = (200, 200, 200) if i < 2 else (150, 150, 255)
-            info_text = font.render(info, True, color)
+            info_text = _render_cached(font, info, color)
             info_rect = info_text.get_rect(center=(self.x, self.y + 40 + (i * 15)))
             screen.blit(info_text, info_rect)
 
-        bar_width = 60
-        bar_height = 4
-
-        cpu_bar_rect = pygame.Rect(
-            self.x - bar_width // 2, self.y + 85, bar_width, bar_height
-        )
-        pygame.draw.rect(screen, (100, 100, 100), cpu_bar_rect)
-        cpu_fill_width = int((self.cpu_utilization / 100) * bar_width)
-        cpu_fill_rect = pygame.Rect(
-            self.x - bar_width // 2, self.y + 85, cpu_fill_width, bar_height
-        )
-        cpu_color = (255, 100, 100) if self.cpu_utilization > 80 else (100, 255, 100)
+        pygame.draw.rect(screen, _BAR_TRACK_COLOR, self._cpu_bar_rect)
+        cpu_fill_rect = self._cpu_fill_rect
+        cpu_fill_rect.width = int((self.cpu_utilization / 100) * _BAR_WIDTH)
+        cpu_color = _BAR_HOT_COLOR if self.cpu_utilization > 80 else _BAR_OK_COLOR
         pygame.draw.rect(screen, cpu_color, cpu_fill_rect)
 
-        mem_bar_rect = pygame.Rect(
-            self.x - bar_width // 2, self.y + 92, bar_width, bar_height
-        )
-        pygame.draw.rect(screen, (100, 100, 100), mem_bar_rect)
-        mem_fill_width = int((self.memory_utilization / 100) * bar_width)
-        mem_fill_rect = pygame.Rect(
-            self.x - bar_width // 2, self.y + 92, mem_fill_width, bar_height
-        )
-        mem_color = (255, 100, 100) if self.memory_utilization > 80 else (100, 255, 100)
+        pygame.draw.rect(screen, _BAR_TRACK_COLOR, self._mem_bar_rect)
+        mem_fill_rect = self._mem_fill_rect
+        mem_fill_rect.width = int((self.memory_utilization / 100) * _BAR_WIDTH)
+        mem_color = _BAR_HOT_COLOR if self.memory_utilization > 80 else _BAR_OK_COLOR
         pygame.draw.rect(screen, mem_color, mem_fill_rect)
+
+
+class ServerFleet:
+    """In-flight requests of a group of servers, advanced together in one pass"""
+
+    _COLUMNS = ("_rem_time", "_cpu_req", "_mem_req", "_start_time", "_server_id")
+
+    def __init__(self, servers):
+        self.servers = list(servers)
+        for index, server in enumerate(self.servers):
+            server.join_fleet(self, index)
+
+        # Parallel request columns; only the first _n slots are live.
+        self._rem_time = np.empty(_INITIAL_REQUEST_CAPACITY)
+        self._cpu_req = np.empty(_INITIAL_REQUEST_CAPACITY)
+        self._mem_req = np.empty(_INITIAL_REQUEST_CAPACITY)
+        self._start_time = np.empty(_INITIAL_REQUEST_CAPACITY)
+        self._server_id = np.empty(_INITIAL_REQUEST_CAPACITY, dtype=np.int32)
+        self._n = 0
+
+    def add_request(
+        self, server_index, remaining_time, cpu_requirement, memory_requirement, start
+    ):
+        """Queue one request for the server at `server_index`"""
+        n = self._n
+        if n == self._rem_time.size:
+            self._grow()
+        self._rem_time[n] = remaining_time
+        self._cpu_req[n] = cpu_requirement
+        self._mem_req[n] = memory_requirement
+        self._start_time[n] = start
+        self._server_id[n] = server_index
+        self._n = n + 1
+
+    def _grow(self):
+        """Double the capacity of the request columns"""
+        capacity = self._rem_time.size * 2
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self._n] = column[: self._n]
+            setattr(self, name, grown)
+
+    def _compact(self, keep):
+        """Keep only the live requests selected by the boolean mask"""
+        n = int(np.count_nonzero(keep))
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            column[:n] = column[: self._n][keep]
+        self._n = n
+
+    def clear_server(self, server_index):
+        """Drop one server's requests without recording their completion"""
+        if self._n:
+            self._compact(self._server_id[: self._n] != server_index)
+
+    def advance(self, current_time, dt=1 / 60):
+        """Tick every request and settle completions on their servers"""
+        servers = self.servers
+        n = self._n
+        if n:
+            rem_time = self._rem_time[:n]
+            rem_time -= dt
+            done = rem_time <= 0
+
+            if done.any():
+                done_ids = self._server_id[:n][done]
+                count = len(servers)
+                freed_cpu = np.bincount(
+                    done_ids, weights=self._cpu_req[:n][done], minlength=count
+                )
+                freed_memory = np.bincount(
+                    done_ids, weights=self._mem_req[:n][done], minlength=count
+                )
+                response_times = current_time - self._start_time[:n][done]
+                for index in np.unique(done_ids).tolist():
+                    servers[index]._complete_requests(
+                        response_times[done_ids == index],
+                        float(freed_cpu[index]),
+                        float(freed_memory[index]),
+                    )
+                self._compact(~done)
+
+        active = np.bincount(self._server_id[: self._n], minlength=len(servers))
+        for server, connections in zip(servers, active.tolist()):
+            server.active_connections = connections
+
+
+def snapshot_servers(servers):
+    """Read the fleet once into parallel columns for reporting"""
+    cpu_usage = np.fromiter((s.current_cpu_usage for s in servers), float)
+    cpu_cores = np.fromiter((s.cpu_cores for s in servers), float)
+    memory_usage = np.fromiter((s.current_memory_usage for s in servers), float)
+    memory_gb = np.fromiter((s.memory_gb for s in servers), float)
+    return (
+        [s.name for s in servers],
+        [s.server_type.value for s in servers],
+        [s.status.value for s in servers],
+        np.minimum(100.0, cpu_usage / cpu_cores * 100),
+        np.minimum(100.0, memory_usage / memory_gb * 100),
+        [s.active_connections for s in servers],
+        [s.load_score for s in servers],
+        [s.avg_response_time for s in servers],
+        [s.total_requests for s in servers],
+    )
@@ -2,7 +2,8 @@ import pygame
 import math
 import random
 import time
-from enum import Enum
+from enum import Enum, IntEnum
+import numpy as np
 
 
 class UserType(Enum):
@@ -13,7 +14,21 @@ class UserType(Enum):
     NAUGHTY = "naughty"
 
 
-class RequestPriority(Enum):
+SIMULATION_USER = 0x1
+
+_sqrt = math.sqrt
+
+USER_TYPES = tuple(UserType)
+USER_TYPE_IDS = {user_type: i for i, user_type in enumerate(USER_TYPES)}
+
+# Rendered user labels keyed by (text, color); the label alphabet is small and fixed.
+_LABEL_CACHE = {}
+# Naughty-user aura surfaces keyed by (radius, rgb, quantized alpha), LRU order.
+_AURA_CACHE = {}
+_AURA_CACHE_SIZE = 256
+
+
+class RequestPriority(IntEnum):
     LOW = 1
     NORMAL = 2
     HIGH = 3
@@ -30,7 +45,176 @@ class AttackType(Enum):
     PRIORITY_ABUSE = "priority_abuse"
 
 
+_rng = np.random.default_rng()
+
+_CHOICE_BATCH = 4096
+
+
+class _BatchedChoice:
+    """Weighted choice served from a pre-drawn batch instead of one draw per call"""
+
+    def __init__(self, options, weights, batch_size=_CHOICE_BATCH):
+        self.options = list(options)
+        cdf = np.cumsum(weights, dtype=float)
+        self.cdf = cdf / cdf[-1]
+        self.cdf[-1] = 1.0
+        self.batch_size = batch_size
+        self._batch = []
+
+    def draw(self):
+        """Next pick, refilling the batch when it runs out"""
+        if not self._batch:
+            picks = np.searchsorted(
+                self.cdf, _rng.random(self.batch_size), side="right"
+            )
+            options = self.options
+            self._batch = [options[i] for i in picks.tolist()]
+        return self._batch.pop()
+
+
+_unit_batch = []
+
+
+def _uniform(low, high):
+    """random.uniform equivalent served from a pre-drawn batch of unit floats"""
+    if not _unit_batch:
+        _unit_batch.extend(_rng.random(_CHOICE_BATCH).tolist())
+    return low + (high - low) * _unit_batch.pop()
+
+
+_USER_TYPE_CHOICE = _BatchedChoice(USER_TYPES, [0.39, 0.3, 0.18, 0.12, 0.01])
+_ATTACK_TYPE_CHOICE = _BatchedChoice(AttackType, [0.3, 0.25, 0.2, 0.15, 0.1])
+_STEALTH_PRIORITY_CHOICE = _BatchedChoice(RequestPriority, [0.4, 0.4, 0.15, 0.05])
+_ATTACK_PRIORITY_CHOICE = _BatchedChoice(RequestPriority, [0.1, 0.2, 0.3, 0.4])
+_BURST_PRIORITY_CHOICE = _BatchedChoice(RequestPriority, [0.1, 0.3, 0.4, 0.2])
+_HEAVY_PRIORITY_CHOICE = _BatchedChoice(RequestPriority, [0.2, 0.4, 0.3, 0.1])
+_DEFAULT_PRIORITY_CHOICE = _BatchedChoice(RequestPriority, [0.3, 0.5, 0.15, 0.05])
+
+# Per-type tables, indexed by user_type_id (UserType declaration order).
+# (base_speed, patience_multiplier, retry_probability)
+_TYPE_CONFIGS = (
+    (2.5, 0.8, 0.3),
+    (2.0, 1.0, 0.5),
+    (1.5, 1.5, 0.8),
+    (3.0, 0.6, 0.9),
+    (4.0, 0.1, 0.95),
+)
+_STEALTH_BASE_SPEED = 2.5
+
+# Waiting is counted in fixed 60 Hz simulation frames.
+_FRAME_RATE = 60
+_RETRY_FRAMES = _FRAME_RATE
+_NAUGHTY_RETRY_FRAMES = _FRAME_RATE // 10
+
+# Naughty users take their ranges from the attack type instead.
+_CPU_RANGES = ((0.1, 0.5), (0.3, 1.0), (0.8, 2.0), (0.2, 0.8))
+_MEMORY_RANGES = ((0.05, 0.2), (0.1, 0.5), (0.3, 1.5), (0.08, 0.3))
+_BASE_PROCESSING_TIMES = (0.5, 1.5, 3.0, 1.0)
+_BASE_WAITING_TIMES = (3.0, 5.0, 8.0, 2.0)
+_TYPE_COLORS = ((150, 200, 255), (100, 150, 255), (50, 100, 200), (255, 150, 50))
+
+_ATTACK_COLORS = {
+    AttackType.DOS: (255, 0, 0),
+    AttackType.RESOURCE_EXHAUSTION: (150, 0, 150),
+    AttackType.SLOWLORIS: (255, 100, 0),
+    AttackType.AMPLIFICATION: (255, 0, 150),
+    AttackType.PRIORITY_ABUSE: (100, 0, 0),
+}
+
+# |sin| over one turn of the draw pulse, which advances ~0.15 rad per frame.
+_PULSE_STEPS = 42
+_PULSE_SIN = tuple(
+    abs(math.sin(i * 2 * math.pi / _PULSE_STEPS)) for i in range(_PULSE_STEPS)
+)
+
+# Fixed body colors by state; processing and waiting users are shaded in draw().
+_STATE_COLORS = {
+    "timeout_exit": (255, 100, 100),
+    "moving_to_server": (0, 255, 150),
+    "retry": (255, 255, 0),
+}
+
+_PRIORITY_COLORS = {
+    RequestPriority.LOW: (100, 100, 100),
+    RequestPriority.NORMAL: (255, 255, 255),
+    RequestPriority.HIGH: (255, 255, 0),
+    RequestPriority.CRITICAL: (255, 0, 0),
+}
+
+_TYPE_LABELS = {
+    UserType.LIGHT: "L",
+    UserType.STANDARD: "S",
+    UserType.HEAVY: "H",
+    UserType.BURST: "B",
+}
+
+_ATTACK_LABELS = {
+    AttackType.DOS: "DOS",
+    AttackType.RESOURCE_EXHAUSTION: "RES_EXHAUST",
+    AttackType.SLOWLORIS: "SLOWLORIS",
+    AttackType.AMPLIFICATION: "AMPLIFICATION",
+    AttackType.PRIORITY_ABUSE: "PRIORITY_ABUSE",
+}
+
+
 class User:
+    __slots__ = (
+        "_attack_frame",
+        "_attack_label",
+        "_draw_radius",
+        "_priority_color",
+        "_pulse_index",
+        "_spawn_frames",
+        "_type_label",
+        "arrival_time",
+        "attack_duration",
+        "attack_intensity",
+        "attack_start_time",
+        "attack_type",
+        "color",
+        "completion_time",
+        "cpu_requirement",
+        "failed",
+        "flags",
+        "is_attacking",
+        "load_balancer",
+        "load_balancer_reached_time",
+        "max_retries",
+        "max_spawn_count",
+        "max_waiting_frames",
+        "max_waiting_time",
+        "memory_requirement",
+        "patience_multiplier",
+        "previous_state",
+        "priority",
+        "processing_elapsed",
+        "processing_start_time",
+        "processing_time",
+        "radius",
+        "request_id",
+        "retry_count",
+        "retry_probability",
+        "screen_height",
+        "simulation_id",
+        "spawn_count",
+        "spawn_time",
+        "spawned_requests",
+        "speed",
+        "state",
+        "stealth_mode",
+        "target_server",
+        "timeout_exit",
+        "unique_id",
+        "user_type",
+        "user_type_id",
+        "waiting_frames",
+        "x",
+        "y",
+    )
+
+    # Shared label font, created on first draw once pygame.font is initialized.
+    _font = None
+
     def __init__(self, x, y, load_balancer, user_type=None):
         self.x = float(x)
         self.y = float(y)
@@ -45,15 +229,18 @@ class User:
         self.screen_height = 800
 
         self.user_type = user_type or self._generate_user_type()
+        self.user_type_id = USER_TYPE_IDS[self.user_type]
 
         if self.user_type == UserType.NAUGHTY:
             self.attack_type = self._generate_attack_type()
-            self.attack_intensity = random.uniform(0.5, 3.0)
+            self.attack_intensity = _uniform(0.5, 3.0)
             self.spawn_count = 0
             self.max_spawn_count = random.randint(1, 3)
-            self.attack_duration = random.uniform(5.0, 15.0)
+            self.attack_duration = _uniform(5.0, 15.0)
             self.attack_start_time = 0
             self.is_attacking = False
+            self._attack_frame = 0
+            self._spawn_frames = []
             self.spawned_requests = []
             self.stealth_mode = random.choice([True, False])
         else:
@@ -64,6 +251,8 @@ class User:
             self.attack_duration = 0
             self.attack_start_time = 0
             self.is_attacking = False
+            self._attack_frame = 0
+            self._spawn_frames = []
             self.spawned_requests = []
             self.stealth_mode = False
 
@@ -75,113 +264,91 @@ class User:
         self.processing_time = self._generate_processing_time()
 
         self.arrival_time = time.time()
-        self.waiting_time = 0
+        self.spawn_time = self.arrival_time
+        self.waiting_frames = 0
         self.max_waiting_time = self._get_max_waiting_time()
+        self.max_waiting_frames = math.ceil(self.max_waiting_time * _FRAME_RATE)
         self.processing_start_time = 0
         self.completion_time = 0
         self.processing_elapsed = 0
         self.load_balancer_reached_time = 0
 
         self.color = self._get_user_color()
-        self.pulse_intensity = 0
+        self._pulse_index = 0
 
         self.retry_count = 0
-        self.max_retries = 3 if self.priority.value >= 3 else 1
+        self.max_retries = 3 if self.priority >= RequestPriority.HIGH else 1
 
         self.request_id = random.randint(10000, 99999)
 
-        self.is_simulation_user = False
+        self.flags = 0
         self.simulation_id = None
         self.unique_id = None
 
+        self._precompute_draw_state()
+
+    @property
+    def is_simulation_user(self):
+        """Whether the user was spawned during an active simulation run"""
+        return bool(self.flags & SIMULATION_USER)
+
+    @is_simulation_user.setter
+    def is_simulation_user(self, value):
+        if value:
+            self.flags |= SIMULATION_USER
+        else:
+            self.flags &= ~SIMULATION_USER
+
     def _generate_user_type(self):
         """Generate user type based on probability distribution"""
-        weights = [0.39, 0.3, 0.18, 0.12, 0.01]
-        return random.choices(list(UserType), weights=weights)[0]
+        return _USER_TYPE_CHOICE.draw()
 
     def _generate_attack_type(self):
         """Generate attack type for naughty users"""
-        weights = [0.3, 0.25, 0.2, 0.15, 0.1]
-        return random.choices(list(AttackType), weights=weights)[0]
+        return _ATTACK_TYPE_CHOICE.draw()
 
     def _set_user_characteristics(self):
         """Set user characteristics based on type"""
-        type_configs = {
-            UserType.LIGHT: {
-                "base_speed": 2.5,
-                "patience_multiplier": 0.8,
-                "retry_probability": 0.3,
-            },
-            UserType.STANDARD: {
-                "base_speed": 2.0,
-                "patience_multiplier": 1.0,
-                "retry_probability": 0.5,
-            },
-            UserType.HEAVY: {
-                "base_speed": 1.5,
-                "patience_multiplier": 1.5,
-                "retry_probability": 0.8,
-            },
-            UserType.BURST: {
-                "base_speed": 3.0,
-                "patience_multiplier": 0.6,
-                "retry_probability": 0.9,
-            },
-            UserType.NAUGHTY: {
-                "base_speed": 2.5 if self.stealth_mode else 4.0,
-                "patience_multiplier": 0.1,
-                "retry_probability": 0.95,
-            },
-        }
-
-        config = type_configs[self.user_type]
-        self.speed = config["base_speed"] + random.uniform(-0.5, 0.5)
-        self.patience_multiplier = config["patience_multiplier"]
-        self.retry_probability = config["retry_probability"]
+        base_speed, patience_multiplier, retry_probability = _TYPE_CONFIGS[
+            self.user_type_id
+        ]
+        if self.user_type == UserType.NAUGHTY and self.stealth_mode:
+            base_speed = _STEALTH_BASE_SPEED
+        self.speed = base_speed + _uniform(-0.5, 0.5)
+        self.patience_multiplier = patience_multiplier
+        self.retry_probability = retry_probability
 
     def _generate_cpu_requirement(self):
         """Generate CPU requirement based on user type"""
         if self.user_type == UserType.NAUGHTY:
             if self.attack_type == AttackType.RESOURCE_EXHAUSTION:
-                return random.uniform(2.0, 5.0)
+                return _uniform(2.0, 5.0)
             elif self.attack_type == AttackType.DOS:
-                return random.uniform(0.1, 0.3)
+                return _uniform(0.1, 0.3)
             elif self.attack_type == AttackType.SLOWLORIS:
-                return random.uniform(0.05, 0.15)
+                return _uniform(0.05, 0.15)
             elif self.stealth_mode:
-                return random.uniform(0.2, 0.8)
+                return _uniform(0.2, 0.8)
             else:
-                return random.uniform(1.0, 3.0)
+                return _uniform(1.0, 3.0)
 
-        type_ranges = {
-            UserType.LIGHT: (0.1, 0.5),
-            UserType.STANDARD: (0.3, 1.0),
-            UserType.HEAVY: (0.8, 2.0),
-            UserType.BURST: (0.2, 0.8),
-        }
-        min_cpu, max_cpu = type_ranges[self.user_type]
-        return random.uniform(min_cpu, max_cpu)
+        min_cpu, max_cpu = _CPU_RANGES[self.user_type_id]
+        return _uniform(min_cpu, max_cpu)
 
     def _generate_memory_requirement(self):
         """Generate memory requirement based on user type"""
         if self.user_type == UserType.NAUGHTY:
             if self.attack_type == AttackType.RESOURCE_EXHAUSTION:
-                return random.uniform(1.5, 4.0)
+                return _uniform(1.5, 4.0)
             elif self.attack_type == AttackType.AMPLIFICATION:
-                return random.uniform(0.5, 1.5)
+                return _uniform(0.5, 1.5)
             elif self.stealth_mode:
-                return random.uniform(0.1, 0.4)
+                return _uniform(0.1, 0.4)
             else:
-                return random.uniform(0.8, 2.0)
+                return _uniform(0.8, 2.0)
 
-        type_ranges = {
-            UserType.LIGHT: (0.05, 0.2),
-            UserType.STANDARD: (0.1, 0.5),
-            UserType.HEAVY: (0.3, 1.5),
-            UserType.BURST: (0.08, 0.3),
-        }
-        min_mem, max_mem = type_ranges[self.user_type]
-        return random.uniform(min_mem, max_mem)
+        min_mem, max_mem = _MEMORY_RANGES[self.user_type_id]
+        return _uniform(min_mem, max_mem)
 
     def _generate_priority(self):
         """Generate request priority based on user type"""
@@ -189,70 +356,46 @@ class User:
             if self.attack_type == AttackType.PRIORITY_ABUSE:
                 return RequestPriority.CRITICAL
             elif self.stealth_mode:
-                return random.choices(
-                    list(RequestPriority), weights=[0.4, 0.4, 0.15, 0.05]
-                )[0]
+                return _STEALTH_PRIORITY_CHOICE.draw()
             else:
-                return random.choices(
-                    list(RequestPriority), weights=[0.1, 0.2, 0.3, 0.4]
-                )[0]
+                return _ATTACK_PRIORITY_CHOICE.draw()
 
         if self.user_type == UserType.BURST:
-            return random.choices(list(RequestPriority), weights=[0.1, 0.3, 0.4, 0.2])[
-                0
-            ]
+            return _BURST_PRIORITY_CHOICE.draw()
         elif self.user_type == UserType.HEAVY:
-            return random.choices(list(RequestPriority), weights=[0.2, 0.4, 0.3, 0.1])[
-                0
-            ]
+            return _HEAVY_PRIORITY_CHOICE.draw()
         else:
-            return random.choices(
-                list(RequestPriority), weights=[0.3, 0.5, 0.15, 0.05]
-            )[0]
+            return _DEFAULT_PRIORITY_CHOICE.draw()
 
     def _generate_processing_time(self):
         """Generate processing time based on user type and requirements"""
         if self.user_type == UserType.NAUGHTY:
             if self.attack_type == AttackType.SLOWLORIS:
-                return random.uniform(10.0, 30.0)
+                return _uniform(10.0, 30.0)
             elif self.attack_type == AttackType.DOS:
-                return random.uniform(0.1, 0.5)
+                return _uniform(0.1, 0.5)
             elif self.attack_type == AttackType.RESOURCE_EXHAUSTION:
-                return random.uniform(8.0, 20.0)
+                return _uniform(8.0, 20.0)
             elif self.stealth_mode:
-                return random.uniform(2.0, 5.0)
+                return _uniform(2.0, 5.0)
             else:
-                return random.uniform(5.0, 15.0)
+                return _uniform(5.0, 15.0)
 
-        base_times = {
-            UserType.LIGHT: 0.5,
-            UserType.STANDARD: 1.5,
-            UserType.HEAVY: 3.0,
-            UserType.BURST: 1.0,
-        }
-
-        base_time = base_times[self.user_type]
+        base_time = _BASE_PROCESSING_TIMES[self.user_type_id]
 
         resource_factor = (self.cpu_requirement + self.memory_requirement) / 2
-        priority_factor = 1.0 / self.priority.value
+        priority_factor = 1.0 / self.priority
 
         final_time = base_time * resource_factor * priority_factor
-        return max(0.5, final_time + random.uniform(-1.0, 1.0))
+        return max(0.5, final_time + _uniform(-1.0, 1.0))
 
     def _get_max_waiting_time(self):
         """Get maximum waiting time based on user type and priority"""
         if self.user_type == UserType.NAUGHTY:
             return 1.0
 
-        base_waiting = {
-            UserType.LIGHT: 3.0,
-            UserType.STANDARD: 5.0,
-            UserType.HEAVY: 8.0,
-            UserType.BURST: 2.0,
-        }
-
-        base = base_waiting[self.user_type] * self.patience_multiplier
-        priority_bonus = self.priority.value * 1.5
+        base = _BASE_WAITING_TIMES[self.user_type_id] * self.patience_multiplier
+        priority_bonus = self.priority * 1.5
 
         return base + priority_bonus
 
@@ -264,38 +407,27 @@ class User:
                 return (120, 180, 255)
             else:
 
-                attack_colors = {
-                    AttackType.DOS: (255, 0, 0),
-                    AttackType.RESOURCE_EXHAUSTION: (150, 0, 150),
-                    AttackType.SLOWLORIS: (255, 100, 0),
-                    AttackType.AMPLIFICATION: (255, 0, 150),
-                    AttackType.PRIORITY_ABUSE: (100, 0, 0),
-                }
-                return attack_colors.get(self.attack_type, (255, 0, 0))
+                return _ATTACK_COLORS.get(self.attack_type, (255, 0, 0))
 
-        type_colors = {
-            UserType.LIGHT: (150, 200, 255),
-            UserType.STANDARD: (100, 150, 255),
-            UserType.HEAVY: (50, 100, 200),
-            UserType.BURST: (255, 150, 50),
-        }
-
-        base_color = type_colors[self.user_type]
+        base_color = _TYPE_COLORS[self.user_type_id]
 
-        priority_multiplier = 0.7 + (self.priority.value * 0.1)
+        priority_multiplier = 0.7 + (self.priority * 0.1)
         return tuple(min(255, int(c * priority_multiplier)) for c in base_color)
 
     def set_screen_height(self, height):
         self.screen_height = height
 
-    def _execute_attack_behavior(self):
+    def _execute_attack_behavior(self, now):
         """Execute specific attack behaviors based on attack type"""
         if not self.is_attacking:
             self.is_attacking = True
-            self.attack_start_time = time.time()
+            self.attack_start_time = now
+            self._attack_frame = 0
+            if self.attack_type == AttackType.AMPLIFICATION:
+                self._spawn_frames = self._schedule_amplification_spawns()
+        self._attack_frame += 1
 
-        current_time = time.time()
-        attack_elapsed = current_time - self.attack_start_time
+        attack_elapsed = now - self.attack_start_time
 
         if attack_elapsed >= self.attack_duration:
             if (
@@ -318,17 +450,18 @@ class User:
 
         elif self.attack_type == AttackType.AMPLIFICATION:
 
+            spawn_frames = self._spawn_frames
             if (
                 self.spawn_count < self.max_spawn_count
-                and random.random() < self.attack_intensity * 0.1
+                and spawn_frames
+                and spawn_frames[-1] <= self._attack_frame
             ):
-
-                spawn_this_round = random.randint(2, 4)
-                for _ in range(spawn_this_round):
-                    if self.spawn_count < self.max_spawn_count:
-                        new_user = self._create_attack_clone()
-                        new_users.append(new_user)
-                        self.spawn_count += 1
+                spawn_frames.pop()
+                remaining = self.max_spawn_count - self.spawn_count
+                for _ in range(min(random.randint(2, 4), remaining)):
+                    new_user = self._create_attack_clone()
+                    new_users.append(new_user)
+                    self.spawn_count += 1
 
         elif self.attack_type == AttackType.SLOWLORIS:
 
@@ -340,6 +473,7 @@ class User:
                 new_user = self._create_attack_clone()
                 new_user.cpu_requirement *= 1.5
                 new_user.memory_requirement *= 1.5
+                new_user._precompute_draw_state()
                 new_users.append(new_user)
 
         elif self.attack_type == AttackType.PRIORITY_ABUSE:
@@ -347,34 +481,45 @@ class User:
             if random.random() < self.attack_intensity * 0.2:
                 new_user = self._create_attack_clone()
                 new_user.priority = RequestPriority.CRITICAL
+                new_user._precompute_draw_state()
                 new_users.append(new_user)
 
         return new_users
 
+    def _schedule_amplification_spawns(self):
+        """Attack frames of the spawn bursts, latest first"""
+        rate = min(1.0, self.attack_intensity * 0.1)
+        if rate <= 0:
+            return []
+        # Bursts fire with probability `rate` per attack frame, so the gaps are
+        # geometric; each burst spawns at least one clone, so max_spawn_count
+        # bursts always suffice.
+        frames = _rng.geometric(rate, self.max_spawn_count).cumsum()
+        return frames[::-1].tolist()
+
     def _create_attack_clone(self):
         """Create a clone of this attack user with slight variations"""
 
-        new_x = self.load_balancer.x + random.uniform(-50, 50)
-        new_y = random.uniform(50, 150)
+        new_x = self.load_balancer.x + _uniform(-50, 50)
+        new_y = _uniform(50, 150)
 
         clone = User(new_x, new_y, self.load_balancer, UserType.NAUGHTY)
         clone.attack_type = self.attack_type
         clone.stealth_mode = self.stealth_mode
-        clone.attack_intensity = self.attack_intensity * random.uniform(0.8, 1.2)
+        clone.attack_intensity = self.attack_intensity * _uniform(0.8, 1.2)
 
         if not self.stealth_mode:
-            clone.cpu_requirement = self.cpu_requirement * random.uniform(0.8, 1.2)
-            clone.memory_requirement = self.memory_requirement * random.uniform(
-                0.8, 1.2
-            )
-            clone.processing_time = self.processing_time * random.uniform(0.9, 1.1)
+            clone.cpu_requirement = self.cpu_requirement * _uniform(0.8, 1.2)
+            clone.memory_requirement = self.memory_requirement * _uniform(0.8, 1.2)
+            clone.processing_time = self.processing_time * _uniform(0.9, 1.1)
 
+        clone._precompute_draw_state()
         return clone
 
-    def update(self):
-
+    def update(self, now):
+        """Advance one frame; `now` is the frame's time.time() reading"""
         if self.user_type == UserType.NAUGHTY and self.state == "at_lb":
-            new_users = self._execute_attack_behavior()
+            new_users = self._execute_attack_behavior(now)
             if new_users:
 
                 return new_users
@@ -390,9 +535,9 @@ class User:
                 hasattr(self, "load_balancer_reached_time")
                 and self.load_balancer_reached_time == 0
             ):
-                self.load_balancer_reached_time = time.time()
+                self.load_balancer_reached_time = now
 
-            self.target_server = self.load_balancer.assign_server(
+            self.target_server = self.load_balancer.assign_server_fast(
                 self.cpu_requirement, self.memory_requirement
             )
 
@@ -402,15 +547,15 @@ class User:
                 )
                 if success:
                     self.state = "moving_to_server"
-                    self.processing_start_time = time.time()
+                    self.processing_start_time = now
                 else:
 
-                    self._handle_server_rejection()
+                    self._handle_server_rejection(now)
             else:
 
-                self.waiting_time += 1 / 60
-                if self.waiting_time >= self.max_waiting_time:
-                    self._handle_timeout()
+                self.waiting_frames += 1
+                if self.waiting_frames >= self.max_waiting_frames:
+                    self._handle_timeout(now)
             return True
 
         elif self.state == "moving_to_server":
@@ -433,16 +578,20 @@ class User:
 
                 if hasattr(self.target_server, "remove_connection"):
                     self.target_server.remove_connection()
-                self.completion_time = time.time()
+                self.completion_time = now
                 self.state = "done"
             return True
 
         elif self.state == "retry":
 
-            self.waiting_time += 1 / 60
-            retry_delay = 0.1 if self.user_type == UserType.NAUGHTY else 1.0
-            if self.waiting_time >= retry_delay:
-                self.waiting_time = 0
+            self.waiting_frames += 1
+            retry_delay = (
+                _NAUGHTY_RETRY_FRAMES
+                if self.user_type == UserType.NAUGHTY
+                else _RETRY_FRAMES
+            )
+            if self.waiting_frames >= retry_delay:
+                self.waiting_frames = 0
                 self.state = "at_lb"
             return True
 
@@ -455,7 +604,7 @@ class User:
 
         return True
 
-    def _handle_server_rejection(self):
+    def _handle_server_rejection(self, now):
         """Handle when a server rejects the request"""
         self.retry_count += 1
 
@@ -465,33 +614,46 @@ class User:
         ):
 
             self.state = "retry"
-            self.waiting_time = 0
+            self.waiting_frames = 0
         else:
 
-            self._handle_timeout()
+            self._handle_timeout(now)
 
-    def _handle_timeout(self):
+    def _handle_timeout(self, now):
         """Handle request timeout"""
         if not self.failed:
             self.failed = True
             self.timeout_exit = True
             self.state = "timeout_exit"
-            self.completion_time = time.time()
+            self.completion_time = now
+
+    def get_movement_target(self):
+        """Target position and arrival state while the user is moving, else None"""
+        state = self.state
+        if state == "moving_to_lb":
+            return self.load_balancer.x, self.load_balancer.y, "at_lb"
+        if state == "moving_to_server":
+            return self.target_server.x, self.target_server.y, "processing"
+        if state == "timeout_exit":
+            return self.x, self.screen_height + 50, "done"
+        return None
 
     def _move_to_target(self, target_x, target_y, next_state):
 
         dx = target_x - self.x
         dy = target_y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        distance_sq = dx * dx + dy * dy
+        speed = self.speed
 
-        if distance < self.speed:
+        if distance_sq < speed * speed:
             self.x = target_x
             self.y = target_y
             self.state = next_state
             return True
 
-        self.x += (dx / distance) * self.speed
-        self.y += (dy / distance) * self.speed
+        step = speed / _sqrt(distance_sq)
+        self.x += dx * step
+        self.y += dy * step
         return True
 
     def get_response_time(self):
@@ -527,102 +689,113 @@ class User:
 
         return info
 
-    def draw(self, screen):
-
-        self.pulse_intensity = (self.pulse_intensity + 0.15) % (2 * 3.14159)
-
-        color = self.color
-
-        if self.state == "timeout_exit":
-            color = (255, 100, 100)
-        elif self.state == "processing":
-            if self.user_type == UserType.NAUGHTY:
+    def _precompute_draw_state(self):
+        """Resolve the draw radius and labels, which only change with the request"""
+        size_multiplier = 1.0 + (self.cpu_requirement + self.memory_requirement) / 4
+        radius = int(self.radius * size_multiplier)
+        self._priority_color = _PRIORITY_COLORS[self.priority]
+        self._attack_label = None
 
-                pulse = abs(math.sin(self.pulse_intensity * 2)) * 0.5 + 0.5
-                color = tuple(int(c * pulse) for c in (255, 50, 50))
+        if self.user_type == UserType.NAUGHTY:
+            radius = int(radius * 1.2)
+            if self.stealth_mode:
+                self._type_label = "NAUGHTY"
             else:
+                self._type_label = "ATTACK"
+                self._attack_label = _ATTACK_LABELS.get(self.attack_type, "ATTACK")
+        else:
+            self._type_label = _TYPE_LABELS[self.user_type]
+        self._draw_radius = radius
+
+    @classmethod
+    def _get_font(cls):
+        """Label font shared by every user"""
+        if cls._font is None:
+            cls._font = pygame.font.Font(None, 16)
+        return cls._font
+
+    @classmethod
+    def _render_label(cls, text, color):
+        """Rendered label surface, rasterized once per text and color"""
+        key = (text, color)
+        surface = _LABEL_CACHE.get(key)
+        if surface is None:
+            surface = _LABEL_CACHE[key] = cls._get_font().render(text, True, color)
+        return surface
+
+    def draw(self, screen, text_blits=None):
+        """Draw the user; labels go to `text_blits` for one batched blit if given"""
+        labels = [] if text_blits is None else text_blits
+        pulse_index = self._pulse_index = (self._pulse_index + 1) % _PULSE_STEPS
+
+        state = self.state
+        color = _STATE_COLORS.get(state)
+        if color is None:
+            if state == "processing":
+                if self.user_type == UserType.NAUGHTY:
+
+                    pulse = _PULSE_SIN[pulse_index * 2 % _PULSE_STEPS] * 0.5 + 0.5
+                    color = (int(255 * pulse), int(50 * pulse), int(50 * pulse))
+                else:
 
-                pulse = abs(math.sin(self.pulse_intensity)) * 0.3 + 0.7
-                color = tuple(int(c * pulse) for c in (255, 200, 0))
-        elif self.state == "moving_to_server":
-            color = (0, 255, 150)
-        elif self.state == "at_lb" and self.waiting_time > 0:
+                    pulse = _PULSE_SIN[pulse_index] * 0.3 + 0.7
+                    color = (int(255 * pulse), int(200 * pulse), 0)
+            elif state == "at_lb" and self.waiting_frames > 0:
 
-            intensity = min(1.0, self.waiting_time / self.max_waiting_time)
-            color = (255, int(255 * (1 - intensity)), 0)
-        elif self.state == "retry":
-            color = (255, 255, 0)
+                intensity = min(1.0, self.waiting_frames / self.max_waiting_frames)
+                color = (255, int(255 * (1 - intensity)), 0)
+            else:
+                color = self.color
 
         if self.user_type == UserType.NAUGHTY and not self.stealth_mode:
 
             aura_radius = int(self.radius * 2.5)
-            aura_alpha = int(50 + 30 * abs(math.sin(self.pulse_intensity * 3)))
-
-            aura_surface = pygame.Surface(
-                (aura_radius * 2, aura_radius * 2), pygame.SRCALPHA
-            )
-            aura_color = (*color[:3], aura_alpha)
-            pygame.draw.circle(
-                aura_surface, aura_color, (aura_radius, aura_radius), aura_radius
-            )
+            aura_alpha = int(50 + 30 * _PULSE_SIN[pulse_index * 3 % _PULSE_STEPS])
+
+            # Alpha spans 50..80; dropping the low two bits leaves ~8 levels.
+            key = (aura_radius, color[:3], aura_alpha & ~0x3)
+            aura_surface = _AURA_CACHE.pop(key, None)
+            if aura_surface is None:
+                if len(_AURA_CACHE) >= _AURA_CACHE_SIZE:
+                    del _AURA_CACHE[next(iter(_AURA_CACHE))]
+                aura_surface = pygame.Surface(
+                    (aura_radius * 2, aura_radius * 2), pygame.SRCALPHA
+                )
+                pygame.draw.circle(
+                    aura_surface,
+                    (*key[1], key[2]),
+                    (aura_radius, aura_radius),
+                    aura_radius,
+                )
+            _AURA_CACHE[key] = aura_surface
 
             screen.blit(
                 aura_surface, (int(self.x - aura_radius), int(self.y - aura_radius))
             )
 
-        size_multiplier = 1.0 + (self.cpu_requirement + self.memory_requirement) / 4
-        current_radius = int(self.radius * size_multiplier)
-
-        if self.user_type == UserType.NAUGHTY:
-            current_radius = int(current_radius * 1.2)
+        current_radius = self._draw_radius
 
         pygame.draw.circle(screen, color, (int(self.x), int(self.y)), current_radius)
 
-        priority_colors = {
-            RequestPriority.LOW: (100, 100, 100),
-            RequestPriority.NORMAL: (255, 255, 255),
-            RequestPriority.HIGH: (255, 255, 0),
-            RequestPriority.CRITICAL: (255, 0, 0),
-        }
-        priority_color = priority_colors[self.priority]
         pygame.draw.circle(
             screen,
-            priority_color,
+            self._priority_color,
             (int(self.x), int(self.y)),
             max(2, current_radius // 3),
         )
 
-        type_indicators = {
-            UserType.LIGHT: "L",
-            UserType.STANDARD: "S",
-            UserType.HEAVY: "H",
-            UserType.BURST: "B",
-            UserType.NAUGHTY: "ATTACK" if not self.stealth_mode else "NAUGHTY",
-        }
-
-        font = pygame.font.Font(None, 16)
-        type_text = font.render(type_indicators[self.user_type], True, (255, 255, 255))
+        type_text = User._render_label(self._type_label, (255, 255, 255))
         type_rect = type_text.get_rect(center=(int(self.x), int(self.y)))
-        screen.blit(type_text, type_rect)
+        labels.append((type_text, type_rect))
 
-        if self.user_type == UserType.NAUGHTY and not self.stealth_mode:
-            attack_indicators = {
-                AttackType.DOS: "DOS",
-                AttackType.RESOURCE_EXHAUSTION: "RES_EXHAUST",
-                AttackType.SLOWLORIS: "SLOWLORIS",
-                AttackType.AMPLIFICATION: "AMPLIFICATION",
-                AttackType.PRIORITY_ABUSE: "PRIORITY_ABUSE",
-            }
-
-            attack_text = font.render(
-                attack_indicators.get(self.attack_type, "ATTACK"), True, (255, 255, 0)
-            )
+        if self._attack_label is not None:
+            attack_text = User._render_label(self._attack_label, (255, 255, 0))
             attack_rect = attack_text.get_rect(
                 center=(int(self.x), int(self.y + current_radius + 10))
             )
-            screen.blit(attack_text, attack_rect)
+            labels.append((attack_text, attack_rect))
 
-        if self.state == "timeout_exit":
+        if state == "timeout_exit":
 
             pygame.draw.line(
                 screen,
@@ -646,9 +819,9 @@ class User:
                 2,
             )
 
-        elif self.state == "at_lb" and self.waiting_time > 0:
+        elif state == "at_lb" and self.waiting_frames > 0:
 
-            angle = (self.waiting_time / self.max_waiting_time) * 2 * 3.14159
+            angle = (self.waiting_frames / self.max_waiting_frames) * 2 * 3.14159
             end_x = self.x + (current_radius + 5) * math.cos(angle - 3.14159 / 2)
             end_y = self.y + (current_radius + 5) * math.sin(angle - 3.14159 / 2)
             pygame.draw.line(
@@ -661,22 +834,25 @@ class User:
 
         elif self.retry_count > 0:
 
-            retry_text = font.render(f"R{self.retry_count}", True, (255, 255, 0))
+            retry_text = User._render_label(f"R{self.retry_count}", (255, 255, 0))
             retry_rect = retry_text.get_rect(
                 center=(int(self.x), int(self.y + current_radius + 8))
             )
-            screen.blit(retry_text, retry_rect)
+            labels.append((retry_text, retry_rect))
 
         if (
             self.user_type == UserType.NAUGHTY
             and self.attack_type == AttackType.AMPLIFICATION
             and self.spawn_count > 0
         ):
-            spawn_text = font.render(f"x{self.spawn_count}", True, (255, 150, 0))
+            spawn_text = User._render_label(f"x{self.spawn_count}", (255, 150, 0))
             spawn_rect = spawn_text.get_rect(
                 center=(int(self.x + current_radius + 15), int(self.y))
             )
-            screen.blit(spawn_text, spawn_rect)
+            labels.append((spawn_text, spawn_rect))
+
+        if text_blits is None:
+            screen.blits(labels, doreturn=False)
 
     def reset_for_new_simulation(self):
         """Reset user state for a new simulation"""
@@ -685,20 +861,23 @@ class User:
         self.failed = False
         self.timeout_exit = False
         self.arrival_time = time.time()
-        self.waiting_time = 0
+        self.waiting_frames = 0
         self.processing_elapsed = 0
         self.load_balancer_reached_time = 0
         self.completion_time = 0
         self.retry_count = 0
         self.is_attacking = False
+        self._attack_frame = 0
+        self._spawn_frames = []
         self.spawn_count = 0
 
         self.user_type = self._generate_user_type()
+        self.user_type_id = USER_TYPE_IDS[self.user_type]
         if self.user_type == UserType.NAUGHTY:
             self.attack_type = self._generate_attack_type()
-            self.attack_intensity = random.uniform(0.5, 3.0)
+            self.attack_intensity = _uniform(0.5, 3.0)
             self.max_spawn_count = random.randint(1, 3)
-            self.attack_duration = random.uniform(5.0, 15.0)
+            self.attack_duration = _uniform(5.0, 15.0)
             self.stealth_mode = random.choice([True, False])
         else:
             self.attack_type = None
@@ -708,11 +887,17 @@ class User:
             self.stealth_mode = False
 
         self._set_user_characteristics()
+        self._precompute_draw_state()
 
     def save_to_report(self, report_file):
-        """Save user data to the report file"""
+        """Save user data to the report file; use UserReportWriter for many users"""
+        with open(report_file, "a") as f:
+            f.write(self._report_line())
+
+    def _report_line(self):
+        """One CSV line describing this user's request"""
         response_time = self.get_response_time()
-        report_line = (
+        return (
             f"{self.request_id},{self.user_type.value},{self.priority.value},"
             f"{self.cpu_requirement:.2f},{self.memory_requirement:.2f},"
             f"{self.processing_time:.2f},{self.arrival_time:.2f},"
@@ -720,5 +905,24 @@ class User:
             f"{self.retry_count},{int(self.failed)}\n"
         )
 
-        with open(report_file, "a") as f:
-            f.write(report_line)
+
+class UserReportWriter:
+    """Appends per-user report lines through one buffered file handle"""
+
+    BUFFER_SIZE = 1 << 20
+
+    def __init__(self, report_file):
+        self._file = open(report_file, "a", buffering=self.BUFFER_SIZE)
+
+    def write_user(self, user):
+        self._file.write(user._report_line())
+
+    def close(self):
+        """Flush buffered lines and release the file"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()